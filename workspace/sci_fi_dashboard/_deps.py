@@ -27,6 +27,7 @@ from sci_fi_dashboard.dual_cognition import (  # noqa: E402
     DualCognitionEngine,
 )
 from sci_fi_dashboard.emotional_trajectory import EmotionalTrajectory  # noqa: E402
+from sci_fi_dashboard.graph_compaction import GraphCompactor  # noqa: E402
 from sci_fi_dashboard.memory_engine import MemoryEngine  # noqa: E402
 from sci_fi_dashboard.multiuser.conversation_cache import ConversationCache  # noqa: E402
 from sci_fi_dashboard.sbs.orchestrator import SBSOrchestrator  # noqa: E402
@@ -104,6 +105,7 @@ tool_registry: "ToolRegistry | None" = None  # initialized in lifespan if availa
 hook_runner: "ToolHookRunner | None" = None
 audit_logger: "ToolAuditLogger | None" = None
 brain = SQLiteGraph()
+graph_compactor = GraphCompactor(brain)
 gate = EntityGate(graph_store=brain, entities_file="entities.json")
 conflicts = ConflictManager(conflicts_file="conflicts.json")
 toxic_scorer = LazyToxicScorer(idle_timeout=30.0)
@@ -127,9 +129,9 @@ from gateway.dedup import MessageDeduplicator  # noqa: E402
 from gateway.flood import FloodGate  # noqa: E402
 from gateway.queue import TaskQueue  # noqa: E402
 
-task_queue = TaskQueue(max_size=100)
-dedup = MessageDeduplicator(window_seconds=300)
-flood = FloodGate(batch_window_seconds=3.0)
+task_queue = TaskQueue()  # sized / prioritised by synapse.json → gateway.queue
+dedup = MessageDeduplicator(window_seconds=300, max_entries=50_000)
+flood = FloodGate(batch_window_seconds=3.0, max_batch=20, max_hold_seconds=15.0)
 
 # Channel registry — all adapters register here; lifespan calls start_all()
 channel_registry = ChannelRegistry()
@@ -240,6 +242,15 @@ from sci_fi_dashboard.llm_router import SynapseLLMRouter  # noqa: E402
 _synapse_cfg = SynapseConfig.load()
 synapse_llm_router = SynapseLLMRouter(_synapse_cfg)
 
+from sci_fi_dashboard.kg_scheduler import KGExtractionScheduler  # noqa: E402
+
+kg_scheduler = KGExtractionScheduler(
+    llm_router=synapse_llm_router,
+    graph=brain,
+    memory_db_path=str(_synapse_cfg.db_dir / "memory.db"),
+    entities_json_path=str(Path(__file__).parent / "entities.json"),
+)
+
 # Module-level proactive engine reference — set in lifespan after engine starts
 _proactive_engine = None
 
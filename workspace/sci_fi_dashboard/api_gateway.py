@@ -102,15 +102,28 @@ async def lifespan(app: FastAPI):
         app.state.retry_queue = _retry_queue
         print("[INFO] WhatsApp retry queue started.")
 
+    from gateway.autoscaler import WorkerAutoscaler, workers_config
+    from gateway.session_actor import SessionActorQueue
     from gateway.worker import MessageWorker
 
+    # Per-session actors: one chat runs serially, sessions share the worker slots
+    _workers_cfg = workers_config()
+    app.state.session_actor_queue = SessionActorQueue()
     app.state.worker = MessageWorker(
         queue=deps.task_queue,
         channel_registry=deps.channel_registry,
         process_fn=process_message_pipeline,
-        num_workers=2,
+        num_workers=int(_workers_cfg["initial"]),
+        actors=app.state.session_actor_queue,
     )
     await app.state.worker.start()
+    if _workers_cfg["enabled"]:
+        app.state.worker_autoscaler = WorkerAutoscaler(
+            app.state.worker,
+            llm_in_flight=lambda: deps.synapse_llm_router.in_flight,
+            config=_workers_cfg,
+        )
+        await app.state.worker_autoscaler.start()
     print("[INFO] Async Gateway Pipeline started.")
 
     # Phase 3: Initialize ToolRegistry
@@ -161,11 +174,6 @@ async def lifespan(app: FastAPI):
     else:
         deps._tool_logger.info("tool_safety module not available -- safety pipeline disabled")
 
-    # Initialize SessionActorQueue
-    from gateway.session_actor import SessionActorQueue
-
-    app.state.session_actor_queue = SessionActorQueue()
-
     # Initialize AgentRegistry + SubAgentRunner (Phase 3: SubAgent System)
     from sci_fi_dashboard.subagent import AgentRegistry
     from sci_fi_dashboard.subagent.runner import SubAgentRunner
@@ -341,6 +349,9 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "retry_queue"):
         await app.state.retry_queue.stop()
     await deps.channel_registry.stop_all()
+    await deps.flood.stop()
+    if hasattr(app.state, "worker_autoscaler"):
+        await app.state.worker_autoscaler.stop()
     if hasattr(app.state, "worker"):
         await app.state.worker.stop()
     with suppress(asyncio.CancelledError):
@@ -11,8 +11,10 @@ from fastapi import BackgroundTasks
 
 from sci_fi_dashboard import _deps as deps
 from sci_fi_dashboard.dual_cognition import CognitiveMerge
+from sci_fi_dashboard.embedding import MessageEmbeddingContext
 from sci_fi_dashboard.llm_router import LLMResult
 from sci_fi_dashboard.pipeline_emitter import get_emitter as _get_emitter
+from sci_fi_dashboard.profile_facts import get_profile_facts
 from sci_fi_dashboard.schemas import ChatRequest
 
 logger = logging.getLogger(__name__)
@@ -227,6 +229,9 @@ async def persona_chat(
 
     # 1. Memory Retrieval (Phoenix v3 Unified Engine)
     mem_response = None
+    # One query embedding per message -- shared by retrieval, dual cognition,
+    # skill routing and the query_memory tool.
+    embedding_context = MessageEmbeddingContext()
     try:
         env_session = os.environ.get("SESSION_TYPE", "safe")
         session_mode = request.session_type or env_session
@@ -235,24 +240,9 @@ async def persona_chat(
 
         # Layer 1: Always inject permanent profile docs (relationship_memories + distillations).
         # These 10-15 docs are the core knowledge about the user — always relevant, ~500 tokens.
-        # They live in memory.db but are tiny enough to include every time.
-        _permanent_facts = []
-        try:
-            from sci_fi_dashboard.db import get_db_connection as _get_db
-
-            _db = _get_db()
-            # Relationship memories first (core knowledge, compact)
-            _rel = _db.execute(
-                "SELECT content FROM documents WHERE filename='relationship_memory' ORDER BY id ASC"
-            ).fetchall()
-            # Latest distillation only (avoid token bloat)
-            _dist = _db.execute(
-                "SELECT content FROM documents WHERE filename='memory_distillation' ORDER BY id DESC LIMIT 1"
-            ).fetchall()
-            _db.close()
-            _permanent_facts = [r[0] for r in _rel if r[0]] + [r[0] for r in _dist if r[0]]
-        except Exception:
-            pass
+        # Served from an in-memory snapshot invalidated on write (profile_facts.py).
+        _profile = get_profile_facts()
+        _permanent_facts = _profile.facts
 
         # Layer 2: Vector search for conversation-specific context (WhatsApp chunks etc.)
         # seed_entities: real-world names for the persona so first-person queries
@@ -260,8 +250,15 @@ async def persona_chat(
         # Configure via synapse.json → session → selfEntityNames → <target>
         _self_names = deps._synapse_cfg.session.get("selfEntityNames", {})
         _seed = _self_names.get(target, []) if isinstance(_self_names, dict) else []
-        mem_response = deps.memory_engine.query(
-            user_msg, limit=5, with_graph=True, seed_entities=_seed or None
+        # graph_entities: dual cognition's relationship node, fetched in the same
+        # graph query so _recall_memory doesn't need a second round trip
+        mem_response = await deps.memory_engine.aquery(
+            user_msg,
+            limit=5,
+            with_graph=True,
+            seed_entities=_seed or None,
+            embedding_context=embedding_context,
+            graph_entities=[deps.dual_cognition.relationship_entity(target)],
         )
         with contextlib.suppress(Exception):
             _get_emitter().emit(
@@ -276,7 +273,7 @@ async def persona_chat(
         # Format results for the prompt — permanent profile first, then dynamic context
         results_list = mem_response.get("results", [])
         dynamic_facts = "\n".join([f"* {r['content']}" for r in results_list])
-        profile_block = "\n".join([f"* {f}" for f in _permanent_facts])
+        profile_block = _profile.block
         graph_ctx = mem_response.get("graph_context", "")
 
         memory_context = (
@@ -321,6 +318,7 @@ async def persona_chat(
                     target=target,
                     llm_fn=call_ag_oracle,
                     pre_cached_memory=mem_response,
+                    embedding_context=embedding_context,
                 ),
                 timeout=dc_timeout,
             )
@@ -454,7 +452,7 @@ async def persona_chat(
     # Small models (Gemma4:e4b) have strong recency bias — context far from
     # the user message gets ignored. Placing this last ensures it's read.
     if _permanent_facts:
-        _profile_lines = "\n".join([f"- {f}" for f in _permanent_facts])
+        _profile_lines = _profile.lines
         messages.append(
             {
                 "role": "system",
@@ -474,7 +472,7 @@ async def persona_chat(
     # Skills handle the message entirely — skip MoA pipeline if matched.
     # Skills are NEVER triggered in spicy hemisphere (T-01-14 privacy boundary).
     if deps._SKILL_SYSTEM_AVAILABLE and deps.skill_router is not None and session_mode != "spicy":
-        matched_skill = deps.skill_router.match(user_msg)
+        matched_skill = deps.skill_router.match(user_msg, embedding_context=embedding_context)
         if matched_skill is not None:
             logger.info("[Skills] Message routed to skill '%s'", matched_skill.name)
             from sci_fi_dashboard.skills.runner import SkillRunner
@@ -523,6 +521,7 @@ async def persona_chat(
             workspace_dir=str(deps.WORKSPACE_ROOT),
             config=deps._synapse_cfg.session,
             channel_id="api",
+            embedding_context=embedding_context,
         )
         session_tools = deps.tool_registry.resolve(tool_context)
 
@@ -552,7 +551,7 @@ async def persona_chat(
         and getattr(deps, "skill_router", None) is not None
         and session_mode != "spicy"
     ):
-        matched_skill = deps.skill_router.match(user_msg)
+        matched_skill = deps.skill_router.match(user_msg, embedding_context=embedding_context)
         if matched_skill is not None:
             logger.info("[Skills] Message routed to skill '%s'", matched_skill.name)
             from sci_fi_dashboard.skills.runner import SkillRunner
@@ -24,8 +24,12 @@ import os
 import re
 import sqlite3
 import string
+import time
+import weakref
+from collections.abc import Iterable
 from pathlib import Path
 
+from sci_fi_dashboard.db import _ensure_entity_links
 from sci_fi_dashboard.llm_router import SynapseLLMRouter
 from sci_fi_dashboard.sqlite_graph import SQLiteGraph
 
@@ -220,6 +224,12 @@ _JSON_FORMAT_PROVIDERS: set[str] = {
 }
 
 
+def _provider_of(model_string: str) -> str:
+    """Provider prefix of a litellm model string ("ollama_chat" -> "ollama")."""
+    provider = model_string.split("/", 1)[0] if "/" in model_string else ""
+    return "ollama" if provider == "ollama_chat" else provider
+
+
 def _get_safe_call_kwargs(model_string: str) -> dict:
     """Build extra kwargs for the LLM call based on provider capabilities.
 
@@ -235,11 +245,7 @@ def _get_safe_call_kwargs(model_string: str) -> dict:
     """
     if not model_string:
         return {}
-    provider = model_string.split("/", 1)[0] if "/" in model_string else ""
-    # Normalize ollama_chat -> ollama for prefix matching.
-    if provider == "ollama_chat":
-        provider = "ollama"
-    if provider in _JSON_FORMAT_PROVIDERS:
+    if _provider_of(model_string) in _JSON_FORMAT_PROVIDERS:
         return {"response_format": {"type": "json_object"}}
     return {}
 
@@ -264,6 +270,70 @@ _SINGLE_VALUED_RELATIONS: set[str] = {
 
 
 _CHUNK_SIZE = 1500  # chars
+_DEFAULT_CHUNK_CONCURRENCY = 4
+_DEFAULT_LLM_CONCURRENCY = 4
+
+# ---------------------------------------------------------------------------
+# Per-provider request budget — shared by all extractions in the process so
+# parallel chunks (and parallel personas) can't burst past a provider's RPM.
+# ---------------------------------------------------------------------------
+
+
+class _RateBudget:
+    """Token bucket refilled at *rpm* / 60 per second.
+
+    The bucket holds up to 15 s of budget so a batch can start several chunks
+    at once.  Callers reserve a token up front (the balance may go negative)
+    and sleep until their reservation matures, so waiters are served in order
+    without a lock.
+    """
+
+    def __init__(self, rpm: float) -> None:
+        self.rate = max(float(rpm), 1e-3) / 60.0
+        self.capacity = max(1.0, self.rate * 15)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token; return the seconds to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        self._tokens -= 1.0
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_rate_budgets: dict[tuple[str, float], _RateBudget] = {}
+
+# Process-wide cap on in-flight KG LLM calls (kg_extraction.llm_concurrency),
+# shared by every persona and every chunk.  One semaphore per event loop.
+_llm_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_llm_slots(limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _llm_slots.get(loop)
+    if sem is None:
+        sem = _llm_slots[loop] = asyncio.Semaphore(max(1, int(limit)))
+    return sem
+
+
+def _get_rate_budget(provider: str, rpm: float | None) -> _RateBudget | None:
+    """Process-wide budget for *provider*, or None when it has no RPM limit."""
+    if not provider or not rpm:
+        return None
+    key = (provider, float(rpm))
+    if key not in _rate_budgets:
+        _rate_budgets[key] = _RateBudget(rpm)
+    return _rate_budgets[key]
+
 
 # ---------------------------------------------------------------------------
 # Per-persona concurrency guard — prevents overlapping extraction runs
@@ -403,54 +473,59 @@ def _normalize_result(result: dict) -> dict:
 
 # ---------------------------------------------------------------------------
 # entity_links helpers — lifted from scripts/fact_extractor.py
+# (schema + indexes: db._ensure_entity_links)
 # ---------------------------------------------------------------------------
 
 
-def _ensure_entity_links(conn: sqlite3.Connection) -> None:
-    """Idempotent: create entity_links + archived + confidence columns."""
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS entity_links (
-            id        INTEGER PRIMARY KEY AUTOINCREMENT,
-            subject   TEXT NOT NULL,
-            relation  TEXT NOT NULL,
-            object    TEXT NOT NULL,
-            archived  INTEGER DEFAULT 0,
-            source_fact_id INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    # Add missing columns for older schemas (idempotent via PRAGMA check).
-    cursor = conn.execute("PRAGMA table_info(entity_links)")
-    cols = {row[1] for row in cursor.fetchall()}
-    if "archived" not in cols:
-        conn.execute("ALTER TABLE entity_links ADD COLUMN archived INTEGER DEFAULT 0")
-    if "confidence" not in cols:
-        conn.execute("ALTER TABLE entity_links ADD COLUMN confidence REAL DEFAULT 1.0")
-    conn.commit()
-
-
-def _write_triple_to_entity_links(
+def _write_triples_to_entity_links(
     conn: sqlite3.Connection,
-    subj: str,
-    rel: str,
-    obj: str,
-    fact_id: int,
-    confidence: float = 1.0,
-) -> None:
-    """Archival-write: for single-valued relations, mark old (subj, rel) as
-    archived before inserting the new row.  Multi-valued relations (likes,
-    knows, etc.) are appended without archiving prior values."""
-    if rel in _SINGLE_VALUED_RELATIONS:
-        conn.execute(
+    triples: Iterable[tuple],
+    fact_id: int = 0,
+) -> int:
+    """Archival batch write of ``(subj, rel, obj[, confidence])`` triples.
+
+    For single-valued relations the currently active (subj, rel) rows are
+    archived and, within the batch, only the last triple per (subj, rel)
+    stays active -- the same end state as writing the triples one by one.
+    Multi-valued relations (likes, knows, etc.) are appended without
+    archiving prior values.  Two executemany() calls; the caller commits.
+    Returns the number of rows inserted.
+    """
+    rows = [
+        (str(t[0]), str(t[1]), str(t[2]), t[3] if len(t) > 3 else 1.0)
+        for t in triples
+        if len(t) >= 3
+    ]
+    latest: dict[tuple[str, str], int] = {}
+    for i, (subj, rel, _, _) in enumerate(rows):
+        if rel in _SINGLE_VALUED_RELATIONS:
+            latest[(subj, rel)] = i
+    if latest:
+        conn.executemany(
             "UPDATE entity_links SET archived = 1"
             " WHERE subject = ? AND relation = ? AND archived = 0",
-            (subj, rel),
+            list(latest),
         )
-    conn.execute(
-        "INSERT INTO entity_links (subject, relation, object, archived, source_fact_id, confidence)"
-        " VALUES (?, ?, ?, 0, ?, ?)",
-        (subj, rel, obj, fact_id, confidence),
+    conn.executemany(
+        "INSERT INTO entity_links"
+        " (subject, relation, object, archived, source_fact_id, confidence,"
+        "  subject_norm, object_norm)"
+        " VALUES (?, ?, ?, ?, ?, ?, LOWER(?), LOWER(?))",
+        [
+            (
+                subj,
+                rel,
+                obj,
+                int(latest.get((subj, rel), i) != i),  # superseded later in this batch
+                fact_id,
+                confidence,
+                subj,
+                obj,
+            )
+            for i, (subj, rel, obj, confidence) in enumerate(rows)
+        ],
     )
+    return len(rows)
 
 
 def _update_entities_json(entities_json_path: str, new_entities: set[str]) -> None:
@@ -471,12 +546,14 @@ def _update_entities_json(entities_json_path: str, new_entities: set[str]) -> No
         if normalized:
             current[normalized] = 1
 
+    added = len(current) - before
+    if not added:
+        # Leave the mtime alone -- EntityGate re-reads the file whenever it changes
+        return
+
     with open(entities_json_path, "w", encoding="utf-8") as f:
         json.dump(current, f, ensure_ascii=False, indent=2)
-
-    added = len(current) - before
-    if added:
-        logger.info("[KG] entities.json updated (+%d new entities, %d total)", added, len(current))
+    logger.info("[KG] entities.json updated (+%d new entities, %d total)", added, len(current))
 
 
 # ---------------------------------------------------------------------------
@@ -498,6 +575,9 @@ def _write_triple_to_graph(
     the old edge is removed and replaced.  For multi-valued relations
     (likes, knows, etc.), the new edge is appended as usual.
 
+    Writes a single triple; batch callers should use graph.bulk_upsert()
+    with ``single_valued=_SINGLE_VALUED_RELATIONS`` directly.
+
     Args:
         graph:  The SQLiteGraph instance.
         subj:   Normalized subject entity.
@@ -505,47 +585,12 @@ def _write_triple_to_graph(
         obj:    Normalized object entity.
         weight: Confidence weight for the edge.
     """
-    import time as _time  # noqa: PLC0415
-
-    if rel in _SINGLE_VALUED_RELATIONS:
-        conn = graph._conn()
-        existing = conn.execute(
-            "SELECT target FROM edges WHERE source = ? AND relation = ?",
-            (subj, rel),
-        ).fetchone()
-        if existing and existing["target"] != obj:
-            old_obj = existing["target"]
-            logger.info(
-                "[KG] Contradiction: updating '%s %s' from '%s' to '%s'",
-                subj,
-                rel,
-                old_obj,
-                obj,
-            )
-            # Atomic DELETE + INSERT in one transaction on the same connection.
-            # Bypasses add_edge to guarantee both ops share a single commit.
-            now = _time.time()
-            conn.execute(
-                "DELETE FROM edges WHERE source = ? AND relation = ?",
-                (subj, rel),
-            )
-            for node in (subj, obj):
-                conn.execute(
-                    "INSERT OR IGNORE INTO nodes (name, created_at, updated_at)"
-                    " VALUES (?, ?, ?)",
-                    (node, now, now),
-                )
-            conn.execute(
-                "INSERT INTO edges (source, target, relation, weight, evidence, created_at)"
-                " VALUES (?, ?, ?, ?, ?, ?)"
-                " ON CONFLICT(source, target, relation) DO UPDATE SET"
-                "   weight = ?, evidence = evidence || ' | ' || ?",
-                (subj, obj, rel, weight, "conv_kg", now, weight, "conv_kg"),
-            )
-            conn.commit()
-            return
-    # Non-contradictory or multi-valued: standard add_edge (UPSERT).
-    graph.add_edge(subj, obj, relation=rel, weight=weight, evidence="conv_kg")
+    result = graph.bulk_upsert(
+        edges=[(subj, obj, rel, weight, "conv_kg")],
+        single_valued=_SINGLE_VALUED_RELATIONS,
+    )
+    if result["replaced"]:
+        logger.info("[KG] Contradiction: updated '%s %s' to '%s'", subj, rel, obj)
 
 
 # ---------------------------------------------------------------------------
@@ -554,7 +599,7 @@ def _write_triple_to_graph(
 
 
 def _get_last_kg_timestamp(sbs_data_dir: str) -> str:
-    """Read the last KG extraction timestamp from kg_state.json.
+    """Read the legacy KG extraction timestamp from kg_state.json.
 
     Returns ISO timestamp string, or '2000-01-01T00:00:00' if the file
     is missing or corrupt.
@@ -570,18 +615,93 @@ def _get_last_kg_timestamp(sbs_data_dir: str) -> str:
     return "2000-01-01T00:00:00"
 
 
-def _set_last_kg_timestamp(sbs_data_dir: str, ts: str) -> None:
-    """Write the last KG extraction timestamp to kg_state.json."""
-    state_dir = Path(sbs_data_dir)
-    os.makedirs(str(state_dir), exist_ok=True)
-    state_file = state_dir / "kg_state.json"
-    with open(state_file, "w", encoding="utf-8") as f:
-        json.dump({"kg_last_extracted_at": ts}, f)
+# The watermark lives in messages.db itself (kg_watermark table) so it is
+# updated atomically next to the data it points into.  It is a keyset cursor
+# (timestamp, msg_id): messages sharing a timestamp across a page boundary
+# are neither skipped nor re-read.  kg_state.json is only read once, to seed
+# the cursor for personas extracted before the table existed (msg_id None =
+# "strictly after this timestamp", the legacy semantics).
+
+_PENDING_WHERE = "(timestamp > ? OR (timestamp = ? AND ? IS NOT NULL AND msg_id > ?))"
 
 
-async def fetch_messages_since(db_path: str, since_iso: str, limit: int = 200) -> list[dict]:
-    """Fetch conversation messages newer than *since_iso* from messages.db.
+def _ensure_kg_watermark(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS kg_watermark (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            last_ts TEXT NOT NULL,
+            last_msg_id TEXT,
+            updated_at REAL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_kg_cursor ON messages(timestamp, msg_id)")
 
+
+def _messages_db_path(sbs_data_dir: str) -> str:
+    return str(Path(sbs_data_dir) / "indices" / "messages.db")
+
+
+def _get_kg_watermark(sbs_data_dir: str) -> tuple[str, str | None]:
+    """Return the (timestamp, msg_id) cursor of the last extracted message."""
+    db_path = _messages_db_path(sbs_data_dir)
+    if os.path.exists(db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            row = conn.execute(
+                "SELECT last_ts, last_msg_id FROM kg_watermark WHERE id = 1"
+            ).fetchone()
+            if row:
+                return row[0], row[1]
+        except sqlite3.OperationalError:
+            pass  # table not created yet -- fall back to the legacy file
+        finally:
+            conn.close()
+    return _get_last_kg_timestamp(sbs_data_dir), None
+
+
+def _set_kg_watermark(sbs_data_dir: str, ts: str, msg_id: str | None) -> None:
+    """Advance the cursor to (ts, msg_id) in one transaction."""
+    conn = sqlite3.connect(_messages_db_path(sbs_data_dir))
+    try:
+        _ensure_kg_watermark(conn)
+        conn.execute(
+            "INSERT INTO kg_watermark (id, last_ts, last_msg_id, updated_at)"
+            " VALUES (1, ?, ?, ?)"
+            " ON CONFLICT(id) DO UPDATE SET"
+            "   last_ts = excluded.last_ts,"
+            "   last_msg_id = excluded.last_msg_id,"
+            "   updated_at = excluded.updated_at",
+            (ts, msg_id, time.time()),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def count_pending_messages(sbs_data_dir: str) -> int:
+    """Number of messages past the watermark (the persona's extraction backlog)."""
+    db_path = _messages_db_path(sbs_data_dir)
+    if not os.path.exists(db_path):
+        return 0
+    ts, msg_id = _get_kg_watermark(sbs_data_dir)
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            f"SELECT COUNT(*) FROM messages WHERE {_PENDING_WHERE}",
+            (ts, ts, msg_id, msg_id),
+        ).fetchone()[0]
+    except sqlite3.OperationalError:  # messages table not created yet
+        return 0
+    finally:
+        conn.close()
+
+
+async def fetch_messages_since(
+    db_path: str, since_iso: str, limit: int = 200, since_msg_id: str | None = None
+) -> list[dict]:
+    """Fetch conversation messages after the (*since_iso*, *since_msg_id*) cursor.
+
+    With ``since_msg_id=None`` this is every message newer than *since_iso*.
     Uses asyncio.to_thread with a thread-local connection (justified: read
     query may scan many rows).  The connection is opened and closed within
     the callable — no shared-connection issue.
@@ -594,10 +714,10 @@ async def fetch_messages_since(db_path: str, since_iso: str, limit: int = 200) -
             rows = conn.execute(
                 "SELECT msg_id, timestamp, role, content"
                 " FROM messages"
-                " WHERE timestamp > ?"
-                " ORDER BY timestamp ASC"
+                f" WHERE {_PENDING_WHERE}"
+                " ORDER BY timestamp ASC, msg_id ASC"
                 " LIMIT ?",
-                (since_iso, limit),
+                (since_iso, since_iso, since_msg_id, since_msg_id, limit),
             ).fetchall()
             return [dict(r) for r in rows]
         finally:
@@ -614,13 +734,21 @@ async def fetch_messages_since(db_path: str, since_iso: str, limit: int = 200) -
 class ConvKGExtractor:
     """Async KG extractor that calls the configured LLM via SynapseLLMRouter.
 
-    No torch/transformers dependency.  Processes text in chunks sequentially.
+    No torch/transformers dependency.  Chunks are extracted concurrently
+    (``kg_extraction.chunk_concurrency`` calls in flight, further throttled by
+    ``kg_extraction.provider_rpm``) and merged in chunk order, so the result
+    does not depend on which call finishes first.
 
     Supports a dedicated ``"kg"`` role in model_mappings with automatic
     fallback to ``"casual"`` when ``"kg"`` is not configured.
     """
 
-    def __init__(self, llm_router: SynapseLLMRouter, role: str = "kg") -> None:
+    def __init__(
+        self,
+        llm_router: SynapseLLMRouter,
+        role: str = "kg",
+        max_concurrency: int | None = None,
+    ) -> None:
         self._router = llm_router
         # Role resolution: try the requested role, fall back to "casual".
         if role not in llm_router._config.model_mappings:
@@ -636,6 +764,37 @@ class ConvKGExtractor:
         model_str = llm_router._config.model_mappings.get(role, {}).get("model", "")
         self._extra_kwargs = _get_safe_call_kwargs(model_str)
 
+        kg_cfg = getattr(llm_router._config, "kg_extraction", None)
+        if max_concurrency is None:
+            max_concurrency = getattr(kg_cfg, "chunk_concurrency", _DEFAULT_CHUNK_CONCURRENCY)
+        self._max_concurrency = max(1, int(max_concurrency))
+        provider = _provider_of(model_str)
+        rpm = (getattr(kg_cfg, "provider_rpm", None) or {}).get(provider)
+        self._rate_budget = _get_rate_budget(provider, rpm)
+        self._llm_concurrency = getattr(kg_cfg, "llm_concurrency", _DEFAULT_LLM_CONCURRENCY)
+
+    async def _extract_chunk(self, chunk: str, sem: asyncio.Semaphore) -> tuple[dict | None, float]:
+        """One LLM call. Returns (normalized result or None on failure, latency in s)."""
+        async with sem, _get_llm_slots(self._llm_concurrency):
+            if self._rate_budget is not None:
+                await self._rate_budget.acquire()
+            start = time.perf_counter()
+            try:
+                prompt = _EXTRACTION_PROMPT.format(content=chunk)
+                messages = [{"role": "user", "content": prompt}]
+                raw_text = await self._router.call(
+                    self._role,
+                    messages,
+                    temperature=0.3,
+                    max_tokens=1500,
+                    **self._extra_kwargs,
+                )
+                result = _normalize_result(_parse_llm_output(raw_text))
+            except Exception as e:
+                logger.warning("[KG] Chunk extraction failed (%s): %s", type(e).__name__, e)
+                result = None
+            return result, time.perf_counter() - start
+
     async def extract(self, text: str) -> dict:
         """Extract facts and triples from *text*.
 
@@ -649,43 +808,42 @@ class ConvKGExtractor:
                 "facts": [{"entity": str, "content": str, "category": str}, ...],
                 "triples": [["subject", "relation", "object"], ...],
                 "validated_triples": [([subj, rel, obj], confidence), ...],
+                "chunk_latencies": [seconds per chunk, in chunk order],
+                "failed_chunks": int,
             }
         """
         if not text or not text.strip():
-            return {"facts": [], "triples": [], "validated_triples": []}
+            return {
+                "facts": [],
+                "triples": [],
+                "validated_triples": [],
+                "chunk_latencies": [],
+                "failed_chunks": 0,
+            }
 
         chunks = _chunk_text(text)
+        sem = asyncio.Semaphore(self._max_concurrency)
+        outcomes = await asyncio.gather(*(self._extract_chunk(c, sem) for c in chunks))
+
         merged_facts: list[dict] = []
         merged_triples: list[list[str]] = []
         seen_facts: set[str] = set()
         seen_triples: set[tuple] = set()
 
-        for chunk in chunks:
-            try:
-                prompt = _EXTRACTION_PROMPT.format(content=chunk)
-                messages = [{"role": "user", "content": prompt}]
-                raw_text = await self._router.call(
-                    self._role,
-                    messages,
-                    temperature=0.3,
-                    max_tokens=1500,
-                    **self._extra_kwargs,
-                )
-                result = _normalize_result(_parse_llm_output(raw_text))
-
-                for f in result["facts"]:
-                    if f["content"] not in seen_facts:
-                        seen_facts.add(f["content"])
-                        merged_facts.append(f)
-
-                for t in result["triples"]:
-                    key = tuple(t)
-                    if key not in seen_triples:
-                        seen_triples.add(key)
-                        merged_triples.append(t)
-
-            except Exception as e:
-                logger.warning("[KG] Chunk extraction failed (%s): %s", type(e).__name__, e)
+        # Merge in chunk order -- first occurrence wins, as in a sequential pass
+        for result, _ in outcomes:
+            if result is None:
+                continue
+            for f in result["facts"]:
+                if f["content"] not in seen_facts:
+                    seen_facts.add(f["content"])
+                    merged_facts.append(f)
+
+            for t in result["triples"]:
+                key = tuple(t)
+                if key not in seen_triples:
+                    seen_triples.add(key)
+                    merged_triples.append(t)
 
         # Validate all merged triples against the FULL source text.
         validated = _validate_triples(merged_triples, text)
@@ -700,6 +858,8 @@ class ConvKGExtractor:
             "facts": merged_facts,
             "triples": merged_triples,
             "validated_triples": validated,
+            "chunk_latencies": [round(latency, 3) for _, latency in outcomes],
+            "failed_chunks": sum(1 for result, _ in outcomes if result is None),
         }
 
 
@@ -732,8 +892,14 @@ async def run_batch_extraction(
       - Contradiction detection for single-valued relations in SQLiteGraph.
       - Entity normalization before all writes.
 
+    Processes at most *max_messages* (one page) per call; the scheduler in
+    kg_scheduler.py calls it repeatedly to drain a backlog.
+
     Returns:
-        {"extracted": int, "facts": int, "rejected": int} on success.
+        {"extracted": int, "facts": int, "rejected": int, "messages": int}
+        on success ("messages" = page size actually read), plus
+        chunk timing: "chunks", "chunk_latencies" (s, chunk order),
+        "failed_chunks" and "extract_s" (wall time for all chunks).
         {"skipped": True, ...} when skipped (disabled or below threshold).
         {"error": str, "extracted": 0} on write failure.
     """
@@ -745,14 +911,16 @@ async def run_batch_extraction(
         if not cfg.kg_extraction.enabled:
             return {"skipped": True, "reason": "disabled"}
 
-        # (b) Read watermark
-        last_ts = _get_last_kg_timestamp(sbs_data_dir)
+        # (b) Read watermark (keyset cursor stored in messages.db)
+        last_ts, last_msg_id = _get_kg_watermark(sbs_data_dir)
 
         # (c) Resolve messages DB path
-        db_path = str(Path(sbs_data_dir) / "indices" / "messages.db")
+        db_path = _messages_db_path(sbs_data_dir)
 
-        # (d) Fetch messages
-        msgs = await fetch_messages_since(db_path, last_ts, limit=max_messages)
+        # (d) Fetch one page of messages
+        msgs = await fetch_messages_since(
+            db_path, last_ts, limit=max_messages, since_msg_id=last_msg_id
+        )
 
         # (e) Threshold check
         effective_min = 0 if force else min_messages
@@ -767,7 +935,22 @@ async def run_batch_extraction(
 
         # (g) LLM extraction with KG role (falls back to casual internally)
         extractor = ConvKGExtractor(llm_router, role=kg_role)
+        extract_start = time.perf_counter()
         result = await extractor.extract(text)
+        chunk_stats = {
+            "chunks": len(result.get("chunk_latencies", [])),
+            "chunk_latencies": result.get("chunk_latencies", []),
+            "failed_chunks": result.get("failed_chunks", 0),
+            "extract_s": round(time.perf_counter() - extract_start, 3),
+        }
+        logger.info(
+            "[KG] %s: %d chunks in %.2fs (per-chunk: %s, %d failed)",
+            persona_id,
+            chunk_stats["chunks"],
+            chunk_stats["extract_s"],
+            ", ".join(f"{t:.2f}s" for t in chunk_stats["chunk_latencies"]),
+            chunk_stats["failed_chunks"],
+        )
 
         validated_triples = result.get("validated_triples", [])
         facts = result.get("facts", [])
@@ -778,36 +961,44 @@ async def run_batch_extraction(
             logger.info("[KG] No validated triples/facts extracted for %s", persona_id)
             # Still advance watermark — the messages were processed, just empty
             try:
-                _set_last_kg_timestamp(sbs_data_dir, msgs[-1]["timestamp"])
+                _set_kg_watermark(sbs_data_dir, msgs[-1]["timestamp"], msgs[-1]["msg_id"])
             except Exception as e:
                 logger.warning("[KG] Failed to advance watermark on empty result: %s", e)
-            return {"extracted": 0, "facts": 0, "rejected": rejected_count}
+            return {
+                "extracted": 0,
+                "facts": 0,
+                "rejected": rejected_count,
+                "messages": len(msgs),
+                **chunk_stats,
+            }
 
         # (h) through (k): Write sequence with watermark-last ordering
         try:
-            # (h) Write validated triples to SQLiteGraph with contradiction detection
-            for triple, confidence in validated_triples:
-                if len(triple) < 3:
-                    continue
-                subj, rel, obj = triple[0], triple[1], triple[2]
-                _write_triple_to_graph(graph, subj, rel, obj, weight=confidence)
+            # (h) Write validated triples to SQLiteGraph with contradiction
+            # detection -- one transaction for the whole batch
+            graph_result = graph.bulk_upsert(
+                edges=[
+                    (triple[0], triple[2], triple[1], confidence, "conv_kg")
+                    for triple, confidence in validated_triples
+                    if len(triple) >= 3
+                ],
+                single_valued=_SINGLE_VALUED_RELATIONS,
+            )
+            if graph_result["replaced"]:
+                logger.info(
+                    "[KG] Contradictions: replaced %d single-valued edges for %s",
+                    graph_result["replaced"],
+                    persona_id,
+                )
 
             # (i) Write entity_links to memory.db with confidence
             conn = sqlite3.connect(memory_db_path)
             try:
                 _ensure_entity_links(conn)
-                for triple, confidence in validated_triples:
-                    if len(triple) < 3:
-                        continue
-                    subj, rel, obj = triple[0], triple[1], triple[2]
-                    _write_triple_to_entity_links(
-                        conn,
-                        subj,
-                        rel,
-                        obj,
-                        fact_id=0,
-                        confidence=confidence,
-                    )
+                _write_triples_to_entity_links(
+                    conn,
+                    [(*triple[:3], confidence) for triple, confidence in validated_triples],
+                )
                 conn.commit()
             finally:
                 conn.close()
@@ -821,7 +1012,7 @@ async def run_batch_extraction(
             _update_entities_json(entities_json_path, all_entities)
 
             # (k) Advance watermark — ONLY on full success (ABSOLUTE LAST)
-            _set_last_kg_timestamp(sbs_data_dir, msgs[-1]["timestamp"])
+            _set_kg_watermark(sbs_data_dir, msgs[-1]["timestamp"], msgs[-1]["msg_id"])
 
         except Exception as write_err:
             logger.error(
@@ -829,7 +1020,7 @@ async def run_batch_extraction(
                 persona_id,
                 write_err,
             )
-            return {"error": str(write_err), "extracted": 0}
+            return {"error": str(write_err), "extracted": 0, **chunk_stats}
 
         logger.info(
             "[KG] Extracted %d validated triples (%d rejected), %d facts for %s",
@@ -842,4 +1033,6 @@ async def run_batch_extraction(
             "extracted": len(validated_triples),
             "facts": len(facts),
             "rejected": rejected_count,
+            "messages": len(msgs),
+            **chunk_stats,
         }
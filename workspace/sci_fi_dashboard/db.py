@@ -1,6 +1,10 @@
 import os
+import queue
 import sqlite3
 import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 import sqlite_vec
 
@@ -19,6 +23,8 @@ def _get_db_path() -> str:
 
 DB_PATH = _get_db_path()
 MAX_DB_SIZE_MB = 100
+_SIZE_CHECK_INTERVAL_S = 60.0  # the size invariant is advisory; don't stat on every connect
+_last_size_check = 0.0
 
 
 def _ensure_sessions_table(conn: sqlite3.Connection) -> None:
@@ -127,6 +133,75 @@ def _ensure_kg_processed_column(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+def _ensure_entity_links(conn: sqlite3.Connection) -> None:
+    """Create entity_links and bring older schemas up to date (idempotent).
+
+    subject_norm / object_norm hold LOWER(subject) / LOWER(object).  Writers
+    fill them directly; a trigger backfills rows inserted without them (e.g.
+    scripts/nightly_ingest.py).  Plain columns rather than generated ones
+    because SQLite won't treat an index over generated columns as covering.
+    The covering indexes keep the retriever's ``subject_norm IN (...)`` /
+    ``object_norm IN (...)`` lookup an index-only search however large the
+    table grows; idx_entity_links_subject_rel serves the archival UPDATE on
+    single-valued writes.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS entity_links (
+            id        INTEGER PRIMARY KEY AUTOINCREMENT,
+            subject   TEXT NOT NULL,
+            relation  TEXT NOT NULL,
+            object    TEXT NOT NULL,
+            archived  INTEGER DEFAULT 0,
+            source_fact_id INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            confidence REAL DEFAULT 1.0,
+            subject_norm TEXT,
+            object_norm  TEXT
+        )
+    """)
+    # Add missing columns for older schemas (idempotent via PRAGMA check).
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(entity_links)").fetchall()}
+    if "archived" not in cols:
+        conn.execute("ALTER TABLE entity_links ADD COLUMN archived INTEGER DEFAULT 0")
+    if "confidence" not in cols:
+        conn.execute("ALTER TABLE entity_links ADD COLUMN confidence REAL DEFAULT 1.0")
+    if "subject_norm" not in cols or "object_norm" not in cols:
+        for column in ("subject_norm", "object_norm"):
+            if column not in cols:
+                conn.execute(f"ALTER TABLE entity_links ADD COLUMN {column} TEXT")
+        conn.execute(
+            "UPDATE entity_links SET subject_norm = LOWER(subject), object_norm = LOWER(object)"
+        )
+    conn.executescript("""
+        CREATE TRIGGER IF NOT EXISTS trg_entity_links_norm
+        AFTER INSERT ON entity_links
+        WHEN NEW.subject_norm IS NULL OR NEW.object_norm IS NULL
+        BEGIN
+            UPDATE entity_links
+            SET subject_norm = LOWER(NEW.subject), object_norm = LOWER(NEW.object)
+            WHERE id = NEW.id;
+        END;
+        CREATE INDEX IF NOT EXISTS idx_entity_links_subject_norm
+            ON entity_links(subject_norm, archived, subject, relation, object);
+        CREATE INDEX IF NOT EXISTS idx_entity_links_object_norm
+            ON entity_links(object_norm, archived, subject, relation, object);
+        CREATE INDEX IF NOT EXISTS idx_entity_links_subject_rel
+            ON entity_links(subject, relation, archived);
+    """)
+    conn.commit()
+
+
+def _ensure_documents_indexes(conn: sqlite3.Connection) -> None:
+    """Create secondary indexes on documents (idempotent).
+
+    idx_documents_filename serves the permanent-profile lookups
+    (filename = 'relationship_memory' / 'memory_distillation', ordered by id)
+    without scanning the whole table.
+    """
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_filename ON documents(filename, id)")
+    conn.commit()
+
+
 def _ensure_embedding_metadata(conn: sqlite3.Connection) -> None:
     """Add embedding provenance columns if they don't exist yet (idempotent).
 
@@ -170,6 +245,221 @@ def validate_embedding_dimension(vector: list[float], expected: int = EMBEDDING_
 _ALLOWED_JOURNAL_MODES = frozenset({"WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"})
 
 
+def _check_db_size() -> None:
+    """Warn when memory.db outgrows MAX_DB_SIZE_MB (at most once per interval)."""
+    global _last_size_check
+    now = time.monotonic()
+    if now - _last_size_check < _SIZE_CHECK_INTERVAL_S:
+        return
+    _last_size_check = now
+    if os.path.exists(DB_PATH):
+        size_mb = os.path.getsize(DB_PATH) / (1024 * 1024)
+        if size_mb > MAX_DB_SIZE_MB:
+            print(
+                f"[WARN] WARNING: Database size ({size_mb:.1f}MB) exceeds target ({MAX_DB_SIZE_MB}MB). Running VACUUM recommended."
+            )
+
+
+def _configure_connection(
+    conn: sqlite3.Connection, journal_mode: str = "WAL"
+) -> sqlite3.Connection:
+    """Apply the standard PRAGMAs and load sqlite-vec on a fresh connection."""
+    # Performance Tuning (WAL Mode as requested)
+    # Validate journal_mode against allowlist to prevent SQL injection
+    jm_upper = journal_mode.upper()
+    if jm_upper not in _ALLOWED_JOURNAL_MODES:
+        conn.close()
+        raise ValueError(
+            f"Invalid journal_mode '{journal_mode}'. " f"Allowed: {sorted(_ALLOWED_JOURNAL_MODES)}"
+        )
+    conn.execute(f"PRAGMA journal_mode={jm_upper};")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA foreign_keys=ON;")
+
+    # Canonical Extension Loading for Mac/Linux
+    conn.enable_load_extension(True)
+    try:
+        sqlite_vec.load(conn)
+    except Exception as e:
+        # Fallback for manual dylib if package fails (rare but possible in dev envs)
+        try:
+            conn.load_extension("vec0")
+        except Exception as e2:
+            print(f"[ERROR] CRITICAL: Failed to load sqlite-vec extension: {e} | {e2}")
+            conn.close()
+            raise
+
+    conn.enable_load_extension(False)
+    return conn
+
+
+def _pool_config() -> dict:
+    """synapse.json → memory.db_pool ({"readers": 4, "checkout_timeout": 10.0})."""
+    try:
+        from synapse_config import SynapseConfig  # noqa: PLC0415
+
+        cfg = SynapseConfig.load().memory.get("db_pool", {}) or {}
+    except Exception:
+        cfg = {}
+    return {k: cfg[k] for k in ("readers", "checkout_timeout") if k in cfg}
+
+
+class ConnectionPool:
+    """
+    Bounded pool of pre-configured memory.db connections.
+
+    Connections are opened lazily, configured once (WAL, PRAGMAs, sqlite-vec)
+    and then reused, so checking one out costs a queue get.  WAL lets readers
+    run alongside the single writer; readers are opened with query_only so a
+    stray write on a read connection fails loudly instead of racing the writer.
+    Connections are shared across threads (check_same_thread=False) but only
+    ever used by the thread that holds the checkout.
+    """
+
+    def __init__(self, path: str, readers: int = 4, checkout_timeout: float = 10.0) -> None:
+        self.path = path
+        self._max_readers = max(1, int(readers))
+        self._checkout_timeout = float(checkout_timeout)
+        self._idle: dict[str, queue.LifoQueue[sqlite3.Connection]] = {
+            "read": queue.LifoQueue(),
+            "write": queue.LifoQueue(),
+        }
+        self._limits = {"read": self._max_readers, "write": 1}
+        self._opened = {"read": 0, "write": 0}
+        self._in_use = {"read": 0, "write": 0}
+        self._peak_in_use = {"read": 0, "write": 0}
+        self._checkouts = {"read": 0, "write": 0}
+        self._waits = {"read": 0, "write": 0}
+        self._wait_total_s = {"read": 0.0, "write": 0.0}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _open(self, kind: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        _configure_connection(conn)
+        if kind == "read":
+            conn.execute("PRAGMA query_only=ON;")
+        return conn
+
+    def _checkout(self, kind: str, timeout: float | None) -> sqlite3.Connection:
+        idle = self._idle[kind]
+        deadline = None
+        start = 0.0
+        while True:
+            try:
+                conn = idle.get_nowait()
+                break
+            except queue.Empty:
+                pass
+            with self._lock:
+                may_open = self._opened[kind] < self._limits[kind]
+                if may_open:
+                    self._opened[kind] += 1
+            if may_open:
+                try:
+                    conn = self._open(kind)
+                except Exception:
+                    with self._lock:
+                        self._opened[kind] -= 1
+                    raise
+                break
+
+            # Pool exhausted -- wait for a checkin (or a dropped connection's slot)
+            if deadline is None:
+                start = time.perf_counter()
+                deadline = start + (self._checkout_timeout if timeout is None else timeout)
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                self._record_wait(kind, start)
+                raise TimeoutError(f"memory.db {kind} pool exhausted ({self._limits[kind]} in use)")
+            try:
+                conn = idle.get(timeout=min(remaining, 0.1))
+                break
+            except queue.Empty:
+                continue
+
+        if deadline is not None:
+            self._record_wait(kind, start)
+        with self._lock:
+            self._checkouts[kind] += 1
+            self._in_use[kind] += 1
+            self._peak_in_use[kind] = max(self._peak_in_use[kind], self._in_use[kind])
+        return conn
+
+    def _record_wait(self, kind: str, start: float) -> None:
+        with self._lock:
+            self._waits[kind] += 1
+            self._wait_total_s[kind] += time.perf_counter() - start
+
+    def _checkin(self, kind: str, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._in_use[kind] -= 1
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            # Closed or broken by the caller -- drop it so a fresh one is opened
+            with self._lock:
+                self._opened[kind] -= 1
+            return
+        if self._closed:
+            conn.close()
+            return
+        self._idle[kind].put(conn)
+
+    @contextmanager
+    def reader(self, timeout: float | None = None) -> Iterator[sqlite3.Connection]:
+        conn = self._checkout("read", timeout)
+        try:
+            yield conn
+        finally:
+            self._checkin("read", conn)
+
+    @contextmanager
+    def writer(self, timeout: float | None = None) -> Iterator[sqlite3.Connection]:
+        conn = self._checkout("write", timeout)
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._checkin("write", conn)
+
+    def get_stats(self) -> dict:
+        """Pool utilization per connection kind."""
+        with self._lock:
+            return {
+                kind: {
+                    "max": self._limits[kind],
+                    "open": self._opened[kind],
+                    "in_use": self._in_use[kind],
+                    "peak_in_use": self._peak_in_use[kind],
+                    "utilization": round(self._in_use[kind] / self._limits[kind], 2),
+                    "checkouts": self._checkouts[kind],
+                    "waits": self._waits[kind],
+                    "avg_wait_ms": (
+                        round(self._wait_total_s[kind] / self._waits[kind] * 1000, 2)
+                        if self._waits[kind]
+                        else 0.0
+                    ),
+                }
+                for kind in ("read", "write")
+            }
+
+    def close(self) -> None:
+        """Close idle connections (checked-out ones close on their next checkin)."""
+        self._closed = True
+        for idle in self._idle.values():
+            while True:
+                try:
+                    conn = idle.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+
+
 class DatabaseManager:
     """
     The Single Source of Truth for Database Integrity.
@@ -254,6 +544,8 @@ class DatabaseManager:
                 _ensure_embedding_metadata(conn)
                 _ensure_jarvis_tables(conn)
                 _ensure_kg_processed_column(conn)
+                _ensure_documents_indexes(conn)
+                _ensure_entity_links(conn)
                 conn.commit()
                 conn.close()
                 print("[OK] Memory database initialized successfully.")
@@ -264,6 +556,8 @@ class DatabaseManager:
                     _ensure_embedding_metadata(_mig)
                     _ensure_jarvis_tables(_mig)
                     _ensure_kg_processed_column(_mig)
+                    _ensure_documents_indexes(_mig)
+                    _ensure_entity_links(_mig)
 
             DatabaseManager._initialized = True
 
@@ -272,45 +566,36 @@ class DatabaseManager:
         """
         Get a configured SQLite connection with extensions loaded.
         Auto-creates the database on first call if it doesn't exist.
+
+        Opens a fresh connection the caller must close.  Hot paths should
+        check one out of the pool instead via reader() / writer().
         """
         DatabaseManager._ensure_db()
+        _check_db_size()
+        return _configure_connection(sqlite3.connect(DB_PATH), journal_mode)
 
-        # Check invariant on every connect (lightweight stat)
-        if os.path.exists(DB_PATH):
-            size_mb = os.path.getsize(DB_PATH) / (1024 * 1024)
-            if size_mb > MAX_DB_SIZE_MB:
-                print(
-                    f"[WARN] WARNING: Database size ({size_mb:.1f}MB) exceeds target ({MAX_DB_SIZE_MB}MB). Running VACUUM recommended."
-                )
-
-        conn = sqlite3.connect(DB_PATH)
-
-        # Performance Tuning (WAL Mode as requested)
-        # Validate journal_mode against allowlist to prevent SQL injection
-        jm_upper = journal_mode.upper()
-        if jm_upper not in _ALLOWED_JOURNAL_MODES:
-            raise ValueError(
-                f"Invalid journal_mode '{journal_mode}'. "
-                f"Allowed: {sorted(_ALLOWED_JOURNAL_MODES)}"
-            )
-        conn.execute(f"PRAGMA journal_mode={jm_upper};")
-        conn.execute("PRAGMA synchronous=NORMAL;")
-        conn.execute("PRAGMA foreign_keys=ON;")
+    _pool: "ConnectionPool | None" = None
+    _pool_lock = threading.Lock()
 
-        # Canonical Extension Loading for Mac/Linux
-        conn.enable_load_extension(True)
-        try:
-            sqlite_vec.load(conn)
-        except Exception as e:
-            # Fallback for manual dylib if package fails (rare but possible in dev envs)
-            try:
-                conn.load_extension("vec0")
-            except Exception as e2:
-                print(f"[ERROR] CRITICAL: Failed to load sqlite-vec extension: {e} | {e2}")
-                raise
+    @staticmethod
+    def pool() -> "ConnectionPool":
+        """Return the process-wide memory.db connection pool (created on first use)."""
+        if DatabaseManager._pool is None:
+            with DatabaseManager._pool_lock:
+                if DatabaseManager._pool is None:
+                    DatabaseManager._ensure_db()
+                    DatabaseManager._pool = ConnectionPool(DB_PATH, **_pool_config())
+        return DatabaseManager._pool
 
-        conn.enable_load_extension(False)
-        return conn
+    @staticmethod
+    def reader(timeout: float | None = None):
+        """Check out a pooled read-only connection: ``with DatabaseManager.reader() as conn``."""
+        return DatabaseManager.pool().reader(timeout)
+
+    @staticmethod
+    def writer(timeout: float | None = None):
+        """Check out the pooled write connection; commits on success, rolls back on error."""
+        return DatabaseManager.pool().writer(timeout)
 
     @staticmethod
     def verify_air_gap() -> bool:
@@ -318,21 +603,18 @@ class DatabaseManager:
         Verifies the Air-Gap integrity by checking tag counts.
         Returns True if both hemispheres exist and are populated.
         """
-        conn = DatabaseManager.get_connection()
-        try:
+        with DatabaseManager.reader() as conn:
             cursor = conn.execute(
                 "SELECT hemisphere_tag, count(*) FROM documents GROUP BY hemisphere_tag"
             )
             counts = {row[0]: row[1] for row in cursor.fetchall()}
 
-            safe_count = counts.get("safe", 0)
-            spicy_count = counts.get("spicy", 0)
+        safe_count = counts.get("safe", 0)
+        spicy_count = counts.get("spicy", 0)
 
-            print(f"[GUARD] Air-Gap Status: Safe={safe_count} | Spicy={spicy_count}")
+        print(f"[GUARD] Air-Gap Status: Safe={safe_count} | Spicy={spicy_count}")
 
-            return not (safe_count == 0 or spicy_count == 0)
-        finally:
-            conn.close()
+        return not (safe_count == 0 or spicy_count == 0)
 
 
 def get_db_connection(journal_mode: str = "WAL") -> sqlite3.Connection:
@@ -340,6 +622,12 @@ def get_db_connection(journal_mode: str = "WAL") -> sqlite3.Connection:
     return DatabaseManager.get_connection(journal_mode)
 
 
+def get_pool_stats() -> dict:
+    """Connection pool utilization ({} until the pool has been used)."""
+    pool = DatabaseManager._pool
+    return pool.get_stats() if pool is not None else {}
+
+
 if __name__ == "__main__":
     print("[LAB] db.py Self-Test...")
     try:
@@ -214,6 +214,7 @@ class DualCognitionEngine:
         target: str = "the_creator",
         llm_fn=None,
         pre_cached_memory: dict = None,
+        embedding_context=None,
     ) -> CognitiveMerge:
         """Main entry: routes through fast/standard/deep paths based on complexity."""
 
@@ -253,7 +254,9 @@ class DualCognitionEngine:
                     )
                 present, memory = await asyncio.gather(
                     self._analyze_present(user_message, conversation_history, llm_fn),
-                    self._recall_memory(user_message, chat_id, target, pre_cached_memory),
+                    self._recall_memory(
+                        user_message, chat_id, target, pre_cached_memory, embedding_context
+                    ),
                 )
                 with contextlib.suppress(Exception):
                     _get_emitter().emit(
@@ -296,7 +299,9 @@ class DualCognitionEngine:
                 )
             present, memory = await asyncio.gather(
                 self._analyze_present(user_message, conversation_history, llm_fn),
-                self._recall_memory(user_message, chat_id, target, pre_cached_memory),
+                self._recall_memory(
+                    user_message, chat_id, target, pre_cached_memory, embedding_context
+                ),
             )
             with contextlib.suppress(Exception):
                 _get_emitter().emit(
@@ -403,32 +408,56 @@ JSON only:"""
 
         return present
 
+    @staticmethod
+    def relationship_entity(target: str) -> str:
+        """KG node holding the relationship context for *target*."""
+        return "primary_partner" if "the_partner" in target.lower() else "primary_user"
+
     async def _recall_memory(
         self,
         message: str,
         chat_id: str,
         target: str,
         pre_cached_memory: dict = None,
+        embedding_context=None,
     ) -> MemoryStream:
-        """Stream 2: Query memory. Uses pre_cached_memory if available to avoid duplicate queries."""
+        """Stream 2: Query memory. Uses pre_cached_memory if available to avoid duplicate queries.
+
+        The relationship target's neighborhood rides along in the memory query's
+        graph lookup (``graph_entities``); it is only fetched separately when the
+        results don't carry it (pre-cached results from an older caller, errors).
+        """
         memory = MemoryStream()
+        target_name = self.relationship_entity(target)
+        neighborhoods: dict = {}
 
         try:
             results = (
                 pre_cached_memory
                 if pre_cached_memory
-                else self.memory.query(message, limit=5, with_graph=True)
+                else await self.memory.aquery(
+                    message,
+                    limit=5,
+                    with_graph=True,
+                    embedding_context=embedding_context,
+                    graph_entities=[target_name],
+                )
             )
             memory.relevant_facts = [r["content"] for r in results.get("results", [])]
             memory.graph_connections = results.get("graph_context", "")
+            neighborhoods = results.get("graph_neighborhoods") or {}
         except (KeyError, IndexError, ValueError) as e:
             logger.debug("Memory recall returned no results: %s", e)
         except Exception as e:
             logger.warning("Memory recall failed (database/connection error): %s", e)
 
         try:
-            target_name = "primary_partner" if "the_partner" in target.lower() else "primary_user"
-            memory.relationship_context = self.graph.get_entity_neighborhood(target_name)
+            if target_name in neighborhoods:
+                memory.relationship_context = self.graph.format_neighborhood(
+                    target_name, neighborhoods[target_name]
+                )
+            else:
+                memory.relationship_context = self.graph.get_entity_neighborhood(target_name)
         except Exception as e:
             # L-05: Log instead of silently dropping graph errors
             logger.debug("Graph neighborhood lookup failed: %s", e)
@@ -1,11 +1,24 @@
 from sci_fi_dashboard.embedding.base import EmbeddingProvider, EmbeddingResult, ProviderInfo
-from sci_fi_dashboard.embedding.factory import create_provider, get_provider, reset_provider
+from sci_fi_dashboard.embedding.batcher import MicroBatchingProvider
+from sci_fi_dashboard.embedding.cache import CachedEmbeddingProvider, EmbeddingCache
+from sci_fi_dashboard.embedding.context import MessageEmbeddingContext
+from sci_fi_dashboard.embedding.factory import (
+    create_provider,
+    get_provider,
+    reset_provider,
+    wrap_cache,
+)
 
 __all__ = [
+    "CachedEmbeddingProvider",
+    "EmbeddingCache",
     "EmbeddingProvider",
     "EmbeddingResult",
+    "MessageEmbeddingContext",
+    "MicroBatchingProvider",
     "ProviderInfo",
     "create_provider",
     "get_provider",
     "reset_provider",
+    "wrap_cache",
 ]
@@ -26,6 +26,10 @@ class EmbeddingProvider(ABC):
     def embed_query(self, text: str) -> list[float]:
         """Embed a search query. Adds 'search_query: ' prefix for models that need it."""
 
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Embed several search queries. Providers with native batching should override."""
+        return [self.embed_query(t) for t in texts]
+
     @abstractmethod
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed documents for storage. Adds 'search_document: ' prefix."""
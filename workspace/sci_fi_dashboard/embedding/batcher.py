@@ -0,0 +1,198 @@
+"""
+Micro-batching front end for embedding providers.
+
+Concurrent embed_query() / embed_documents() calls from different threads
+(MemoryEngine retrieval workers, SkillRouter, add_memory) are collected for
+up to ``max_wait_ms`` and run through the wrapped provider as one batch, so
+the ONNX session sees a single batched forward pass instead of N serialized
+batch_size=1 calls.  Each caller blocks on its own future and gets back
+exactly its own vectors.
+
+Enabled by default from :func:`get_provider`; configure via::
+
+    {"embedding": {"batching": {"enabled": true, "max_batch": 32, "max_wait_ms": 5}}}
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+from sci_fi_dashboard.embedding.base import EmbeddingProvider, ProviderInfo
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH = 32
+DEFAULT_MAX_WAIT_MS = 5.0
+
+
+@dataclass
+class _Request:
+    kind: str  # "query" | "document"
+    texts: list[str]
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class MicroBatchingProvider(EmbeddingProvider):
+    """EmbeddingProvider wrapper that coalesces concurrent calls into batches.
+
+    Requests at least ``max_batch`` texts long bypass the batcher — they are
+    already a full batch and gain nothing from waiting.
+    """
+
+    def __init__(
+        self,
+        inner: EmbeddingProvider,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        self._inner = inner
+        self._max_batch = max(1, int(max_batch))
+        self._max_wait_s = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue: queue.SimpleQueue[_Request] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._texts = 0
+        self._batches = 0
+        self._inference_s = 0.0
+        self._latency_total_ms = 0.0
+        self._latency_max_ms = 0.0
+
+    @property
+    def inner(self) -> EmbeddingProvider:
+        """The wrapped provider."""
+        return self._inner
+
+    # -- EmbeddingProvider interface --
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._submit("query", [text])[0]
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        return self._submit("query", list(texts))
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        return self._submit("document", list(texts))
+
+    def info(self) -> ProviderInfo:
+        return self._inner.info()
+
+    @property
+    def dimensions(self) -> int:
+        return self._inner.dimensions
+
+    # -- Batching --
+
+    def _submit(self, kind: str, texts: list[str]) -> list[list[float]]:
+        if len(texts) >= self._max_batch:
+            start = time.perf_counter()
+            vectors = self._run(kind, texts)
+            self._record([(start, len(texts))], time.perf_counter() - start)
+            return vectors
+
+        self._ensure_thread()
+        request = _Request(kind=kind, texts=texts)
+        self._queue.put(request)
+        return request.future.result()
+
+    def _run(self, kind: str, texts: list[str]) -> list[list[float]]:
+        if kind == "query":
+            return self._inner.embed_queries(texts)
+        return self._inner.embed_documents(texts)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="embedding-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            first = self._queue.get()
+            batch = [first]
+            size = len(first.texts)
+            deadline = time.perf_counter() + self._max_wait_s
+            while size < self._max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request.texts)
+            self._flush(batch)
+
+    def _flush(self, batch: list[_Request]) -> None:
+        """Run one inner call per request kind and hand each caller its slice."""
+        for kind in ("query", "document"):
+            group = [r for r in batch if r.kind == kind]
+            if not group:
+                continue
+            texts = [t for r in group for t in r.texts]
+            start = time.perf_counter()
+            try:
+                vectors = self._run(kind, texts)
+                if len(vectors) != len(texts):
+                    raise RuntimeError(
+                        f"Embedding provider returned {len(vectors)} vectors for {len(texts)} texts"
+                    )
+            except Exception as exc:  # noqa: BLE001 — delivered to every waiting caller
+                for r in group:
+                    r.future.set_exception(exc)
+                continue
+            elapsed = time.perf_counter() - start
+
+            offset = 0
+            for r in group:
+                r.future.set_result(vectors[offset : offset + len(r.texts)])
+                offset += len(r.texts)
+            self._record([(r.enqueued_at, len(r.texts)) for r in group], elapsed)
+
+    def _record(self, requests: list[tuple[float, int]], inference_s: float) -> None:
+        now = time.perf_counter()
+        with self._stats_lock:
+            self._batches += 1
+            self._inference_s += inference_s
+            for enqueued_at, n_texts in requests:
+                latency_ms = (now - enqueued_at) * 1000
+                self._requests += 1
+                self._texts += n_texts
+                self._latency_total_ms += latency_ms
+                self._latency_max_ms = max(self._latency_max_ms, latency_ms)
+
+    def get_stats(self) -> dict:
+        """Throughput and latency counters since process start."""
+        with self._stats_lock:
+            return {
+                "requests": self._requests,
+                "texts": self._texts,
+                "batches": self._batches,
+                "avg_batch_size": round(self._texts / self._batches, 2) if self._batches else 0.0,
+                "texts_per_second": (
+                    round(self._texts / self._inference_s, 1) if self._inference_s else 0.0
+                ),
+                "avg_latency_ms": (
+                    round(self._latency_total_ms / self._requests, 2) if self._requests else 0.0
+                ),
+                "max_latency_ms": round(self._latency_max_ms, 2),
+                "max_batch": self._max_batch,
+                "max_wait_ms": self._max_wait_s * 1000,
+            }
@@ -0,0 +1,271 @@
+"""
+Persistent, content-addressed embedding cache.
+
+Vectors are keyed by ``sha256(text)`` + provider model + prefix mode
+("query" | "document"), so the same text embedded by the same model is
+never recomputed — across restarts, re-ingests and ``synapse re-embed`` runs.
+Changing the model (or the query/document prefix) naturally misses.
+
+Storage is a small SQLite file next to memory.db
+(``~/.synapse/workspace/db/embedding_cache.db``) holding float32 blobs.
+A bounded in-process LRU sits in front of it for hot query strings.
+When the table grows past ``max_entries`` the least-recently-used rows are
+evicted down to 90% of the cap.
+
+Enabled by default from :func:`get_provider`; configure via::
+
+    {"embedding": {"cache": {"enabled": true, "max_entries": 50000, "path": null}}}
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+from sci_fi_dashboard.embedding.base import EmbeddingProvider, ProviderInfo
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50_000  # ~150 MB at 768 float32 dims
+DEFAULT_MEMORY_ENTRIES = 1024
+_TOUCH_FLUSH_THRESHOLD = 256  # batch last_used updates instead of writing on every hit
+
+
+def _default_cache_path() -> Path:
+    try:
+        from synapse_config import SynapseConfig  # noqa: PLC0415
+
+        return SynapseConfig.load().db_dir / "embedding_cache.db"
+    except Exception:
+        return Path.home() / ".synapse" / "workspace" / "db" / "embedding_cache.db"
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed float32 vector store keyed by (text hash, model, mode)."""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
+        self.path = Path(path) if path else _default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max(1, int(max_entries))
+        self._memory_entries = max(0, int(memory_entries))
+        self._memory: OrderedDict[tuple[str, str, str], list[float]] = OrderedDict()
+        self._touched: dict[tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                text_hash  TEXT NOT NULL,
+                model      TEXT NOT NULL,
+                mode       TEXT NOT NULL,
+                dims       INTEGER NOT NULL,
+                vector     BLOB NOT NULL,
+                last_used  REAL NOT NULL,
+                PRIMARY KEY (text_hash, model, mode)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used);
+        """)
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+
+    # -- Lookup --
+
+    def get_many(self, texts: list[str], model: str, mode: str) -> list[list[float] | None]:
+        """Return cached vectors aligned with *texts* (None where missing)."""
+        keys = [(_text_hash(t), model, mode) for t in texts]
+        found: dict[tuple[str, str, str], list[float]] = {}
+        now = time.time()
+        with self._lock:
+            missing = []
+            for key in keys:
+                vec = self._memory.get(key)
+                if vec is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = list(vec)
+                    self._touched[key] = now
+                else:
+                    missing.append(key)
+
+            # SQLite variable limit is 999 on older builds — chunk the IN list
+            unique_hashes = list(dict.fromkeys(k[0] for k in missing))
+            for i in range(0, len(unique_hashes), 500):
+                chunk = unique_hashes[i : i + 500]
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings"
+                    f" WHERE model = ? AND mode = ? AND text_hash IN ({','.join('?' * len(chunk))})",
+                    (model, mode, *chunk),
+                ).fetchall()
+                for text_hash, blob in rows:
+                    key = (text_hash, model, mode)
+                    vec = array("f", blob).tolist()
+                    found[key] = vec
+                    self._touched[key] = now
+                    self._remember(key, list(vec))
+
+            results = [found.get(k) for k in keys]
+            hit_count = sum(1 for r in results if r is not None)
+            self.hits += hit_count
+            self.misses += len(results) - hit_count
+            if len(self._touched) >= _TOUCH_FLUSH_THRESHOLD:
+                self._flush_touches()
+        return results
+
+    def get(self, text: str, model: str, mode: str) -> list[float] | None:
+        return self.get_many([text], model, mode)[0]
+
+    # -- Store --
+
+    def put_many(self, texts: list[str], vectors: list[list[float]], model: str, mode: str) -> None:
+        now = time.time()
+        rows = []
+        with self._lock:
+            for text, vec in zip(texts, vectors, strict=True):
+                if not vec:
+                    continue
+                vec = list(vec)
+                key = (_text_hash(text), model, mode)
+                rows.append((key[0], model, mode, len(vec), array("f", vec).tobytes(), now))
+                self._remember(key, vec)
+            if not rows:
+                return
+            self._flush_touches()
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings"
+                " (text_hash, model, mode, dims, vector, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._count += self._conn.total_changes - before
+            if self._count > self._max_entries:
+                self._evict()
+            self._conn.commit()
+
+    def put(self, text: str, vector: list[float], model: str, mode: str) -> None:
+        self.put_many([text], [vector], model, mode)
+
+    # -- Maintenance (call with self._lock held) --
+
+    def _remember(self, key: tuple[str, str, str], vec: list[float]) -> None:
+        if not self._memory_entries:
+            return
+        self._memory[key] = vec
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_touches(self) -> None:
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE embeddings SET last_used = ? WHERE text_hash = ? AND model = ? AND mode = ?",
+            [(ts, *key) for key, ts in self._touched.items()],
+        )
+        self._conn.commit()
+        self._touched.clear()
+
+    def _evict(self) -> None:
+        target = int(self._max_entries * 0.9)
+        excess = self._count - target
+        if excess <= 0:
+            return
+        # WITHOUT ROWID table -- match on the composite primary key
+        deleted = self._conn.execute(
+            "DELETE FROM embeddings WHERE (text_hash, model, mode) IN ("
+            " SELECT text_hash, model, mode FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+            (excess,),
+        ).rowcount
+        self._count -= max(0, deleted)
+        self._memory.clear()
+        logger.info("[EmbeddingCache] Evicted %d least-recently-used vectors", deleted)
+
+    def close(self) -> None:
+        with self._lock:
+            with contextlib.suppress(Exception):
+                self._flush_touches()
+            with contextlib.suppress(Exception):
+                self._conn.close()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": self._count,
+                "max_entries": self._max_entries,
+                "memory_entries": len(self._memory),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "path": str(self.path),
+            }
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """EmbeddingProvider wrapper that consults an EmbeddingCache before the model."""
+
+    def __init__(self, inner: EmbeddingProvider, cache: EmbeddingCache) -> None:
+        self._inner = inner
+        self.cache = cache
+        self._model = inner.info().model
+
+    @property
+    def inner(self) -> EmbeddingProvider:
+        """The wrapped provider."""
+        return self._inner
+
+    def _cached(self, texts: list[str], mode: str, embed_fn) -> list[list[float]]:
+        if not texts:
+            return []
+        vectors = self.cache.get_many(texts, self._model, mode)
+        missing = [i for i, v in enumerate(vectors) if v is None]
+        if missing:
+            # Deduplicate within the call -- identical chunks are common in bulk ingests
+            unique = list(dict.fromkeys(texts[i] for i in missing))
+            fresh = dict(zip(unique, embed_fn(unique), strict=True))
+            self.cache.put_many(unique, [fresh[t] for t in unique], self._model, mode)
+            for i in missing:
+                vectors[i] = fresh[texts[i]]
+        return vectors
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._cached([text], "query", self._inner.embed_queries)[0]
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        return self._cached(list(texts), "query", self._inner.embed_queries)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._cached(list(texts), "document", self._inner.embed_documents)
+
+    def info(self) -> ProviderInfo:
+        return self._inner.info()
+
+    @property
+    def dimensions(self) -> int:
+        return self._inner.dimensions
+
+    def get_stats(self) -> dict:
+        stats = {"cache": self.cache.get_stats()}
+        inner_stats = getattr(self._inner, "get_stats", None)
+        if callable(inner_stats):
+            stats["batcher"] = inner_stats()
+        return stats
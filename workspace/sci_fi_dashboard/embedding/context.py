@@ -0,0 +1,60 @@
+"""
+Request-scoped query embedding cache.
+
+One inbound message is consulted by memory retrieval, skill routing, dual
+cognition and the query_memory tool.  persona_chat() creates a single
+MessageEmbeddingContext per message and hands it to each of them, so every
+distinct text is embedded at most once for the lifetime of the request.
+
+Thread-safe: retrieval stages run on executor threads while skill routing
+runs on the event loop.  If two callers ask for the same text concurrently,
+the second waits for the first instead of running a second ONNX pass.
+Failures are cached too, so a broken provider is not retried per consumer.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+from sci_fi_dashboard.embedding.base import EmbeddingProvider
+
+
+class MessageEmbeddingContext:
+    """Memoizes ``embed_query`` results for the duration of one message."""
+
+    def __init__(self, provider: EmbeddingProvider | None = None) -> None:
+        self._provider = provider
+        self._vectors: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def provider(self) -> EmbeddingProvider | None:
+        if self._provider is None:
+            from sci_fi_dashboard.embedding.factory import get_provider
+
+            self._provider = get_provider()
+        return self._provider
+
+    def embed_query(self, text: str) -> list[float]:
+        """Return the query vector for *text*, embedding it on first use only."""
+        with self._lock:
+            future = self._vectors.get(text)
+            owner = future is None
+            if owner:
+                future = self._vectors[text] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if owner:
+            try:
+                provider = self.provider
+                if provider is None:
+                    raise RuntimeError("No embedding provider available")
+                future.set_result(list(provider.embed_query(text)))
+            except Exception as exc:  # noqa: BLE001 — re-raised to every consumer below
+                future.set_exception(exc)
+        return future.result()
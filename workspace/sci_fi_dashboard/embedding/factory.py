@@ -64,14 +64,74 @@ def _create_explicit(name: str, *, model=None, cache_dir=None, threads=None) ->
         raise ValueError(f"Unknown embedding provider: {name!r}")
 
 
+def _embedding_config(config: dict | None) -> dict:
+    """The ``embedding`` section of *config*, or of synapse.json when None ({} if unset)."""
+    if config is not None:
+        return config.get("embedding", {}) or {}
+    try:
+        from synapse_config import SynapseConfig
+
+        return SynapseConfig.load().embedding or {}
+    except Exception:
+        return {}
+
+
+def _wrap_batching(provider: EmbeddingProvider, config: dict | None) -> EmbeddingProvider:
+    """Put the micro-batcher in front of *provider* unless disabled in config."""
+    batching = _embedding_config(config).get("batching", {}) or {}
+    if not batching.get("enabled", True):
+        return provider
+
+    from sci_fi_dashboard.embedding.batcher import (
+        DEFAULT_MAX_BATCH,
+        DEFAULT_MAX_WAIT_MS,
+        MicroBatchingProvider,
+    )
+
+    return MicroBatchingProvider(
+        provider,
+        max_batch=batching.get("max_batch", DEFAULT_MAX_BATCH),
+        max_wait_ms=batching.get("max_wait_ms", DEFAULT_MAX_WAIT_MS),
+    )
+
+
+def wrap_cache(provider: EmbeddingProvider, config: dict | None = None) -> EmbeddingProvider:
+    """Put the persistent embedding cache in front of *provider* unless disabled."""
+    cache_cfg = _embedding_config(config).get("cache", {}) or {}
+    if not cache_cfg.get("enabled", True):
+        return provider
+
+    from sci_fi_dashboard.embedding.cache import (
+        DEFAULT_MAX_ENTRIES,
+        CachedEmbeddingProvider,
+        EmbeddingCache,
+    )
+
+    try:
+        cache = EmbeddingCache(
+            path=cache_cfg.get("path"),
+            max_entries=cache_cfg.get("max_entries", DEFAULT_MAX_ENTRIES),
+        )
+    except Exception as e:
+        logger.warning(f"[Embedding] Persistent cache unavailable, continuing without it: {e}")
+        return provider
+    return CachedEmbeddingProvider(provider, cache)
+
+
 def get_provider(config: dict | None = None) -> EmbeddingProvider | None:
-    """Return singleton provider, creating it on first call (thread-safe)."""
+    """Return singleton provider, creating it on first call (thread-safe).
+
+    The singleton is wrapped in a MicroBatchingProvider so concurrent callers
+    share ONNX batches (``embedding/batcher.py``), and that in turn behind the
+    persistent EmbeddingCache so only cache misses reach the batcher
+    (``embedding/cache.py``).
+    """
     global _provider
     if _provider is None:
         with _provider_lock:
             if _provider is None:
                 try:
-                    _provider = create_provider(config)
+                    _provider = wrap_cache(_wrap_batching(create_provider(config), config), config)
                 except RuntimeError as e:
                     logger.error(f"[Embedding] {e}")
                     return None
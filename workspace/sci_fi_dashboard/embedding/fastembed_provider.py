@@ -128,6 +128,12 @@ class FastEmbedProvider(EmbeddingProvider):
         with self._inference_lock:
             return list(list(embedder.embed([prefixed], batch_size=1))[0].tolist())
 
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        prefixed = [f"search_query: {t}" for t in texts]
+        embedder = self._get_embedder()
+        with self._inference_lock:
+            return [list(v.tolist()) for v in embedder.embed(prefixed, batch_size=self._batch_size)]
+
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         prefixed = [f"search_document: {t}" for t in texts]
         embedder = self._get_embedder()
@@ -107,7 +107,7 @@ def re_embed_cli(args: list[str] | None = None) -> None:
     """
     import argparse
 
-    from sci_fi_dashboard.embedding.factory import create_provider
+    from sci_fi_dashboard.embedding.factory import create_provider, wrap_cache
 
     parser = argparse.ArgumentParser(
         prog="synapse re-embed",
@@ -142,7 +142,8 @@ def re_embed_cli(args: list[str] | None = None) -> None:
         print(f"[Error] Database not found at {db_path}")
         return
 
-    provider = create_provider()
+    # Cached so an interrupted run resumes without re-running finished batches
+    provider = wrap_cache(create_provider())
     print(f"[ReEmbed] Using provider: {provider.info().name} ({provider.info().model})")
 
     if parsed.dry_run:
@@ -1,3 +1,4 @@
+from .autoscaler import WorkerAutoscaler
 from .dedup import MessageDeduplicator
 from .flood import FloodGate
 from .queue import MessageTask, TaskQueue
@@ -27,6 +28,7 @@ __all__ = [
     "SessionActorQueue",
     "WhatsAppSender",
     "MessageWorker",
+    "WorkerAutoscaler",
     # WebSocket control plane
     "GatewayWebSocket",
     "VoiceSession",
@@ -0,0 +1,162 @@
+"""
+autoscaler.py — Elastic sizing of MessageWorker's concurrent-session slots.
+
+Every ``interval_s`` the supervisor looks at three signals:
+
+- backlog: tasks in the TaskQueue plus sessions waiting for a slot,
+- p95 slot wait over the last ``wait_window_s`` (how long a session with work
+  waits before a slot frees up -- per-session ordering waits don't count),
+- in-flight LLM calls (SynapseLLMRouter.in_flight).
+
+It grows the pool by one slot when the backlog exceeds
+``scale_up_backlog`` per slot or, with anything queued, the p95 slot wait
+exceeds ``scale_up_wait_ms`` -- unless the LLM is already at
+``max_llm_in_flight``, where more slots would only queue at the provider.
+It shrinks by one after ``cooldown_s`` without a resize while nothing waits
+and pool utilization is under ``scale_down_utilization``.  The pool stays
+within ``[min_workers, max_workers]``.
+
+Configure via synapse.json → ``gateway.workers``.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+_DEFAULTS = {
+    "enabled": True,
+    "initial": 2,
+    "min_workers": 1,
+    "max_workers": 8,
+    "interval_s": 1.0,
+    "scale_up_backlog": 2,
+    "scale_up_wait_ms": 2000,
+    "wait_window_s": 30.0,
+    "scale_down_utilization": 0.3,
+    "cooldown_s": 60.0,
+    "max_llm_in_flight": 16,
+}
+
+
+def _default_workers_config() -> dict:
+    """Return synapse.json → gateway.workers ({} if unset)."""
+    try:
+        from synapse_config import SynapseConfig
+
+        return SynapseConfig.load().gateway.get("workers", {}) or {}
+    except Exception:
+        return {}
+
+
+def workers_config(config: dict | None = None) -> dict:
+    """gateway.workers merged over the defaults."""
+    return {**_DEFAULTS, **(_default_workers_config() if config is None else config)}
+
+
+class WorkerAutoscaler:
+    """Supervisor that resizes a MessageWorker's slot pool from load signals."""
+
+    def __init__(
+        self,
+        worker,
+        llm_in_flight: Callable[[], int] | None = None,
+        config: dict | None = None,
+    ) -> None:
+        self.worker = worker
+        self._llm_in_flight = llm_in_flight
+        self.config = workers_config(config)
+        self.min_workers = max(1, int(self.config["min_workers"]))
+        self.max_workers = max(self.min_workers, int(self.config["max_workers"]))
+        self._task: asyncio.Task | None = None
+        self._last_resize = time.monotonic()
+        self._last_tick: float | None = None
+        self._last_busy = 0.0
+        self.scale_ups = 0
+        self.scale_downs = 0
+        self.last_signals: dict = {}
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="msg-worker-autoscaler")
+            logger.info(
+                "[OK] Worker autoscaler started (%d..%d slots)", self.min_workers, self.max_workers
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(float(self.config["interval_s"]))
+            try:
+                self.step()
+            except Exception as e:
+                logger.warning("[WARN] Worker autoscaler step failed: %s", e)
+
+    def step(self) -> int:
+        """Evaluate the signals once and resize if warranted; returns the new size."""
+        cfg = self.config
+        now = time.monotonic()
+        actors = self.worker.actors
+        size = self.worker.num_workers
+
+        backlog = self.worker.queue.pending_count + actors.waiting_sessions
+        p95_wait_ms = actors.slot_wait_percentile(95, float(cfg["wait_window_s"]))
+        in_flight = self._llm_in_flight() if self._llm_in_flight is not None else 0
+        busy = actors.busy_seconds()
+        if self._last_tick is None or now <= self._last_tick:
+            utilization = 0.0
+        else:
+            utilization = (busy - self._last_busy) / ((now - self._last_tick) * size)
+        self._last_tick, self._last_busy = now, busy
+        self.last_signals = {
+            "backlog": backlog,
+            "p95_slot_wait_ms": round(p95_wait_ms, 1),
+            "llm_in_flight": in_flight,
+            "utilization": round(max(0.0, min(utilization, 1.0)), 3),
+        }
+
+        # The wait window outlives a burst, so slow waits only count while work is queued
+        pressured = backlog > 0 and (
+            backlog > size * int(cfg["scale_up_backlog"])
+            or p95_wait_ms > float(cfg["scale_up_wait_ms"])
+        )
+        llm_saturated = in_flight >= int(cfg["max_llm_in_flight"])
+        if pressured and size < self.max_workers and not llm_saturated:
+            return self._resize(size + 1, now, "up")
+        if (
+            backlog == 0
+            and size > self.min_workers
+            and utilization < float(cfg["scale_down_utilization"])
+            and now - self._last_resize >= float(cfg["cooldown_s"])
+        ):
+            return self._resize(size - 1, now, "down")
+        return size
+
+    def _resize(self, size: int, now: float, direction: str) -> int:
+        self.worker.resize(size)
+        self._last_resize = now
+        if direction == "up":
+            self.scale_ups += 1
+        else:
+            self.scale_downs += 1
+        logger.info("Worker pool scaled %s to %d slots (%s)", direction, size, self.last_signals)
+        return size
+
+    def get_stats(self) -> dict:
+        return {
+            "size": self.worker.num_workers,
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            "scale_ups": self.scale_ups,
+            "scale_downs": self.scale_downs,
+            **self.last_signals,
+        }
@@ -1,31 +1,165 @@
+import hashlib
+import math
+import sys
 import time
+from collections import OrderedDict
+
+_FLOAT_SIZE = sys.getsizeof(0.0)
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter (k bit positions per key via double hashing)."""
+
+    def __init__(self, capacity: int, fp_rate: float):
+        self.capacity = max(1, capacity)
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+        self.bits_set = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: str) -> None:
+        for p in self._positions(key):
+            mask = 1 << (p & 7)
+            if not self.bits[p >> 3] & mask:
+                self.bits[p >> 3] |= mask
+                self.bits_set += 1
+        self.count += 1
+
+    def fp_rate(self) -> float:
+        """Current false-positive probability: (fraction of bits set) ** k."""
+        return (self.bits_set / self.num_bits) ** self.num_hashes
 
 
 class MessageDeduplicator:
-    """Simple TTLCache to avoid reprocessing same messageid if webhook is retried."""
+    """TTL set of recently seen message ids, so retried webhooks are processed once.
 
-    _CLEANUP_INTERVAL: float = 60.0  # seconds between cleanup sweeps
+    Exact layer: ids in an insertion-ordered dict.  An id is never
+    re-inserted, so the oldest entry is always at the front and expiry pops
+    from the front -- amortized O(1) per call, no full scans.
+    ``max_entries`` is a hard cap; past it the oldest ids are evicted early.
 
-    def __init__(self, window_seconds: int = 300):
+    Optional probabilistic layer (``bloom_capacity`` > 0): every id also goes
+    into the current of two Bloom filter generations, which rotate every
+    window, or early once the current one reaches capacity (so an id is
+    remembered for up to two windows and the FP rate stays near target).
+    It catches retries of ids the exact layer had to evict during a storm,
+    in a fixed ~``1.44 * log2(1/fp_rate)`` bits per id.  A false positive
+    drops a new message, so keep ``bloom_fp_rate`` small; get_stats()
+    reports the current estimate.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 300,
+        max_entries: int = 50_000,
+        bloom_capacity: int = 0,
+        bloom_fp_rate: float = 1e-4,
+    ):
         self.window = window_seconds
-        self.seen: dict[str, float] = {}
-        self._last_cleanup: float = 0.0
+        self.max_entries = max(1, max_entries)
+        self.seen: OrderedDict[str, float] = OrderedDict()
+        self._key_bytes = 0
+
+        self._bloom_capacity = bloom_capacity
+        self._bloom_fp_rate = bloom_fp_rate
+        self._bloom: _BloomFilter | None = None
+        self._bloom_prev: _BloomFilter | None = None
+        self._bloom_started = 0.0
+        if bloom_capacity > 0:
+            self._bloom = _BloomFilter(bloom_capacity, bloom_fp_rate)
+            self._bloom_started = time.monotonic()
+
+        self._checks = 0
+        self._duplicates = 0
+        self._bloom_duplicates = 0
+        self._expired = 0
+        self._evicted = 0
+
+    def _forget_oldest(self) -> None:
+        key, _ = self.seen.popitem(last=False)
+        self._key_bytes -= sys.getsizeof(key)
+
+    def _rotate_bloom(self, now: float) -> None:
+        full = self._bloom is not None and self._bloom.count >= self._bloom_capacity
+        if full or (self._bloom is not None and now - self._bloom_started >= self.window):
+            self._bloom_prev = self._bloom
+            self._bloom = _BloomFilter(self._bloom_capacity, self._bloom_fp_rate)
+            self._bloom_started = now
 
     def is_duplicate(self, message_id: str) -> bool:
         if not message_id:
             return False
 
-        now = time.time()
+        now = time.monotonic()
+        self._checks += 1
 
-        # Periodic cleanup instead of every call (L-14)
-        if now - self._last_cleanup > self._CLEANUP_INTERVAL:
-            expired = [k for k, v in self.seen.items() if now - v > self.window]
-            for k in expired:
-                del self.seen[k]
-            self._last_cleanup = now
+        # Expire from the front: entries are in arrival order
+        cutoff = now - self.window
+        while self.seen:
+            oldest = next(iter(self.seen.values()))
+            if oldest >= cutoff:
+                break
+            self._forget_oldest()
+            self._expired += 1
 
         if message_id in self.seen:
+            self._duplicates += 1
             return True
 
+        if self._bloom is not None:
+            self._rotate_bloom(now)
+            if message_id in self._bloom or (
+                self._bloom_prev is not None and message_id in self._bloom_prev
+            ):
+                self._duplicates += 1
+                self._bloom_duplicates += 1
+                return True
+            self._bloom.add(message_id)
+
+        if len(self.seen) >= self.max_entries:
+            self._forget_oldest()
+            self._evicted += 1
         self.seen[message_id] = now
+        self._key_bytes += sys.getsizeof(message_id)
         return False
+
+    def memory_bytes(self) -> int:
+        """Approximate footprint: dict table + id strings + timestamps + Bloom bits."""
+        exact = sys.getsizeof(self.seen) + self._key_bytes + len(self.seen) * _FLOAT_SIZE
+        blooms = sum(len(b.bits) for b in (self._bloom, self._bloom_prev) if b is not None)
+        return exact + blooms
+
+    def get_stats(self) -> dict:
+        stats = {
+            "entries": len(self.seen),
+            "max_entries": self.max_entries,
+            "checks": self._checks,
+            "duplicates": self._duplicates,
+            "expired": self._expired,
+            "evicted_early": self._evicted,
+            "memory_bytes": self.memory_bytes(),
+        }
+        if self._bloom is not None:
+            filters = [b for b in (self._bloom, self._bloom_prev) if b is not None]
+            # A lookup misses only if every generation misses
+            fp = 1.0 - math.prod(1.0 - b.fp_rate() for b in filters)
+            stats["bloom"] = {
+                "capacity": self._bloom_capacity,
+                "target_fp_rate": self._bloom_fp_rate,
+                "est_fp_rate": round(fp, 8),
+                "ids_current": self._bloom.count,
+                "duplicates_caught": self._bloom_duplicates,
+                "bytes": sum(len(b.bits) for b in filters),
+            }
+        return stats
@@ -1,37 +1,142 @@
 import asyncio
+import bisect
+import contextlib
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the flush-latency histogram buckets; the last bucket is open-ended
+_LATENCY_BUCKETS_MS = (250, 500, 1000, 2000, 3000, 5000, 10000, 30000)
+
+
+@dataclass
+class _Batch:
+    metadata: dict
+    first_at: float
+    deadline: float
+    messages: list[str] = field(default_factory=list)
 
 
 class FloodGate:
-    """Batches rapid-fire messages from the same user."""
+    """Batches rapid-fire messages from the same user.
 
-    def __init__(self, batch_window_seconds: float = 3.0):
+    Each chat's batch flushes ``batch_window_seconds`` after its latest
+    message, but never later than ``max_hold_seconds`` after its first one,
+    and immediately once it holds ``max_batch`` messages -- so a nonstop
+    sender still gets answered.
+
+    Deadlines live in one heap served by a single flusher task: a new
+    message only pushes a heap entry (superseded entries are skipped when
+    they come due) instead of cancelling and recreating a task per message.
+    """
+
+    def __init__(
+        self,
+        batch_window_seconds: float = 3.0,
+        max_batch: int = 20,
+        max_hold_seconds: float = 15.0,
+    ):
         self.window = batch_window_seconds
-        self._buffers: dict[str, dict] = {}
-        self._tasks: dict[str, asyncio.Task] = {}
+        self.max_batch = max(1, max_batch)
+        self.max_hold = max(batch_window_seconds, max_hold_seconds)
+        self._buffers: dict[str, _Batch] = {}
+        self._heap: list[tuple[float, str]] = []  # (deadline, chat_id), may hold stale entries
         self._callback = None
+        self._flusher: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._next_due = float("inf")
+
+        self._flushes = {"window": 0, "max_hold": 0, "max_batch": 0}
+        self._messages_in = 0
+        self._messages_flushed = 0
+        self._latency_hist = [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+        self._latency_total_ms = 0.0
 
     def set_callback(self, callback):
         self._callback = callback
 
     async def incoming(self, chat_id: str, message: str, metadata: dict):
-        if chat_id not in self._buffers:
-            self._buffers[chat_id] = {"messages": [message], "metadata": metadata}
-            # Start the timeout task
-            self._tasks[chat_id] = asyncio.create_task(self._wait_and_flush(chat_id))
+        now = time.monotonic()
+        self._messages_in += 1
+        batch = self._buffers.get(chat_id)
+        if batch is None:
+            batch = self._buffers[chat_id] = _Batch(metadata=metadata, first_at=now, deadline=0.0)
         else:
-            self._buffers[chat_id]["messages"].append(message)
-            self._buffers[chat_id]["metadata"] = metadata
+            batch.metadata = metadata
+        batch.messages.append(message)
 
-            # Cancel the existing timer and restart it to extend the debounce window
-            if chat_id in self._tasks:
-                self._tasks[chat_id].cancel()
-            self._tasks[chat_id] = asyncio.create_task(self._wait_and_flush(chat_id))
+        if len(batch.messages) >= self.max_batch:
+            await self._flush(chat_id, "max_batch")
+            return
 
-    async def _wait_and_flush(self, chat_id: str):
-        await asyncio.sleep(self.window)
+        # Debounce: extend to window-after-latest, capped at max_hold-after-first
+        batch.deadline = min(now + self.window, batch.first_at + self.max_hold)
+        heapq.heappush(self._heap, (batch.deadline, chat_id))
+        self._ensure_flusher()
+        if batch.deadline < self._next_due:
+            self._wake.set()  # flusher is sleeping towards a later deadline
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._wake = asyncio.Event()
+            self._flusher = asyncio.create_task(self._run_flusher(), name="flood-gate-flusher")
+
+    async def _run_flusher(self):
+        while True:
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                deadline, chat_id = heapq.heappop(self._heap)
+                batch = self._buffers.get(chat_id)
+                if batch is None or batch.deadline != deadline:
+                    continue  # superseded by a later message, or already flushed
+                reason = "max_hold" if deadline >= batch.first_at + self.max_hold else "window"
+                await self._flush(chat_id, reason)
+                now = time.monotonic()
+
+            self._next_due = self._heap[0][0] if self._heap else float("inf")
+            self._wake.clear()
+            timeout = None if not self._heap else max(0.0, self._next_due - time.monotonic())
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout)
+
+    async def _flush(self, chat_id: str, reason: str):
         buffer_data = self._buffers.pop(chat_id, None)
-        self._tasks.pop(chat_id, None)
+        if buffer_data is None:
+            return
+        latency_ms = (time.monotonic() - buffer_data.first_at) * 1000
+        self._flushes[reason] += 1
+        self._messages_flushed += len(buffer_data.messages)
+        self._latency_hist[bisect.bisect_left(_LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self._latency_total_ms += latency_ms
+
+        if self._callback:
+            combined_message = "\n\n".join(buffer_data.messages)
+            try:
+                await self._callback(chat_id, combined_message, buffer_data.metadata)
+            except Exception as e:
+                logger.error("FloodGate flush for %s failed: %s", chat_id, e, exc_info=True)
+
+    async def stop(self):
+        """Stop the flusher (buffered batches are dropped, like the in-memory TaskQueue)."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
 
-        if buffer_data and self._callback:
-            combined_message = "\n\n".join(buffer_data["messages"])
-            await self._callback(chat_id, combined_message, buffer_data["metadata"])
+    def get_stats(self) -> dict:
+        flushes = sum(self._flushes.values())
+        labels = [f"le_{b}ms" for b in _LATENCY_BUCKETS_MS] + [f"gt_{_LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "buffered_chats": len(self._buffers),
+            "buffered_messages": sum(len(b.messages) for b in self._buffers.values()),
+            "messages_in": self._messages_in,
+            "flushes": flushes,
+            "flush_reasons": dict(self._flushes),
+            "avg_batch_size": round(self._messages_flushed / flushes, 2) if flushes else 0.0,
+            "avg_flush_latency_ms": round(self._latency_total_ms / flushes, 1) if flushes else 0.0,
+            "flush_latency_ms": dict(zip(labels, self._latency_hist, strict=True)),
+        }
@@ -1,9 +1,57 @@
+"""
+queue.py — Inbound message TaskQueue.
+
+Tasks are ordered by a virtual arrival time: ``enqueued_at + offset`` where the
+offset comes from the chat type (``priority_offset_s``: a group message is
+treated as if it arrived N seconds later than a DM) and the channel
+(``channel_offset_s``).  A DM therefore overtakes a burst of group traffic,
+while a group message that has waited longer than the offset still goes first
+-- aging is built into the key, so nothing starves.
+
+Each task gets a deadline (``deadline_s`` per chat type).  A task that is past
+its deadline when dequeued is dropped (``expired_policy: "drop"``) or moved
+behind all fresh work (``"demote"``); the worker re-checks right before the
+LLM call.  When the queue is full, enqueue never blocks: ``shed_policy``
+sheds the ``"oldest"`` or ``"lowest_priority"`` task -- counting the new
+one, which is rejected if it is that task -- or always rejects the new one
+(``"reject_new"``).
+
+Configure via synapse.json → ``gateway.queue``.
+"""
+
 import asyncio
-import contextlib
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
+_DEFAULTS = {
+    "max_size": 100,
+    "max_history": 500,
+    "shed_policy": "lowest_priority",  # "oldest" | "lowest_priority" | "reject_new"
+    "expired_policy": "drop",  # "drop" | "demote"
+    "priority_offset_s": {"direct": 0, "group": 20},
+    "channel_offset_s": {},
+    "deadline_s": {"direct": 300, "group": 120},
+}
+_SHED_POLICIES = ("oldest", "lowest_priority", "reject_new")
+
+
+def _default_queue_config() -> dict:
+    """Return synapse.json → gateway.queue ({} if unset)."""
+    try:
+        from synapse_config import SynapseConfig
+
+        return SynapseConfig.load().gateway.get("queue", {}) or {}
+    except Exception:
+        return {}
+
 
 class TaskStatus(Enum):
     QUEUED = "queued"
@@ -11,6 +59,8 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     SUPERSEDED = "superseded"
+    EXPIRED = "expired"
+    SHED = "shed"
 
 
 @dataclass
@@ -36,66 +86,168 @@ class MessageTask:
     processing_time_ms: int = 0
     mcp_context: str = ""  # MCP memory enrichment, set by MessageWorker before pipeline
 
+    # Scheduling -- filled in by TaskQueue.enqueue() unless set by the producer
+    priority: float | None = None  # virtual arrival time (time.monotonic() + offset)
+    deadline: float | None = None  # time.monotonic() after which the task is stale
+    demoted: bool = False
+
 
 class TaskQueue:
-    def __init__(self, max_size: int = 100, max_history: int = 500):
-        self._queue = asyncio.Queue(maxsize=max_size)
-        self._active_tasks = {}
-        self._task_history = []
-        self._max_history = max_history
-
-    async def enqueue(self, task: MessageTask):
-        await self._queue.put(task)
+    def __init__(
+        self,
+        max_size: int | None = None,
+        max_history: int | None = None,
+        config: dict | None = None,
+    ):
+        cfg = {**_DEFAULTS, **(_default_queue_config() if config is None else config)}
+        self.max_size = max(1, int(max_size if max_size is not None else cfg["max_size"]))
+        self.shed_policy = cfg["shed_policy"] if cfg["shed_policy"] in _SHED_POLICIES else "oldest"
+        self.expired_policy = cfg["expired_policy"]
+        self._chat_offsets = {**_DEFAULTS["priority_offset_s"], **cfg["priority_offset_s"]}
+        self._channel_offsets = dict(cfg["channel_offset_s"])
+        self._deadlines = {**_DEFAULTS["deadline_s"], **cfg["deadline_s"]}
+
+        # heap of (demoted, priority, seq, task)
+        self._heap: list[tuple[bool, float, int, MessageTask]] = []
+        self._seq = itertools.count()
+        self._not_empty = asyncio.Event()
+        self._active_tasks: dict[str, MessageTask] = {}
+        self._task_history: deque[MessageTask] = deque(
+            maxlen=int(max_history if max_history is not None else cfg["max_history"])
+        )
+        self._counts = {
+            s.value: 0 for s in TaskStatus if s not in (TaskStatus.QUEUED, TaskStatus.PROCESSING)
+        }
+        self._enqueued = 0
+        self._processing_ms_total = 0
+
+    @staticmethod
+    def _chat_type(task: MessageTask) -> str:
+        return "group" if task.is_group else "direct"
+
+    def _push(self, task: MessageTask) -> None:
+        heapq.heappush(self._heap, (task.demoted, task.priority, next(self._seq), task))
+        self._not_empty.set()
+
+    async def enqueue(self, task: MessageTask) -> bool:
+        """Queue *task*; returns False if it was shed instead (queue full and it ranked last)."""
+        now = time.monotonic()
+        chat_type = self._chat_type(task)
+        if task.priority is None:
+            task.priority = (
+                now
+                + float(self._chat_offsets.get(chat_type, 0))
+                + float(self._channel_offsets.get(task.channel_id, 0))
+            )
+        if task.deadline is None and self._deadlines.get(chat_type):
+            task.deadline = now + float(self._deadlines[chat_type])
+        self._enqueued += 1
+
+        if len(self._heap) >= self.max_size:
+            # The newcomer competes too: it is shed when it ranks last itself
+            if self.shed_policy == "reject_new":
+                incoming_loses = True
+            elif self.shed_policy == "oldest":
+                victim = min(self._heap, key=lambda e: e[3].timestamp)
+                incoming_loses = task.timestamp < victim[3].timestamp
+            else:
+                victim = max(self._heap)
+                # Ties go against the newcomer (it would sort after on seq)
+                incoming_loses = (task.demoted, task.priority) >= victim[:2]
+            if incoming_loses:
+                self._shed(task)
+                return False
+            self._heap.remove(victim)
+            heapq.heapify(self._heap)
+            self._shed(victim[3])
+
         self._active_tasks[task.task_id] = task
+        self._push(task)
+        return True
+
+    def _shed(self, task: MessageTask) -> None:
+        logger.warning(
+            "[WARN] TaskQueue full (%d) -- shedding task %s from %s (%s)",
+            self.max_size,
+            task.task_id,
+            task.chat_id,
+            self.shed_policy,
+        )
+        task.status = TaskStatus.SHED
+        task.error = "Shed under load"
+        task.processing_finished = datetime.now()
+        self._archive(task)
 
     async def dequeue(self) -> MessageTask:
-        task = await self._queue.get()
-        task.status = TaskStatus.PROCESSING
-        task.processing_started = datetime.now()
-        return task
-
-    def _safe_task_done(self) -> None:
-        """Call task_done() only if there are outstanding unfinished tasks.
-
-        asyncio.Queue.task_done() raises ValueError if called more times than get().
-        This guard allows _handle_task to be called directly in tests without
-        enqueueing first (CHAN-07 test pattern).
-        """
-        with contextlib.suppress(ValueError):
-            self._queue.task_done()  # task was not obtained via dequeue() — safe to ignore in direct-call tests
+        while True:
+            while not self._heap:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+            task = heapq.heappop(self._heap)[3]
+            if self.is_stale(task):
+                if self.expired_policy == "demote" and not task.demoted:
+                    task.demoted = True
+                    task.deadline = None
+                    self._push(task)
+                else:
+                    self.expire(task)
+                continue
+            task.status = TaskStatus.PROCESSING
+            task.processing_started = datetime.now()
+            return task
+
+    @staticmethod
+    def is_stale(task: MessageTask) -> bool:
+        return task.deadline is not None and time.monotonic() > task.deadline
+
+    def expire(self, task: MessageTask) -> None:
+        """Drop a task whose deadline passed before it reached the LLM."""
+        task.status = TaskStatus.EXPIRED
+        task.error = "Deadline exceeded"
+        task.processing_finished = datetime.now()
+        self._archive(task)
+        logger.info("TaskQueue: task %s for %s expired unprocessed", task.task_id, task.chat_id)
 
     def complete(self, task: MessageTask, result: str = ""):
         task.status = TaskStatus.COMPLETED
         task.response = result
         task.processing_finished = datetime.now()
+        if task.processing_started is not None:
+            task.processing_time_ms = int(
+                (task.processing_finished - task.processing_started).total_seconds() * 1000
+            )
+            self._processing_ms_total += task.processing_time_ms
         self._archive(task)
-        self._safe_task_done()
 
     def fail(self, task: MessageTask, error: str = ""):
         task.status = TaskStatus.FAILED
         task.error = error
         task.processing_finished = datetime.now()
         self._archive(task)
-        self._safe_task_done()
 
     def supersede(self, task: MessageTask):
         """Mark a task as superseded by a newer one for the same chat."""
         task.status = TaskStatus.SUPERSEDED
         task.processing_finished = datetime.now()
         self._archive(task)
-        self._safe_task_done()
 
     def _archive(self, task: MessageTask):
         self._active_tasks.pop(task.task_id, None)
-        self._task_history.append(task)
-        if len(self._task_history) > self._max_history:
-            self._task_history = self._task_history[-self._max_history :]
+        self._task_history.append(task)  # ring buffer: oldest entry falls off
+        self._counts[task.status.value] += 1
 
     @property
     def pending_count(self) -> int:
-        return self._queue.qsize()
+        return len(self._heap)
 
     def get_stats(self) -> dict:
+        completed = self._counts[TaskStatus.COMPLETED.value]
         return {
             "pendingSize": self.pending_count,
+            "maxSize": self.max_size,
+            "shedPolicy": self.shed_policy,
+            "enqueued": self._enqueued,
+            **self._counts,
+            "avgProcessingMs": round(self._processing_ms_total / completed) if completed else 0,
+            "historySize": len(self._task_history),
         }
@@ -1,6 +1,11 @@
 import asyncio
+import heapq
+import itertools
 import logging
+import time
+from collections import deque
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import TypeVar
 
 logger = logging.getLogger(__name__)
@@ -10,48 +15,258 @@ T = TypeVar("T")
 DEFAULT_TIMEOUT_S = 300  # 5 minutes — prevents hung LLM calls from blocking the queue
 
 
+@dataclass
+class _Actor:
+    mailbox: deque = field(default_factory=deque)  # (op, future, enqueued_at, priority)
+    running: bool = False
+    ready: bool = False  # waiting in the ready heap for a free slot
+    ready_since: float = 0.0  # when the actor last started needing a slot
+    slot: int = -1
+    processed: int = 0
+    last_wait_ms: float = 0.0
+
+
+@dataclass
+class _Slot:
+    since: float = field(default_factory=time.monotonic)
+    busy_s: float = 0.0
+    ops: int = 0
+    op_started: float | None = None
+
+    def busy(self, now: float) -> float:
+        return self.busy_s + (now - self.op_started if self.op_started is not None else 0.0)
+
+
 class SessionActorQueue:
     """Per-actor FIFO: same actor_key serialized, different keys concurrent.
 
-    Uses dict[str, asyncio.Lock] instead of promise-chain.  Each actor_key
-    gets its own asyncio.Lock.  Operations on the same key are serialized by
-    acquiring the lock.  Operations on different keys run concurrently
-    (different locks).  All ops are wrapped in asyncio.wait_for() with a
-    configurable timeout to prevent hung calls from permanently blocking
-    the queue.
+    Each actor_key owns a mailbox of pending ops and at most one driver task,
+    so ops on the same key run strictly in submission order.  At most
+    ``max_active`` keys run at once (None = unbounded); keys waiting for a
+    slot sit in a ready heap ordered by the priority of their next op
+    (lower first; defaults to submission time, i.e. FIFO).  An actor that
+    still has work after an op gives its slot back and re-enters the heap
+    with its next op's priority, so a chatty session gets one op per turn
+    and a higher-priority session (e.g. a DM behind a group burst) goes
+    next.  All ops are wrapped in asyncio.wait_for() with a configurable
+    timeout to prevent hung calls from permanently blocking the queue.
+
+    Slots are numbered (lowest free id first) and keep busy-time counters,
+    and the time each actor waits for a slot is sampled -- the signals the
+    WorkerAutoscaler uses to resize ``max_active``.
     """
 
-    def __init__(self, timeout: float = DEFAULT_TIMEOUT_S) -> None:
-        self._locks: dict[str, asyncio.Lock] = {}
-        self._pending: dict[str, int] = {}  # actor_key -> count of queued ops
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT_S, max_active: int | None = None) -> None:
+        self._actors: dict[str, _Actor] = {}
+        self._ready: list[tuple[float, int, str]] = []  # (priority, seq, actor_key)
+        self._seq = itertools.count()
+        self._drivers: set[asyncio.Task] = set()
         self._timeout = timeout
+        self.max_active = max_active
+        self._active = 0
+        self._closed = False
+        self._processed = 0
+        self._timeouts = 0
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+        self._slots: dict[int, _Slot] = {}
+        self._busy_slots: set[int] = set()
+        self._slot_waits: deque[tuple[float, float]] = deque(maxlen=512)  # (at, wait_ms)
+
+    def submit(
+        self, actor_key: str, op: Callable[[], Awaitable[T]], priority: float | None = None
+    ) -> "asyncio.Future[T]":
+        """Queue *op* on *actor_key*'s mailbox; the returned future resolves with its result.
+
+        *priority* (lower runs first, on the time.monotonic() scale) orders
+        this op's session against other sessions waiting for a slot.
+        """
+        fut = asyncio.get_running_loop().create_future()
+        now = time.monotonic()
+        actor = self._actors.get(actor_key)
+        if actor is None:
+            actor = self._actors[actor_key] = _Actor()
+        actor.mailbox.append((op, fut, now, now if priority is None else priority))
+        if not actor.running and not actor.ready:
+            actor.ready_since = now
+            if self._has_slot():
+                self._start(actor_key, actor)
+            else:
+                self._make_ready(actor_key, actor)
+        return fut
+
+    def _make_ready(self, actor_key: str, actor: _Actor) -> None:
+        actor.ready = True
+        heapq.heappush(self._ready, (actor.mailbox[0][3], next(self._seq), actor_key))
 
     async def run(self, actor_key: str, op: Callable[[], Awaitable[T]]) -> T:
         """Execute *op* serialized per *actor_key*, concurrent across different keys."""
-        # Lazily create lock for this actor_key
-        if actor_key not in self._locks:
-            self._locks[actor_key] = asyncio.Lock()
-        lock = self._locks[actor_key]
+        return await self.submit(actor_key, op)
+
+    def _has_slot(self) -> bool:
+        return not self._closed and (self.max_active is None or self._active < self.max_active)
 
-        self._pending[actor_key] = self._pending.get(actor_key, 0) + 1
+    def _start(self, actor_key: str, actor: _Actor) -> None:
+        now = time.monotonic()
+        actor.running = True
+        actor.slot = next(i for i in itertools.count() if i not in self._busy_slots)
+        self._busy_slots.add(actor.slot)
+        self._slots.setdefault(actor.slot, _Slot())
+        self._slot_waits.append((now, (now - actor.ready_since) * 1000))
+        self._active += 1
+        driver = asyncio.create_task(self._drive(actor_key, actor), name=f"actor-{actor_key}")
+        self._drivers.add(driver)
+        driver.add_done_callback(self._drivers.discard)
+
+    def _fill(self) -> None:
+        """Hand free slots to waiting actors, highest priority (lowest value) first."""
+        while self._ready and self._has_slot():
+            actor_key = heapq.heappop(self._ready)[2]
+            actor = self._actors[actor_key]
+            actor.ready = False
+            self._start(actor_key, actor)
+
+    async def _drive(self, actor_key: str, actor: _Actor) -> None:
         try:
-            async with lock:
-                return await asyncio.wait_for(op(), timeout=self._timeout)
-        except TimeoutError:
-            logger.warning(
-                "SessionActorQueue: op for %s timed out after %.1fs",
-                actor_key,
-                self._timeout,
-            )
-            raise
+            while actor.mailbox:
+                op, fut, enqueued_at, _priority = actor.mailbox.popleft()
+                if fut.cancelled():
+                    continue
+                wait_ms = (time.monotonic() - enqueued_at) * 1000
+                actor.last_wait_ms = wait_ms
+                self._wait_total_ms += wait_ms
+                self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+                slot = self._slots[actor.slot]
+                slot.op_started = time.monotonic()
+                try:
+                    result = await asyncio.wait_for(op(), timeout=self._timeout)
+                except TimeoutError as e:
+                    self._timeouts += 1
+                    logger.warning(
+                        "SessionActorQueue: op for %s timed out after %.1fs",
+                        actor_key,
+                        self._timeout,
+                    )
+                    if not fut.done():
+                        fut.set_exception(e)
+                except asyncio.CancelledError:
+                    if not fut.done():
+                        fut.cancel()
+                    raise
+                except Exception as e:
+                    if not fut.done():
+                        fut.set_exception(e)
+                else:
+                    if not fut.done():
+                        fut.set_result(result)
+                finally:
+                    slot.busy_s += time.monotonic() - slot.op_started
+                    slot.op_started = None
+                    slot.ops += 1
+                actor.processed += 1
+                self._processed += 1
+                if actor.mailbox and self._ready:
+                    # Others are waiting for a slot: compete with them for the next turn
+                    actor.ready_since = time.monotonic()
+                    self._make_ready(actor_key, actor)
+                    break
         finally:
-            self._pending[actor_key] -= 1
-            if self._pending[actor_key] <= 0:
-                self._pending.pop(actor_key, None)
-                self._locks.pop(actor_key, None)
+            actor.running = False
+            self._busy_slots.discard(actor.slot)
+            self._active -= 1
+            if not actor.mailbox and not actor.ready:
+                self._actors.pop(actor_key, None)
+            self._fill()
+
+    def set_max_active(self, max_active: int | None) -> None:
+        """Resize the slot pool; extra slots are handed out immediately.
+
+        Shrinking never interrupts a running op -- surplus actors release
+        their slot when their current op finishes.
+        """
+        self.max_active = max_active
+        if max_active is not None:
+            for slot_id in [
+                i for i in self._slots if i >= max_active and i not in self._busy_slots
+            ]:
+                del self._slots[slot_id]
+        self._fill()
+
+    @property
+    def waiting_sessions(self) -> int:
+        return len(self._ready)
+
+    def busy_seconds(self) -> float:
+        """Total time all slots have spent running ops (including ops in progress)."""
+        now = time.monotonic()
+        return sum(slot.busy(now) for slot in self._slots.values())
+
+    def slot_wait_percentile(self, pct: float, window_s: float) -> float:
+        """*pct*-th percentile (ms) of slot waits started in the last *window_s*.
+
+        Actors still waiting count with their wait so far, so a stalled pool
+        shows up before anything gets a slot.
+        """
+        now = time.monotonic()
+        waits = [w for at, w in self._slot_waits if now - at <= window_s]
+        waits += [(now - self._actors[k].ready_since) * 1000 for _p, _s, k in self._ready]
+        if not waits:
+            return 0.0
+        waits.sort()
+        return waits[min(len(waits) - 1, int(len(waits) * pct / 100))]
+
+    async def close(self) -> None:
+        """Cancel running ops and drop everything still queued."""
+        self._closed = True
+        for actor in self._actors.values():
+            for _op, fut, _t, _p in actor.mailbox:
+                fut.cancel()
+            actor.mailbox.clear()
+        self._ready.clear()
+        drivers = list(self._drivers)
+        for driver in drivers:
+            driver.cancel()
+        await asyncio.gather(*drivers, return_exceptions=True)
+        self._actors.clear()
 
     def get_total_pending_count(self) -> int:
-        return sum(self._pending.values())
+        return sum(len(a.mailbox) + a.running for a in self._actors.values())
 
     def get_pending_count_for_session(self, actor_key: str) -> int:
-        return self._pending.get(actor_key, 0)
+        actor = self._actors.get(actor_key)
+        return len(actor.mailbox) + actor.running if actor else 0
+
+    def get_stats(self) -> dict:
+        now = time.monotonic()
+        sessions = {
+            key: {
+                "depth": len(a.mailbox),
+                "running": a.running,
+                "processed": a.processed,
+                "last_wait_ms": round(a.last_wait_ms, 1),
+                "oldest_wait_ms": round((now - a.mailbox[0][2]) * 1000, 1) if a.mailbox else 0.0,
+            }
+            for key, a in self._actors.items()
+        }
+        return {
+            "active": self._active,
+            "max_active": self.max_active,
+            "waiting_sessions": len(self._ready),
+            "queued": sum(s["depth"] for s in sessions.values()),
+            "processed": self._processed,
+            "timeouts": self._timeouts,
+            "avg_wait_ms": (
+                round(self._wait_total_ms / self._processed, 1) if self._processed else 0.0
+            ),
+            "max_wait_ms": round(self._wait_max_ms, 1),
+            "slots": {
+                slot_id: {
+                    "busy": slot_id in self._busy_slots,
+                    "ops": slot.ops,
+                    "busy_s": round(slot.busy(now), 2),
+                    "utilization": round(slot.busy(now) / max(now - slot.since, 1e-9), 3),
+                }
+                for slot_id, slot in sorted(self._slots.items())
+            },
+            "sessions": sessions,
+        }
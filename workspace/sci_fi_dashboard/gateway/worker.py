@@ -1,14 +1,16 @@
 import asyncio
 import contextlib
+import functools
 import inspect
 import logging
 import time
 from collections.abc import Awaitable, Callable
 
-from .queue import MessageTask, TaskQueue
+from .queue import MessageTask, TaskQueue, TaskStatus
 from .sender import (
     WhatsAppSender,  # kept for backwards-compat constructor param; Phase 4 removes it
 )
+from .session_actor import SessionActorQueue
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,14 @@ class MessageWorker:
     """
     Background worker pulling from the task queue.
     Dispatches outbound messages via ChannelRegistry (CHAN-07) — no channel-specific branching.
+
+    A single dispatcher drains the TaskQueue into per-session actors
+    (SessionActorQueue): messages of one session run in order, one at a time,
+    while up to ``num_workers`` sessions run concurrently.  Sessions waiting
+    for a slot are served by their next task's TaskQueue priority, so a DM
+    still overtakes group traffic already handed to the actors.  At most
+    ``max_buffered`` tasks sit in actor mailboxes, so the TaskQueue bound
+    still applies backpressure upstream.
     """
 
     def __init__(
@@ -49,6 +59,8 @@ class MessageWorker:
         sender: WhatsAppSender | None = None,  # deprecated; kept for compat
         channel_registry=None,  # ChannelRegistry — preferred dispatch path
         mcp_client=None,  # SynapseMCPClient — optional MCP context gathering
+        actors: SessionActorQueue | None = None,
+        max_buffered: int = 64,
     ):
         self.queue = queue
         self.sender = sender  # fallback if no channel_registry or channel not found
@@ -63,12 +75,14 @@ class MessageWorker:
         except (ValueError, TypeError):
             self._process_fn_accepts_mcp = False
         self.num_workers = num_workers
+        self.actors = actors if actors is not None else SessionActorQueue()
+        self.actors.set_max_active(num_workers)
+        self._buffer = asyncio.Semaphore(max(1, max_buffered))
         self._workers: list[asyncio.Task] = []
         self._running = False
 
-        # PER-CHAT GENERATION TRACKING
+        # PER-CHAT GENERATION TRACKING (assigned at dispatch, single event loop -- no lock)
         self._chat_generations: dict[str, int] = {}
-        self._gen_lock = asyncio.Lock()
 
     def _get_channel(self, task):
         """
@@ -86,10 +100,8 @@ class MessageWorker:
 
     async def start(self):
         self._running = True
-        for i in range(self.num_workers):
-            task = asyncio.create_task(self._worker_loop(i), name=f"msg-worker-{i}")
-            self._workers.append(task)
-        logger.info("Started %d workers", self.num_workers)
+        self._workers.append(asyncio.create_task(self._dispatch_loop(), name="msg-dispatcher"))
+        logger.info("Started dispatcher (%d concurrent sessions)", self.num_workers)
 
     async def stop(self):
         self._running = False
@@ -97,31 +109,71 @@ class MessageWorker:
             w.cancel()
         await asyncio.gather(*self._workers, return_exceptions=True)
         self._workers.clear()
+        await self.actors.close()
         logger.info("All workers stopped")
 
-    async def _worker_loop(self, worker_id: int):
+    @staticmethod
+    def _actor_key(task: MessageTask) -> str:
+        return task.session_key or f"{task.channel_id}:{task.chat_id}"
+
+    def _next_generation(self, chat_id: str) -> int:
+        gen = self._chat_generations.get(chat_id, 0) + 1
+        self._chat_generations[chat_id] = gen
+        return gen
+
+    async def _dispatch_loop(self):
         while self._running:
             try:
+                await self._buffer.acquire()
                 task = await self.queue.dequeue()
-                await self._handle_task(task, worker_id)
             except asyncio.CancelledError:
                 break
+            try:
+                # Numbered on arrival, so a reply is dropped once a newer message
+                # for the chat is already queued behind it
+                task.generation = self._next_generation(task.chat_id)
+                key = self._actor_key(task)
+                # Demoted (stale) tasks only get a slot when nothing fresh is waiting
+                priority = float("inf") if task.demoted else task.priority
+                fut = self.actors.submit(
+                    key, functools.partial(self._handle_task, task, key), priority=priority
+                )
+                fut.add_done_callback(functools.partial(self._on_task_done, task))
             except Exception as e:
-                logger.error("Worker-%d loop error: %s", worker_id, e, exc_info=True)
-                await asyncio.sleep(1)
+                self._buffer.release()
+                self.queue.fail(task, str(e))
+                logger.error("Dispatcher error: %s", e, exc_info=True)
 
-    async def _handle_task(self, task: MessageTask, worker_id: int):
+    def _on_task_done(self, task: MessageTask, fut: asyncio.Future) -> None:
+        self._buffer.release()
+        if fut.cancelled():
+            return
+        exc = fut.exception()
+        if exc is not None and task.status is TaskStatus.PROCESSING:
+            self.queue.fail(task, "Timed out" if isinstance(exc, TimeoutError) else str(exc))
+
+    def resize(self, num_workers: int) -> None:
+        """Change how many sessions may run concurrently (see WorkerAutoscaler)."""
+        self.num_workers = max(1, num_workers)
+        self.actors.set_max_active(self.num_workers)
+
+    def get_stats(self) -> dict:
+        return {"num_workers": self.num_workers, **self.actors.get_stats()}
+
+    async def _handle_task(self, task: MessageTask, worker_id: int | str):
         chat_id = task.chat_id
         start_time = time.time()
 
-        async with self._gen_lock:
-            current = self._chat_generations.get(chat_id, 0)
-            new_gen = current + 1
-            self._chat_generations[chat_id] = new_gen
-            task.generation = new_gen
+        if not task.generation:  # called directly, not through the dispatcher
+            task.generation = self._next_generation(chat_id)
+
+        # Deadline re-check: the task may have aged out while waiting in its mailbox
+        if self.queue.is_stale(task) and self.queue.expired_policy == "drop":
+            self.queue.expire(task)
+            return
 
         logger.info(
-            'Worker-%d gen=%d Processing: "%.60s..." from %s',
+            'Worker[%s] gen=%d Processing: "%.60s..." from %s',
             worker_id,
             task.generation,
             task.user_message,
@@ -129,6 +181,7 @@ class MessageWorker:
         )
 
         channel = self._get_channel(task)
+        typing_task = None
 
         try:
             # STEP 1: Mark read (blue ticks)
@@ -137,7 +190,7 @@ class MessageWorker:
             elif task.message_id and self.sender:
                 await self.sender.send_seen(chat_id, task.message_id)
 
-            # STEP 2: Typing indicator
+            # STEP 2: Typing indicator (stopped in finally, also on error / timeout)
             typing_task = asyncio.create_task(self._keep_typing(chat_id, channel))
 
             # STEP 4: The actual pipeline (SBS + RAG + LLM)
@@ -154,13 +207,12 @@ class MessageWorker:
                 await typing_task
 
             # STEP 6: Check if still the latest generation before sending
-            async with self._gen_lock:
-                latest_gen = self._chat_generations.get(chat_id, task.generation)
+            latest_gen = self._chat_generations.get(chat_id, task.generation)
 
             if task.generation != latest_gen:
                 self.queue.supersede(task)
                 logger.info(
-                    "Worker-%d gen=%d superseded by gen=%d for chat %s, dropping",
+                    "Worker[%s] gen=%d superseded by gen=%d for chat %s, dropping",
                     worker_id,
                     task.generation,
                     latest_gen,
@@ -178,7 +230,7 @@ class MessageWorker:
                         ok = await channel.send(chat_id, chunk)
                         if not ok:
                             logger.warning(
-                                "Worker-%d channel.send() failed on chunk %d",
+                                "Worker[%s] channel.send() failed on chunk %d",
                                 worker_id,
                                 i + 1,
                             )
@@ -198,14 +250,16 @@ class MessageWorker:
                 elif self.sender:
                     success = await self.sender.send_long_message(target=chat_id, message=response)
                 else:
-                    logger.warning("Worker-%d no channel or sender -- dropping response", worker_id)
+                    logger.warning(
+                        "Worker[%s] no channel or sender -- dropping response", worker_id
+                    )
                     success = False
 
                 processing_time_ms = int((time.time() - start_time) * 1000)
                 if success:
                     self.queue.complete(task, response)
                     logger.info(
-                        "Worker-%d gen=%d delivered in %dms",
+                        "Worker[%s] gen=%d delivered in %dms",
                         worker_id,
                         task.generation,
                         processing_time_ms,
@@ -218,13 +272,12 @@ class MessageWorker:
         except Exception as e:
             error_msg = str(e)
 
-            async with self._gen_lock:
-                latest_gen = self._chat_generations.get(chat_id, task.generation)
+            latest_gen = self._chat_generations.get(chat_id, task.generation)
 
             if task.generation != latest_gen:
                 self.queue.supersede(task)
                 logger.info(
-                    "Worker-%d gen=%d error after superseded by gen=%d for %s, dropping",
+                    "Worker[%s] gen=%d error after superseded by gen=%d for %s, dropping",
                     worker_id,
                     task.generation,
                     latest_gen,
@@ -233,7 +286,7 @@ class MessageWorker:
                 return
 
             self.queue.fail(task, error_msg)
-            logger.error("Worker-%d task failed: %s", worker_id, error_msg, exc_info=True)
+            logger.error("Worker[%s] task failed: %s", worker_id, error_msg, exc_info=True)
 
             # Notify user of error (ASCII-safe for Windows cp1252)
             warn_msg = "[WARN] A technical glitch occurred. Please try again."
@@ -241,6 +294,9 @@ class MessageWorker:
                 await channel.send(chat_id, warn_msg)
             elif self.sender:
                 await self.sender.send_text(chat_id, warn_msg)
+        finally:
+            if typing_task is not None and not typing_task.done():
+                typing_task.cancel()
 
     async def _keep_typing(self, chat_id: str, channel=None):
         """Resend typing indicator every 4s to keep it alive."""
@@ -627,9 +627,9 @@ class GatewayWebSocket:
             channel_id=params.get("channel_id", "websocket"),
             session_key=params.get("session_key", ""),
         )
-        await self._task_queue.enqueue(task)
+        accepted = await self._task_queue.enqueue(task)
 
-        return {"task_id": task.task_id, "status": "queued"}
+        return {"task_id": task.task_id, "status": "queued" if accepted else "shed"}
 
     async def _handle_channels_status(self, params: dict) -> dict:
         """Return status of all registered channel adapters."""
@@ -4,6 +4,7 @@ import time
 import psutil
 import schedule
 
+from .graph_compaction import GraphCompactor
 from .sqlite_graph import SQLiteGraph
 
 
@@ -22,6 +23,7 @@ class GentleWorker:
     ):
         self.is_running = True
         self.graph = graph or SQLiteGraph()
+        self.compactor = GraphCompactor(self.graph)
         self.cron_service = cron_service
         self.proactive_engine = proactive_engine
         self.channel_registry = channel_registry
@@ -65,12 +67,13 @@ class GentleWorker:
             print(f"Skipping DB Optimize: {reason}")
             return
 
-        print("[PKG] Optimizing databases (VACUUM)...")
+        if not self.compactor.due():
+            return
+
+        print("[PKG] Compacting knowledge graph (decay, evidence, VACUUM)...")
         try:
-            conn = self.graph._conn()
-            conn.execute("VACUUM")
-            conn.close()
-            print("[OK] Database optimized")
+            report = self.compactor.run()
+            print(f"[OK] Database optimized ({report['reclaimed_bytes']} bytes reclaimed)")
         except Exception as e:
             print(f"[WARN] DB optimization failed: {e}")
 
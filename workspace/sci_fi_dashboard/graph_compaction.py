@@ -0,0 +1,420 @@
+"""
+graph_compaction.py — Periodic compaction pass for knowledge_graph.db.
+
+prune_weak_edges() only drops edges below a fixed weight, while every
+re-observation appends ``' | ' || evidence`` to the edge row, so hot edges
+grow without bound and every neighborhood read drags the text along.
+GraphCompactor.run() does, in one write transaction:
+
+1. merge nodes whose names normalize to the same entity ("Alice" /
+   "alice" / "Dr. Alice") into one canonical node, re-pointing their edges;
+2. fold appended evidence into ``edge_evidence`` (one row per distinct
+   snippet with an observation count), keeping the ``evidence_per_edge``
+   most observed snippets per edge and clearing the edge column;
+3. decay edge weights exponentially by time since the edge was last
+   observed (``half_life_days``) and delete edges that fall below
+   ``min_weight``;
+
+then releases free pages with incremental VACUUM (converting older files to
+``auto_vacuum=INCREMENTAL`` with one full VACUUM) and truncates the WAL.
+The report includes reclaimed bytes and SQL neighborhood read latency
+measured before and after.
+
+Configured under synapse.json → ``memory.graph.compaction``; driven from
+gentle_worker_loop every ``interval_hours``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import statistics
+import time
+from collections import Counter, defaultdict
+
+logger = logging.getLogger(__name__)
+
+_DEFAULTS = {
+    "enabled": True,
+    "interval_hours": 24,
+    "half_life_days": 90,  # weight halves for every 90 days an edge goes unobserved
+    "min_weight": 0.1,  # same floor as prune_weak_edges()
+    "evidence_per_edge": 20,
+    "evidence_max_chars": 300,
+    "merge_duplicates": True,
+    "latency_samples": 20,  # highest-degree nodes timed before/after
+}
+_LATENCY_HOPS = 2
+_META_KEY = "last_compaction"
+
+_MERGE_EDGE_SQL = """INSERT INTO edges
+       (source, target, relation, weight, evidence, created_at, updated_at, decayed_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(source, target, relation) DO UPDATE SET
+       weight = MAX(COALESCE(weight, 0), COALESCE(excluded.weight, 0)),
+       evidence = CASE
+           WHEN COALESCE(excluded.evidence, '') = '' THEN evidence
+           WHEN COALESCE(evidence, '') = '' THEN excluded.evidence
+           ELSE evidence || ' | ' || excluded.evidence
+       END,
+       created_at = MIN(COALESCE(created_at, excluded.created_at),
+                        COALESCE(excluded.created_at, created_at)),
+       updated_at = NULLIF(MAX(COALESCE(updated_at, 0), COALESCE(excluded.updated_at, 0)), 0),
+       decayed_at = NULLIF(MAX(COALESCE(decayed_at, 0), COALESCE(excluded.decayed_at, 0)), 0)"""
+_UPSERT_EVIDENCE_SQL = """INSERT INTO edge_evidence
+       (source, target, relation, evidence, count, last_seen)
+   VALUES (?, ?, ?, ?, ?, ?)
+   ON CONFLICT(source, target, relation, evidence) DO UPDATE SET
+       count = count + excluded.count,
+       last_seen = MAX(COALESCE(last_seen, 0), COALESCE(excluded.last_seen, 0))"""
+
+
+def _compaction_config() -> dict:
+    try:
+        from synapse_config import SynapseConfig  # noqa: PLC0415
+
+        graph_cfg = SynapseConfig.load().memory.get("graph", {})
+        return {**_DEFAULTS, **graph_cfg.get("compaction", {})}
+    except Exception:
+        return dict(_DEFAULTS)
+
+
+def _file_bytes(db_path: str) -> int:
+    """Size of the database file plus its WAL."""
+    return sum(os.path.getsize(p) for p in (db_path, db_path + "-wal") if os.path.exists(p))
+
+
+class GraphCompactor:
+    """Decay, evidence folding, duplicate merging and VACUUM for one SQLiteGraph."""
+
+    def __init__(self, graph, config: dict | None = None) -> None:
+        self._graph = graph
+        self._config = config
+        self.runs = 0
+        self.last_report: dict | None = None
+
+    @property
+    def config(self) -> dict:
+        return {**_DEFAULTS, **self._config} if self._config is not None else _compaction_config()
+
+    # -- Scheduling --
+
+    def _last_run_at(self) -> float | None:
+        report = self.last_report or self._load_report()
+        return report.get("finished_at") if report else None
+
+    def _load_report(self) -> dict | None:
+        try:
+            row = (
+                self._graph._conn()
+                .execute("SELECT value FROM graph_meta WHERE key = ?", (_META_KEY,))
+                .fetchone()
+            )
+            return json.loads(row[0]) if row else None
+        except Exception:
+            return None
+
+    def due(self) -> bool:
+        cfg = self.config
+        if not cfg["enabled"]:
+            return False
+        last = self._last_run_at()
+        return last is None or time.time() - last >= float(cfg["interval_hours"]) * 3600
+
+    # -- Pass --
+
+    def run(self) -> dict:
+        """Run one full compaction pass and return its report."""
+        cfg = self.config
+        graph = self._graph
+        started = time.time()
+        seeds = self._latency_seeds(int(cfg["latency_samples"]))
+        latency_before = self._read_latency(seeds)
+        bytes_before = _file_bytes(graph.db_path)
+
+        report: dict = {"started_at": started}
+        conn = graph._create_conn()
+        try:
+            with graph._write_lock:
+                try:
+                    merged = self._merge_duplicates(conn) if cfg["merge_duplicates"] else {}
+                    report["merged_nodes"] = len(merged)
+                    report.update(
+                        self._fold_evidence(
+                            conn, int(cfg["evidence_per_edge"]), int(cfg["evidence_max_chars"])
+                        )
+                    )
+                    report.update(
+                        self._decay(conn, float(cfg["half_life_days"]), float(cfg["min_weight"]))
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    graph.invalidate_cache()
+                report.update(self._vacuum(conn))
+        finally:
+            conn.close()
+
+        # Point the entity gate (and any other listener) at the surviving names
+        if merged:
+            graph._notify(set(merged.values()), removed=set(merged))
+
+        bytes_after = _file_bytes(graph.db_path)
+        latency_after = self._read_latency([merged.get(s, s) for s in seeds])
+        report.update(
+            bytes_before=bytes_before,
+            bytes_after=bytes_after,
+            reclaimed_bytes=bytes_before - bytes_after,
+            read_latency_ms={"before": latency_before, "after": latency_after},
+            duration_s=round(time.time() - started, 2),
+            finished_at=time.time(),
+        )
+        self._save_report(report)
+        self.runs += 1
+        self.last_report = report
+        logger.info(
+            "[GRAPH] Compacted: merged %d nodes, folded %d evidence rows, decayed %d edges,"
+            " pruned %d, reclaimed %d bytes, p50 read %.2fms -> %.2fms",
+            report["merged_nodes"],
+            report["evidence_folded"],
+            report["decayed_edges"],
+            report["pruned_edges"],
+            report["reclaimed_bytes"],
+            latency_before["p50"],
+            latency_after["p50"],
+        )
+        return report
+
+    def _merge_duplicates(self, conn) -> dict[str, str]:
+        """Fold nodes that normalize to the same entity into one; returns {old: canonical}."""
+        from sci_fi_dashboard.conv_kg_extractor import _normalize_entity  # noqa: PLC0415
+
+        groups: dict[str, list[str]] = defaultdict(list)
+        for (name,) in conn.execute("SELECT name FROM nodes"):
+            key = _normalize_entity(name)
+            if key:
+                groups[key].append(name)
+
+        mapping: dict[str, str] = {}
+        for key, names in groups.items():
+            if len(names) < 2:
+                continue
+            if key in names:
+                canonical = key
+            else:
+                # Keep the best-connected spelling
+                canonical = max(
+                    names,
+                    key=lambda n: conn.execute(
+                        "SELECT COUNT(*) FROM edges WHERE source = ? OR target = ?", (n, n)
+                    ).fetchone()[0],
+                )
+            for name in names:
+                if name != canonical:
+                    mapping[name] = canonical
+        if not mapping:
+            return mapping
+
+        old = list(mapping)
+        placeholders = ",".join("?" * len(old))
+        edges = conn.execute(
+            f"""SELECT source, target, relation, weight, evidence, created_at, updated_at,
+                       decayed_at
+                FROM edges WHERE source IN ({placeholders}) OR target IN ({placeholders})""",
+            old + old,
+        ).fetchall()
+        evidence = conn.execute(
+            f"""SELECT source, target, relation, evidence, count, last_seen FROM edge_evidence
+                WHERE source IN ({placeholders}) OR target IN ({placeholders})""",
+            old + old,
+        ).fetchall()
+        conn.execute(
+            f"DELETE FROM edges WHERE source IN ({placeholders}) OR target IN ({placeholders})",
+            old + old,
+        )
+        conn.execute(
+            f"DELETE FROM edge_evidence"
+            f" WHERE source IN ({placeholders}) OR target IN ({placeholders})",
+            old + old,
+        )
+
+        def _remap(row) -> tuple | None:
+            source = mapping.get(row[0], row[0])
+            target = mapping.get(row[1], row[1])
+            # "Alice knows alice" collapses into a self-loop -- drop it
+            return None if source == target else (source, target, *tuple(row)[2:])
+
+        conn.executemany(_MERGE_EDGE_SQL, [r for r in map(_remap, edges) if r])
+        conn.executemany(_UPSERT_EVIDENCE_SQL, [r for r in map(_remap, evidence) if r])
+
+        # Canonical node keeps its type/properties, filling gaps from the merged ones
+        for canonical, names in _invert(mapping).items():
+            group = [*names, canonical]  # canonical last so its values win
+            rows = {
+                r[0]: r
+                for r in conn.execute(
+                    f"SELECT name, type, properties FROM nodes"
+                    f" WHERE name IN ({','.join('?' * len(group))})",
+                    group,
+                )
+            }
+            props: dict = {}
+            node_type = "entity"
+            for name in group:
+                row = rows.get(name)
+                if row is None:
+                    continue
+                with contextlib.suppress(ValueError):
+                    props.update(json.loads(row[2] or "{}"))
+                if row[1] and row[1] != "entity":
+                    node_type = row[1]
+            conn.execute(
+                "UPDATE nodes SET type = ?, properties = ?, updated_at = ? WHERE name = ?",
+                (node_type, json.dumps(props), time.time(), canonical),
+            )
+        conn.execute(f"DELETE FROM nodes WHERE name IN ({placeholders})", old)
+        return mapping
+
+    @staticmethod
+    def _fold_evidence(conn, per_edge: int, max_chars: int) -> dict:
+        """Move appended edge evidence into edge_evidence counts."""
+        rows = conn.execute("""SELECT rowid, source, target, relation, evidence,
+                      COALESCE(updated_at, created_at) AS seen
+               FROM edges WHERE COALESCE(evidence, '') != ''""").fetchall()
+        folded = []
+        for _, source, target, relation, text, seen in rows:
+            counts = Counter(s.strip()[:max_chars] for s in text.split(" | ") if s.strip())
+            folded.extend(
+                (source, target, relation, snippet, n, seen) for snippet, n in counts.items()
+            )
+        conn.executemany(_UPSERT_EVIDENCE_SQL, folded)
+        conn.executemany("UPDATE edges SET evidence = '' WHERE rowid = ?", [(r[0],) for r in rows])
+        dropped = conn.execute(
+            """DELETE FROM edge_evidence WHERE rowid IN (
+                   SELECT rowid FROM (
+                       SELECT rowid, ROW_NUMBER() OVER (
+                           PARTITION BY source, target, relation
+                           ORDER BY count DESC, last_seen DESC
+                       ) AS rn
+                       FROM edge_evidence
+                   ) WHERE rn > ?
+               )""",
+            (per_edge,),
+        ).rowcount
+        return {"evidence_folded": len(folded), "evidence_dropped": dropped}
+
+    @staticmethod
+    def _decay(conn, half_life_days: float, min_weight: float) -> dict:
+        """Halve weights per half-life since last observation; prune what falls below the floor."""
+        now = time.time()
+        updates = []
+        if half_life_days > 0:
+            half_life_s = half_life_days * 86400
+            rows = conn.execute(
+                "SELECT rowid, weight, COALESCE(updated_at, created_at), decayed_at FROM edges"
+            ).fetchall()
+            for rowid, weight, seen, decayed_at in rows:
+                # Decay only the interval not already applied by an earlier pass
+                since = max(seen or now, decayed_at or 0)
+                elapsed = now - since
+                if elapsed <= 0 or weight is None:
+                    if decayed_at is None:
+                        updates.append((weight, now, rowid))
+                    continue
+                updates.append((weight * 0.5 ** (elapsed / half_life_s), now, rowid))
+            conn.executemany("UPDATE edges SET weight = ?, decayed_at = ? WHERE rowid = ?", updates)
+        pruned = conn.execute("DELETE FROM edges WHERE weight < ?", (min_weight,)).rowcount
+        orphaned = conn.execute("""DELETE FROM edge_evidence WHERE NOT EXISTS (
+                   SELECT 1 FROM edges e
+                   WHERE e.source = edge_evidence.source
+                     AND e.target = edge_evidence.target
+                     AND e.relation = edge_evidence.relation
+               )""").rowcount
+        return {
+            "decayed_edges": len(updates),
+            "pruned_edges": pruned,
+            "evidence_orphaned": orphaned,
+        }
+
+    @staticmethod
+    def _vacuum(conn) -> dict:
+        """Release free pages to the OS and truncate the WAL."""
+        freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        result = {"freelist_pages": freelist, "vacuum": "incremental"}
+        try:
+            if mode != 2:
+                # auto_vacuum can only be switched on by rebuilding the file once
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+                result["vacuum"] = "full (converted to incremental)"
+            else:
+                # execute() steps the pragma once, which frees a single page
+                conn.executescript("PRAGMA incremental_vacuum")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except Exception as e:
+            result["vacuum"] = f"failed: {e}"
+        return result
+
+    # -- Measurement --
+
+    def _latency_seeds(self, limit: int) -> list[str]:
+        rows = (
+            self._graph._conn()
+            .execute(
+                """SELECT name FROM (
+                       SELECT source AS name FROM edges
+                       UNION ALL
+                       SELECT target FROM edges
+                   ) GROUP BY name ORDER BY COUNT(*) DESC LIMIT ?""",
+                (limit,),
+            )
+            .fetchall()
+        )
+        return [r[0] for r in rows]
+
+    def _read_latency(self, seeds: list[str]) -> dict:
+        """Per-entity SQL neighborhood latency (ms); bypasses the adjacency cache."""
+        if not seeds:
+            return {"p50": 0.0, "max": 0.0, "samples": 0}
+        query = self._graph._query_neighborhoods
+        for seed in seeds:  # warm the page cache so before/after compare like for like
+            query([seed], _LATENCY_HOPS, 50)
+        timings = []
+        for seed in seeds:
+            start = time.perf_counter()
+            query([seed], _LATENCY_HOPS, 50)
+            timings.append((time.perf_counter() - start) * 1000)
+        return {
+            "p50": round(statistics.median(timings), 3),
+            "max": round(max(timings), 3),
+            "samples": len(timings),
+        }
+
+    def _save_report(self, report: dict) -> None:
+        with self._graph._write_lock:
+            conn = self._graph._conn()
+            conn.execute(
+                "INSERT INTO graph_meta (key, value) VALUES (?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (_META_KEY, json.dumps(report)),
+            )
+            conn.commit()
+
+    def get_stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "due": self.due(),
+            "last": self.last_report or self._load_report(),
+        }
+
+
+def _invert(mapping: dict[str, str]) -> dict[str, list[str]]:
+    inverted: dict[str, list[str]] = defaultdict(list)
+    for old, canonical in mapping.items():
+        inverted[canonical].append(old)
+    return inverted
@@ -0,0 +1,269 @@
+"""
+graph_index.py — In-process adjacency index for SQLiteGraph.
+
+The knowledge graph is small next to RAM, but every neighborhood lookup,
+has_node(), neighbors() and find_connection_path() used to hit SQLite (the
+latter building JSON trails in a recursive CTE, which explodes at depth 4).
+AdjacencyIndex keeps a compact read-only copy:
+
+- node names and relations are interned to integer ids;
+- adjacency is CSR: ``offsets[i]:offsets[i + 1]`` slices parallel arrays of
+  neighbor id / relation id / weight / direction, each slice sorted by weight
+  (heaviest first), every edge stored once per endpoint;
+- neighborhood and path queries run as BFS over those arrays.
+
+The snapshot is loaded lazily and rebuilt on the next read after a write.
+SQLiteGraph's write methods call invalidate(); commits from other
+connections (scripts writing knowledge_graph.db) are caught via
+``PRAGMA data_version``.  Disable with synapse.json →
+``memory.graph.adjacency_cache: false``.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+
+_OUT, _IN = 1, 0  # edge direction as seen from the node owning the CSR slice
+
+
+@dataclass(frozen=True)
+class AdjacencySnapshot:
+    ids: dict[str, int]
+    names: list[str]
+    relations: list[str]
+    offsets: array  # int64, len(names) + 1
+    neighbors: array  # int32
+    relation_ids: array  # int32
+    weights: array  # float64
+    directions: array  # int8: _OUT (node -> neighbor) or _IN (neighbor -> node)
+    num_edges: int
+    data_version: int
+    built_at: float
+
+    def slice(self, node_id: int) -> range:
+        return range(self.offsets[node_id], self.offsets[node_id + 1])
+
+    def edge(self, node_id: int, i: int) -> tuple[str, str, str, float]:
+        """(source, relation, target, weight) for CSR position *i* of *node_id*."""
+        other = self.names[self.neighbors[i]]
+        here = self.names[node_id]
+        rel = self.relations[self.relation_ids[i]]
+        if self.directions[i] == _OUT:
+            return here, rel, other, self.weights[i]
+        return other, rel, here, self.weights[i]
+
+    def nbytes(self) -> int:
+        """Approximate resident size: CSR arrays + interning tables."""
+        arrays = (self.offsets, self.neighbors, self.relation_ids, self.weights, self.directions)
+        size = sum(a.itemsize * len(a) for a in arrays)
+        size += sys.getsizeof(self.ids) + sys.getsizeof(self.names) + sys.getsizeof(self.relations)
+        size += sum(sys.getsizeof(n) for n in self.names)
+        size += sum(sys.getsizeof(r) for r in self.relations)
+        return size
+
+
+def _build(conn) -> AdjacencySnapshot:
+    start_version = conn.execute("PRAGMA data_version").fetchone()[0]
+    names = [r[0] for r in conn.execute("SELECT name FROM nodes")]
+    rows = conn.execute(
+        "SELECT source, target, relation, weight FROM edges ORDER BY weight DESC"
+    ).fetchall()
+
+    ids = {name: i for i, name in enumerate(names)}
+    for source, target, _, _ in rows:
+        for name in (source, target):
+            if name not in ids:  # edge endpoint missing from nodes (legacy rows)
+                ids[name] = len(names)
+                names.append(name)
+
+    relations: list[str] = []
+    relation_index: dict[str, int] = {}
+    degree = [0] * (len(names) + 1)
+    for source, target, _, _ in rows:
+        degree[ids[source]] += 1
+        degree[ids[target]] += 1
+    offsets = array("q", [0]) * (len(names) + 1)
+    for i in range(len(names)):
+        offsets[i + 1] = offsets[i] + degree[i]
+
+    size = 2 * len(rows)
+    neighbors = array("i", [0]) * size
+    relation_ids = array("i", [0]) * size
+    weights = array("d", [0.0]) * size
+    directions = array("b", [0]) * size
+    cursor = list(offsets[:-1])
+    # Rows arrive heaviest first, so filling slots in order keeps each slice sorted
+    for source, target, relation, weight in rows:
+        rel_id = relation_index.get(relation)
+        if rel_id is None:
+            rel_id = relation_index[relation] = len(relations)
+            relations.append(relation)
+        s, t = ids[source], ids[target]
+        for node, other, direction in ((s, t, _OUT), (t, s, _IN)):
+            pos = cursor[node]
+            cursor[node] += 1
+            neighbors[pos] = other
+            relation_ids[pos] = rel_id
+            weights[pos] = float(weight if weight is not None else 1.0)
+            directions[pos] = direction
+
+    return AdjacencySnapshot(
+        ids=ids,
+        names=names,
+        relations=relations,
+        offsets=offsets,
+        neighbors=neighbors,
+        relation_ids=relation_ids,
+        weights=weights,
+        directions=directions,
+        num_edges=len(rows),
+        data_version=start_version,
+        built_at=time.time(),
+    )
+
+
+def _is_current(conn, snapshot: AdjacencySnapshot) -> bool:
+    """False once another connection has committed to the database."""
+    return conn.execute("PRAGMA data_version").fetchone()[0] == snapshot.data_version
+
+
+class AdjacencyIndex:
+    """Lazily built, write-invalidated adjacency snapshot of one SQLiteGraph."""
+
+    def __init__(self, graph) -> None:
+        self._graph = graph
+        self._snapshot: AdjacencySnapshot | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self.builds = 0
+        self.hits = 0
+        self.last_build_s = 0.0
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+
+    def snapshot(self) -> AdjacencySnapshot:
+        conn = self._graph._conn()
+        snapshot = self._snapshot
+        if snapshot is not None and _is_current(conn, snapshot):
+            self.hits += 1
+            return snapshot
+
+        with self._build_lock:
+            # Another thread may have rebuilt while we waited
+            snapshot = self._snapshot
+            if snapshot is not None and _is_current(conn, snapshot):
+                return snapshot
+            with self._lock:
+                generation = self._generation
+            start = time.perf_counter()
+            snapshot = _build(conn)
+            with self._lock:
+                # An invalidation that raced the build means this snapshot may be stale
+                if generation == self._generation:
+                    self._snapshot = snapshot
+                self.builds += 1
+                self.last_build_s = time.perf_counter() - start
+        return snapshot
+
+    # -- Queries --
+
+    def neighborhoods(
+        self, entities: list[str], hops: int, per_entity_limit: int
+    ) -> dict[str, list[dict]]:
+        """Same contract as SQLiteGraph.get_neighborhoods(), served by BFS."""
+        snap = self.snapshot()
+        result: dict[str, list[dict]] = {}
+        for entity in entities:
+            seed = snap.ids.get(entity)
+            if seed is None:
+                result[entity] = []
+                continue
+            depth = {seed: 0}
+            queue = deque([seed])
+            found: dict[tuple[str, str, str], dict] = {}
+            while queue:
+                node = queue.popleft()
+                d = depth[node]
+                for i in snap.slice(node):
+                    source, relation, target, weight = snap.edge(node, i)
+                    key = (source, relation, target)
+                    if key not in found:
+                        found[key] = {
+                            "source": source,
+                            "relation": relation,
+                            "target": target,
+                            "weight": weight,
+                            "hop": d + 1,
+                        }
+                    other = snap.neighbors[i]
+                    if d + 1 < hops and other not in depth:
+                        depth[other] = d + 1
+                        queue.append(other)
+            # BFS yields hop order; stable sort keeps the per-node weight order
+            edges = sorted(found.values(), key=lambda e: (e["hop"], -e["weight"]))
+            result[entity] = edges[:per_entity_limit]
+        return result
+
+    def has_node(self, name: str) -> bool:
+        return name in self.snapshot().ids
+
+    def neighbors(self, name: str) -> list[str]:
+        """Distinct targets of outgoing edges, heaviest first."""
+        snap = self.snapshot()
+        node = snap.ids.get(name)
+        if node is None:
+            return []
+        out = (snap.neighbors[i] for i in snap.slice(node) if snap.directions[i] == _OUT)
+        return [snap.names[n] for n in dict.fromkeys(out)]
+
+    def shortest_path(self, start: str, end: str, max_depth: int) -> list[str]:
+        """Shortest directed path start -> end of at most *max_depth* edges ([] if none)."""
+        snap = self.snapshot()
+        src, dst = snap.ids.get(start), snap.ids.get(end)
+        if src is None or dst is None:
+            return []
+        parent = {src: -1}
+        frontier = [src]
+        for _ in range(max_depth + 1):
+            if dst in parent:
+                path = []
+                node = dst
+                while node != -1:
+                    path.append(snap.names[node])
+                    node = parent[node]
+                return path[::-1]
+            next_frontier = []
+            for node in frontier:
+                for i in snap.slice(node):
+                    other = snap.neighbors[i]
+                    if snap.directions[i] == _OUT and other not in parent:
+                        parent[other] = node
+                        next_frontier.append(other)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return []
+
+    # -- Metrics --
+
+    def get_stats(self) -> dict:
+        snap = self._snapshot
+        return {
+            "loaded": snap is not None,
+            "nodes": len(snap.names) if snap else 0,
+            "edges": snap.num_edges if snap else 0,
+            "memory_bytes": snap.nbytes() if snap else 0,
+            "builds": self.builds,
+            "hits": self.hits,
+            "last_build_s": round(self.last_build_s, 4),
+            "age_s": round(time.time() - snap.built_at, 1) if snap else None,
+        }
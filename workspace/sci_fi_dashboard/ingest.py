@@ -6,6 +6,7 @@ import struct
 
 from sci_fi_dashboard.db import get_db_connection
 from sci_fi_dashboard.embedding import get_provider
+from sci_fi_dashboard.profile_facts import PROFILE_CATEGORIES, invalidate_profile_facts
 
 try:
     from synapse_config import SynapseConfig  # noqa: PLC0415
@@ -141,6 +142,8 @@ def ingest_atomic():
                         print(f"   ... Committed {count} memories")
 
                 conn.commit()
+                if any(filename in PROFILE_CATEGORIES for filename, _, _ in new_items):
+                    invalidate_profile_facts()
                 print(f"[OK] Successfully ingested {count} new memories.")
 
         else:
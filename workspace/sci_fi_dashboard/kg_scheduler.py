@@ -0,0 +1,167 @@
+"""
+kg_scheduler.py — Drives background KG extraction across all personas.
+
+Each cycle of gentle_worker_loop calls KGExtractionScheduler.run_cycle(),
+which extracts personas concurrently (``kg_extraction.persona_concurrency``)
+and, per persona, keeps pulling pages of ``page_size`` messages through
+run_batch_extraction() until the watermark catches up, the page falls below
+``min_messages``, or ``max_pages_per_run`` pages have been processed.
+A persona far behind therefore catches up in one cycle instead of one page
+every ten minutes.
+
+LLM pressure stays bounded regardless of how many personas run: all chunk
+calls share the process-wide ``kg_extraction.llm_concurrency`` slots and the
+per-provider RPM budgets in conv_kg_extractor.py.
+
+Watermarks are committed per page inside messages.db (see
+conv_kg_extractor._set_kg_watermark), so an interrupted cycle resumes from
+the last fully written page.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+
+from sci_fi_dashboard.conv_kg_extractor import count_pending_messages, run_batch_extraction
+
+logger = logging.getLogger(__name__)
+
+
+class KGExtractionScheduler:
+    """Concurrent, backlog-draining KG extraction for a set of personas."""
+
+    def __init__(self, llm_router, graph, memory_db_path: str, entities_json_path: str) -> None:
+        self._router = llm_router
+        self._graph = graph
+        self._memory_db_path = memory_db_path
+        self._entities_json_path = entities_json_path
+        self._personas: dict[str, dict] = {}
+        self._running = False
+        self.cycles = 0
+
+    def _state(self, persona_id: str) -> dict:
+        return self._personas.setdefault(
+            persona_id,
+            {
+                "backlog": None,
+                "running": False,
+                "last_run_at": None,
+                "last_pages": 0,
+                "last_messages": 0,
+                "last_extracted": 0,
+                "last_duration_s": None,
+                "last_error": None,
+            },
+        )
+
+    async def run_cycle(self, sbs_dirs: dict[str, str], force: bool = False) -> dict:
+        """Extract every persona in *sbs_dirs* ({persona_id: sbs_data_dir}).
+
+        Returns ``{persona_id: summary}``.  Overlapping calls are skipped.
+        """
+        from synapse_config import SynapseConfig
+
+        if self._running:
+            logger.info("[KG] Extraction cycle already running — skipping")
+            return {}
+        self._running = True
+        try:
+            cfg = SynapseConfig.load().kg_extraction
+            sem = asyncio.Semaphore(max(1, int(cfg.persona_concurrency)))
+
+            async def _one(persona_id: str, sbs_data_dir: str) -> tuple[str, dict]:
+                async with sem:
+                    return persona_id, await self._drain(persona_id, sbs_data_dir, cfg, force)
+
+            results = await asyncio.gather(*(_one(pid, d) for pid, d in sbs_dirs.items()))
+            self.cycles += 1
+            return dict(results)
+        finally:
+            self._running = False
+
+    async def _drain(self, persona_id: str, sbs_data_dir: str, cfg, force: bool) -> dict:
+        state = self._state(persona_id)
+        state["running"] = True
+        start = time.perf_counter()
+        pages = messages = extracted = 0
+        error = None
+        page_size = max(1, int(cfg.page_size))
+        try:
+            for _ in range(max(1, int(cfg.max_pages_per_run))):
+                result = await run_batch_extraction(
+                    persona_id=persona_id,
+                    sbs_data_dir=sbs_data_dir,
+                    llm_router=self._router,
+                    graph=self._graph,
+                    memory_db_path=self._memory_db_path,
+                    entities_json_path=self._entities_json_path,
+                    min_messages=cfg.min_messages,
+                    max_messages=page_size,
+                    force=force,
+                    kg_role=cfg.kg_role,
+                )
+                if result.get("skipped") or result.get("error"):
+                    error = result.get("error")
+                    break
+                pages += 1
+                messages += result.get("messages", 0)
+                extracted += result.get("extracted", 0)
+                if result.get("messages", 0) < page_size:
+                    break  # caught up
+        except Exception as e:
+            error = str(e)
+            logger.warning("[KG] Extraction for %s failed: %s", persona_id, e)
+        finally:
+            state["running"] = False
+
+        backlog = await asyncio.to_thread(self._backlog, sbs_data_dir)
+        state.update(
+            backlog=backlog,
+            last_run_at=time.time(),
+            last_pages=pages,
+            last_messages=messages,
+            last_extracted=extracted,
+            last_duration_s=round(time.perf_counter() - start, 2),
+            last_error=error,
+        )
+        if pages:
+            logger.info(
+                "[KG] %s: %d page(s), %d messages, %d triples in %.1fs (backlog %s)",
+                persona_id,
+                pages,
+                messages,
+                extracted,
+                state["last_duration_s"],
+                backlog,
+            )
+        return {"pages": pages, "messages": messages, "extracted": extracted, "error": error}
+
+    @staticmethod
+    def _backlog(sbs_data_dir: str) -> int | None:
+        try:
+            return count_pending_messages(sbs_data_dir)
+        except Exception:
+            return None
+
+    def refresh_backlog(self, sbs_dirs: dict[str, str]) -> None:
+        """Recount the backlog of idle personas (cheap indexed COUNT per persona)."""
+        for persona_id, sbs_data_dir in sbs_dirs.items():
+            state = self._state(persona_id)
+            if not state["running"]:
+                state["backlog"] = self._backlog(sbs_data_dir)
+
+    def get_stats(self) -> dict:
+        return {
+            "cycles": self.cycles,
+            "running": self._running,
+            "total_backlog": sum(s["backlog"] or 0 for s in self._personas.values()),
+            "personas": {pid: dict(s) for pid, s in self._personas.items()},
+        }
+
+
+def sbs_dirs_for(registry: dict) -> dict[str, str]:
+    """{persona_id: sbs_data_dir} for an sbs_registry of SBSOrchestrators."""
+    return {pid: str(Path(sbs.data_dir)) for pid, sbs in registry.items()}
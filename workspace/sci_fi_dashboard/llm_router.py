@@ -733,11 +733,21 @@ class SynapseLLMRouter:
         )
         # C-09: Lock to prevent concurrent Copilot token refresh races
         self._copilot_refresh_lock = asyncio.Lock()
+        # Provider calls currently awaiting a response (read by the worker autoscaler)
+        self.in_flight = 0
         logger.info(
             "SynapseLLMRouter initialized with %d roles",
             len(self._config.model_mappings),
         )
 
+    async def _acompletion(self, **kwargs):
+        """``self._router.acompletion`` with in-flight accounting."""
+        self.in_flight += 1
+        try:
+            return await self._router.acompletion(**kwargs)
+        finally:
+            self.in_flight -= 1
+
     def _rebuild_router(self) -> None:
         """Rebuild the litellm Router (e.g. after a Copilot token refresh)."""
         self._router = build_router(self._config.model_mappings, self._config.providers)
@@ -805,7 +815,7 @@ class SynapseLLMRouter:
                             f"({budget_duration})",
                         )
         try:
-            response = await self._router.acompletion(
+            response = await self._acompletion(
                 model=role,
                 messages=messages,
                 temperature=temperature,
@@ -841,7 +851,7 @@ class SynapseLLMRouter:
                         logger.warning("Copilot token expired (401) — refreshing and retrying")
                         _get_copilot_token()
                         self._rebuild_router()
-                return await self._router.acompletion(
+                return await self._acompletion(
                     model=role,
                     messages=messages,
                     temperature=temperature,
@@ -868,7 +878,7 @@ class SynapseLLMRouter:
             if fallback_cfg:
                 fallback_role = f"{role}_fallback"
                 logger.info("Falling back to '%s' after budget exceeded", fallback_role)
-                return await self._router.acompletion(
+                return await self._acompletion(
                     model=fallback_role,
                     messages=messages,
                     temperature=temperature,
@@ -891,7 +901,7 @@ class SynapseLLMRouter:
                         logger.warning("Copilot token rejected — refreshing and retrying")
                         _get_copilot_token()  # triggers Authenticator refresh
                         self._rebuild_router()
-                return await self._router.acompletion(
+                return await self._acompletion(
                     model=role,
                     messages=messages,
                     temperature=temperature,
@@ -983,17 +993,21 @@ class SynapseLLMRouter:
 
         env = {k: v for k, v in __import__("os").environ.items() if k != "CLAUDECODE"}
 
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
-        )
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(input=prompt.encode("utf-8")),
-            timeout=120,
-        )
+        self.in_flight += 1
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+            )
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(input=prompt.encode("utf-8")),
+                timeout=120,
+            )
+        finally:
+            self.in_flight -= 1
 
         if proc.returncode != 0:
             raise RuntimeError(f"claude CLI failed: {stderr.decode(errors='replace')[:300]}")
@@ -1168,7 +1182,7 @@ class SynapseLLMRouter:
         }
 
         try:
-            response = await self._router.acompletion(**kwargs)
+            response = await self._acompletion(**kwargs)
         except AuthenticationError as exc:
             if self._uses_copilot and (
                 "token expired" in str(exc).lower() or "unauthorized" in str(exc).lower()
@@ -1183,7 +1197,7 @@ class SynapseLLMRouter:
                         )
                         _get_copilot_token()
                         self._rebuild_router()
-                response = await self._router.acompletion(**kwargs)
+                response = await self._acompletion(**kwargs)
                 # fall through to normal response handling below
             else:
                 logger.error("Auth failed for role '%s' (tools): %s", role, exc)
@@ -1209,7 +1223,7 @@ class SynapseLLMRouter:
                 fallback_role = f"{role}_fallback"
                 logger.info("Falling back to '%s' after budget exceeded (tools)", fallback_role)
                 kwargs["model"] = fallback_role
-                return await self._router.acompletion(**kwargs)
+                return await self._acompletion(**kwargs)
             raise
         except Exception as exc:
             # M-03: Copilot 403 refresh — same logic as _do_call()
@@ -1222,7 +1236,7 @@ class SynapseLLMRouter:
                         logger.warning("Copilot token rejected (tools) — refreshing")
                         _get_copilot_token()
                         self._rebuild_router()
-                response = await self._router.acompletion(**kwargs)
+                response = await self._acompletion(**kwargs)
             else:
                 raise
 
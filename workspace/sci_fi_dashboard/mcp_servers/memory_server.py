@@ -70,7 +70,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     try:
         engine = _get_engine()
         if name == "query_memory":
-            result = engine.query(
+            result = await engine.aquery(
                 text=arguments["query"],
                 limit=arguments.get("limit", 5),
                 with_graph=arguments.get("with_graph", True),
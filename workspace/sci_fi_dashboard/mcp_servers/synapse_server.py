@@ -12,6 +12,18 @@ from mcp.types import Resource, TextContent, Tool
 
 from .base import check_mcp_auth, logger, setup_logging
 
+_engine = None
+
+
+def _get_engine():
+    global _engine
+    if _engine is None:
+        from memory_engine import MemoryEngine
+
+        _engine = MemoryEngine()
+    return _engine
+
+
 server = Server("synapse")
 
 
@@ -84,15 +96,11 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
     try:
         if name == "query_memory":
-            from memory_engine import MemoryEngine
-
-            engine = MemoryEngine()
-            result = engine.query(arguments["query"], arguments.get("limit", 5))
+            engine = _get_engine()
+            result = await engine.aquery(arguments["query"], arguments.get("limit", 5))
             return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
         elif name == "ingest_memory":
-            from memory_engine import MemoryEngine
-
-            engine = MemoryEngine()
+            engine = _get_engine()
             result = engine.add_memory(
                 arguments["content"], arguments.get("category", "mcp_ingest")
             )
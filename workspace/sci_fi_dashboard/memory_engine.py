@@ -1,12 +1,16 @@
+import asyncio
+import hashlib
 import json
-import math
 import os
 import sqlite3
 import sys
 import threading
 import time
-from functools import lru_cache, wraps
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 
+import numpy as np
 from flashrank import Ranker, RerankRequest
 
 try:
@@ -20,17 +24,17 @@ except ImportError:
 
 # Import centralized DB module
 try:
-    from .db import get_db_connection
+    from .db import DatabaseManager
 except ImportError:
     try:
-        from db import get_db_connection
+        from db import DatabaseManager
     except ImportError:
         # Final fallback if working in workspace/sci_fi_dashboard
         import os
         import sys
 
         sys.path.append(os.path.dirname(__file__))
-        from db import get_db_connection
+        from db import DatabaseManager
 
 
 def with_retry(retries: int = 3, delay: float = 0.5):
@@ -64,11 +68,37 @@ import contextlib  # noqa: E402
 
 from sci_fi_dashboard.embedding import get_provider  # noqa: E402
 from sci_fi_dashboard.pipeline_emitter import get_emitter as _get_emitter  # noqa: E402
+from sci_fi_dashboard.profile_facts import invalidate_profile_facts  # noqa: E402
 from sci_fi_dashboard.vector_store import LanceDBVectorStore  # noqa: E402
 
 # Configuration
 RERANK_MODEL_NAME = "ms-marco-TinyBERT-L-2-v2"
 
+# aquery() retrieval executor defaults -- override via synapse.json → "memory"
+_DEFAULT_RETRIEVAL_WORKERS = 4
+# Max in-flight calls per stage. The graph store shares one SQLite connection
+# and the reranker is a single ONNX session, so both default to serial.
+_DEFAULT_STAGE_LIMITS = {"embed": 2, "search": 4, "graph": 1, "rerank": 1}
+_DEFAULT_STAGE_TIMEOUTS = {"embed": 5.0, "search": 3.0, "graph": 2.0, "rerank": 5.0}
+
+# 3-factor candidate scoring -- override via synapse.json → "memory" → "score_weights"
+_DEFAULT_SCORE_WEIGHTS = {"relevance": 0.4, "temporal": 0.3, "importance": 0.3}
+
+# Fast gate / reranker policy -- override via synapse.json → "memory" → "rerank"
+_DEFAULT_RERANK = {
+    "fast_gate_threshold": 0.80,  # combined score above which results skip the reranker
+    "skip_margin": 0.15,  # skip reranking when the top-k lead the rest by this much (null = never)
+    "cache_size": 256,  # reranked passage lists remembered per (query, candidate set)
+}
+
+# Knowledge-graph context -- override via synapse.json → "memory" → "graph"
+_DEFAULT_GRAPH = {
+    "hops": 1,  # neighborhood radius around each query entity (max 3)
+    "per_entity_limit": 50,  # edges kept per entity, nearest hop / heaviest first
+}
+
+_FIRST_PERSON = frozenset({"i", "my", "me", "mine", "myself", "i've", "i'm", "i'd", "i'll"})
+
 
 def _get_db_path() -> str:
     from synapse_config import SynapseConfig  # noqa: PLC0415
@@ -80,6 +110,43 @@ DB_PATH = _get_db_path()
 BACKUP_FILE = os.path.join(WORKSPACE_ROOT, "_archived_memories", "persistent_log.jsonl")
 
 
+class RerankCache:
+    """Thread-safe LRU of FlashRank output keyed by (query hash, candidate id set).
+
+    Repeated questions in a conversation usually pull back the same LanceDB
+    candidates; their reranked order is reused instead of re-running ONNX.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = max(0, int(maxsize))
+        self._entries: OrderedDict[tuple, list[tuple[str, float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str, q_results: list) -> tuple:
+        query_hash = hashlib.sha1(text.strip().lower().encode("utf-8")).hexdigest()
+        return query_hash, frozenset(r["id"] for r in q_results)
+
+    def get(self, key: tuple) -> list[tuple[str, float]] | None:
+        with self._lock:
+            ranked = self._entries.get(key)
+            if ranked is not None:
+                self._entries.move_to_end(key)
+            return ranked
+
+    def put(self, key: tuple, ranked: list[tuple[str, float]]) -> None:
+        if not self._maxsize:
+            return
+        with self._lock:
+            self._entries[key] = ranked
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class MemoryEngine:
     """
     Single instance that replaces the entire db/server.py process.
@@ -101,6 +168,34 @@ class MemoryEngine:
         self._ranker = None
         self._ranker_lock = threading.Lock()
 
+        # Retrieval executor for aquery() -- keeps ONNX inference, LanceDB search,
+        # graph lookups and reranking off the event loop.
+        memory_cfg = SynapseConfig.load().memory
+        self._retrieval_workers = int(
+            memory_cfg.get("retrieval_workers", _DEFAULT_RETRIEVAL_WORKERS)
+        )
+        self._retrieval_executor = ThreadPoolExecutor(
+            max_workers=self._retrieval_workers, thread_name_prefix="memory-retrieval"
+        )
+        self._stage_limits = {**_DEFAULT_STAGE_LIMITS, **memory_cfg.get("stage_concurrency", {})}
+        self._stage_timeouts = {**_DEFAULT_STAGE_TIMEOUTS, **memory_cfg.get("stage_timeouts", {})}
+        self._stage_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._stage_timeout_counts: dict[str, int] = dict.fromkeys(self._stage_limits, 0)
+        weights = {**_DEFAULT_SCORE_WEIGHTS, **memory_cfg.get("score_weights", {})}
+        self._score_weights = np.array(
+            [float(weights["relevance"]), float(weights["temporal"]), float(weights["importance"])]
+        )
+        rerank_cfg = {**_DEFAULT_RERANK, **memory_cfg.get("rerank", {})}
+        self._fast_gate_threshold = float(rerank_cfg["fast_gate_threshold"])
+        self._rerank_skip_margin = rerank_cfg["skip_margin"]
+        self._rerank_cache = RerankCache(rerank_cfg["cache_size"])
+        self._rerank_stats_lock = threading.Lock()
+        self._rerank_stats = {"runs": 0, "cache_hits": 0, "skipped": 0, "latency_total_s": 0.0}
+        self._rerank_latency_max_s = 0.0
+        graph_cfg = {**_DEFAULT_GRAPH, **memory_cfg.get("graph", {})}
+        self._graph_hops = int(graph_cfg["hops"])
+        self._graph_edges_per_entity = int(graph_cfg["per_entity_limit"])
+
         # Embedding provider (via abstraction layer)
         self._embed_provider = get_provider()
         if self._embed_provider is not None:
@@ -111,8 +206,9 @@ class MemoryEngine:
             )
         print("[OK] MemoryEngine initialized (shared graph, no duplication)")
 
-    @lru_cache(maxsize=500)  # noqa: B019
     def get_embedding(self, text: str) -> tuple:
+        # No per-instance memo: the shared provider sits behind the persistent
+        # EmbeddingCache (embedding/cache.py), which survives restarts.
         if self._embed_provider is None:
             return tuple([0.0] * 768)
         try:
@@ -131,13 +227,292 @@ class MemoryEngine:
                     )
         return self._ranker
 
-    def _temporal_score(self, timestamp) -> float:
-        if not timestamp:
-            return 0.5
-        diff_days = (time.time() - timestamp) / 86400
-        if diff_days < 0:
-            diff_days = 0
-        return 1 / (1 + math.log1p(diff_days))
+    @staticmethod
+    def _temporal_scores(timestamps: np.ndarray) -> np.ndarray:
+        """Recency decay 1 / (1 + ln(1 + age_days)); 0.5 where the timestamp is missing."""
+        age_days = np.maximum((time.time() - timestamps) / 86400, 0.0)
+        return np.where(timestamps > 0, 1 / (1 + np.log1p(age_days)), 0.5)
+
+    # ------------------------------------------------------------------
+    # Query stages -- shared by query() and aquery()
+    # ------------------------------------------------------------------
+
+    def _resolve_entities(self, text: str, seed_entities: list[str] | None) -> list[str]:
+        # First-person pronouns → include seed_entities in graph lookup even if
+        # no entity name appears literally in the query text ("my condition" etc.)
+        is_self_referential = bool(_FIRST_PERSON & set(text.lower().split()))
+
+        # Entity extraction (shared keyword_processor)
+        entities = []
+        if self.keyword_processor:
+            entities = self.keyword_processor.extract_keywords(text)
+
+        # Inject seed_entities for self-referential queries so the KG is
+        # consulted even when the user writes "my X" instead of their name
+        if seed_entities and (is_self_referential or not entities):
+            entities = list(dict.fromkeys(entities + seed_entities))
+        return entities
+
+    def _graph_context(
+        self, entities: list[str], extra_entities: list[str] | None = None
+    ) -> tuple[str, dict[str, list[dict]]]:
+        """Graph context (shared graph_store) for all entities in one graph query.
+
+        Returns the prompt text for *entities* plus the structured
+        neighborhoods, which also cover *extra_entities* -- lookups a caller
+        needs for its own formatting (dual cognition's relationship target).
+        """
+        seeds = list(dict.fromkeys([*entities, *(extra_entities or [])]))
+        if not seeds or not self.graph_store:
+            return "", {}
+        neighborhoods = self.graph_store.get_neighborhoods(
+            seeds, hops=self._graph_hops, per_entity_limit=self._graph_edges_per_entity
+        )
+        blocks = []
+        for ent in entities:
+            ctx = self.graph_store.format_neighborhood(ent, neighborhoods.get(ent, []))
+            if ctx:
+                blocks.append(f"Context for {ent}:\n{ctx}")
+        return "\n\n".join(blocks), neighborhoods
+
+    @staticmethod
+    def _routing_label(text: str) -> str:
+        """Temporal routing label."""
+        query_lower = text.lower()
+        historical = ["was", "did", "history", "back then", "2024", "2025", "past"]
+        current = ["current", "now", "latest", "status", "currently", "today"]
+
+        if any(k in query_lower for k in historical):
+            return "Historical"
+        if any(k in query_lower for k in current):
+            return "Current State"
+        return "Default (Hybrid)"
+
+    def _embed_query(self, text: str, embedding_context=None) -> tuple:
+        with contextlib.suppress(Exception):
+            _get_emitter().emit("memory.embedding_start", {})
+        if embedding_context is None:
+            query_vec_tuple = self.get_embedding(text)
+        else:
+            # Shared per-message cache -- skill routing and dual cognition reuse this vector
+            try:
+                query_vec_tuple = tuple(embedding_context.embed_query(text))
+            except Exception as e:
+                print(f"[WARN] Embedding generation failed: {e}")
+                dims = self._embed_provider.dimensions if self._embed_provider else 768
+                query_vec_tuple = tuple([0.0] * dims)
+        with contextlib.suppress(Exception):
+            _get_emitter().emit(
+                "memory.embedding_done",
+                {"dims": len(query_vec_tuple) if hasattr(query_vec_tuple, "__len__") else 768},
+            )
+        return query_vec_tuple
+
+    def _search_candidates(
+        self, query_vec: list[float], limit: int, hemisphere: str, text: str = ""
+    ) -> list:
+        # Build hemisphere filter (SQL WHERE clause for LanceDB)
+        # Spicy sessions see both safe + spicy; safe sessions see only safe
+        if hemisphere == "spicy":
+            hemisphere_filter = "hemisphere_tag IN ('safe', 'spicy')"
+        else:
+            hemisphere_filter = "hemisphere_tag = 'safe'"
+
+        with contextlib.suppress(Exception):
+            _get_emitter().emit(
+                "memory.lancedb_search_start", {"hemisphere": hemisphere, "limit": limit * 3}
+            )
+        _search_start = time.time()
+        # ANN + BM25 fused by RRF so exact names / rare terms surface even when
+        # their embedding is not the nearest neighbour (plain ANN if text is empty)
+        q_results = self.vector_store.hybrid_search(
+            query_vec, text, limit=limit * 3, query_filter=hemisphere_filter
+        )
+        with contextlib.suppress(Exception):
+            _get_emitter().emit(
+                "memory.lancedb_search_done",
+                {
+                    "num_candidates": len(q_results),
+                    "latency_ms": round((time.time() - _search_start) * 1000),
+                },
+            )
+        return q_results
+
+    def _score_candidates(self, q_results: list) -> np.ndarray:
+        """Apply 3-factor scoring (relevance + temporal + importance) to every candidate.
+
+        Vectorized over the whole candidate set; sets ``combined_score`` on each
+        result and returns the scores as an array aligned with *q_results*.
+        Candidates are not sorted -- use _top_k() to pick the best ones.
+        """
+        n = len(q_results)
+        if not n:
+            return np.empty(0)
+        factors = np.empty((n, 3))
+        for i, r in enumerate(q_results):
+            meta = r["metadata"]
+            factors[i, 0] = r["score"]
+            factors[i, 1] = meta.get("unix_timestamp") or 0
+            importance = meta.get("importance")
+            factors[i, 2] = 5 if importance is None else importance
+        factors[:, 1] = self._temporal_scores(factors[:, 1])
+        factors[:, 2] /= 10
+        scores = factors @ self._score_weights
+        for r, score in zip(q_results, scores.tolist(), strict=True):
+            r["combined_score"] = score
+
+        try:
+            _top_scored = [q_results[i] for i in self._top_k(scores, 5)]
+            _get_emitter().emit(
+                "memory.scoring",
+                {
+                    "results": [
+                        {
+                            "text": r.get("metadata", {}).get("text", "")[:60],
+                            "score": round(r.get("combined_score", 0), 3),
+                            "semantic": round(r.get("score", 0), 3),
+                        }
+                        for r in _top_scored
+                    ]
+                },
+            )
+        except Exception:  # noqa: BLE001
+            pass
+        return scores
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int, candidates: np.ndarray | None = None) -> list[int]:
+        """Indices of the *k* highest scores (optionally among *candidates*), best first."""
+        idx = np.arange(len(scores)) if candidates is None else candidates
+        if k <= 0 or not len(idx):
+            return []
+        sub = scores[idx]
+        part = np.argpartition(-sub, k - 1)[:k] if k < len(idx) else np.arange(len(idx))
+        # Ties keep retrieval order, matching the previous stable sort
+        order = part[np.lexsort((part, -sub[part]))]
+        return idx[order].tolist()
+
+    def _fast_gate(
+        self, q_results: list, scores: np.ndarray, entities: list[str], limit: int
+    ) -> list | None:
+        """Smart gate -- return the high-confidence results, or None to rerank.
+
+        A candidate qualifies when its combined score clears the threshold, or
+        when the full-text retriever matched it and it names a resolved entity
+        (an exact-name hit needs no cross-encoder to confirm it).
+        """
+        mask = scores > self._fast_gate_threshold
+        if entities and len(q_results):
+            texts = np.array([r["metadata"]["text"].lower() for r in q_results])
+            mentions = np.zeros(len(q_results), dtype=bool)
+            for e in entities:
+                mentions |= np.char.find(texts, e.lower()) >= 0
+            lexical = np.array([r.get("match") in ("text", "both") for r in q_results])
+            mask = (mask | lexical) & mentions
+        candidates = np.flatnonzero(mask)
+        if len(candidates) < limit:
+            return None
+
+        high_conf = [q_results[i] for i in self._top_k(scores, limit, candidates)]
+        with contextlib.suppress(Exception):
+            _get_emitter().emit(
+                "memory.fast_gate_hit",
+                {
+                    "threshold": self._fast_gate_threshold,
+                    "top_score": (
+                        round(high_conf[0].get("combined_score", 0), 3) if high_conf else 0
+                    ),
+                },
+            )
+        return [
+            {
+                "content": x["metadata"]["text"],
+                "score": x["combined_score"],
+                "source": "lancedb_fast",
+            }
+            for x in high_conf
+        ]
+
+    def _rerank_shortcut(
+        self, text: str, q_results: list, scores: np.ndarray, limit: int
+    ) -> tuple[list, str] | None:
+        """Answer without running FlashRank when possible: cached order or clear lead.
+
+        Returns ``(results, tier)`` or None when a real rerank is needed.
+        """
+        cached = self._rerank_cache.get(self._rerank_cache.key(text, q_results))
+        if cached is not None:
+            self._count_rerank("cache_hits")
+            return self._reranked_results(cached, limit), "reranked"
+
+        margin = self._rerank_skip_margin
+        if margin is not None and len(scores) > limit > 0:
+            top = self._top_k(scores, limit + 1)
+            lead = scores[top[limit - 1]] - scores[top[limit]]
+            if lead >= float(margin):
+                self._count_rerank("skipped")
+                with contextlib.suppress(Exception):
+                    _get_emitter().emit(
+                        "memory.rerank_skipped", {"lead": round(float(lead), 3), "margin": margin}
+                    )
+                return self._scored_fallback(q_results, scores, limit), "rerank_skipped"
+        return None
+
+    def _rerank(self, text: str, q_results: list, limit: int) -> list:
+        """FlashRank rerank. Raises on failure so callers can fall back to scored results."""
+        with contextlib.suppress(Exception):
+            _get_emitter().emit("memory.reranking_start", {})
+        start = time.perf_counter()
+        ranker = self._get_ranker()
+        candidates = [
+            {
+                "id": r["id"],
+                "text": r["metadata"]["text"],
+                "meta": {"score": r["combined_score"]},
+            }
+            for r in q_results
+        ]
+        ranked = ranker.rerank(RerankRequest(query=text, passages=candidates))
+        ranked = [(x["text"], float(x["score"])) for x in ranked]
+        self._rerank_cache.put(self._rerank_cache.key(text, q_results), ranked)
+
+        elapsed = time.perf_counter() - start
+        with self._rerank_stats_lock:
+            self._rerank_stats["runs"] += 1
+            self._rerank_stats["latency_total_s"] += elapsed
+            self._rerank_latency_max_s = max(self._rerank_latency_max_s, elapsed)
+        return self._reranked_results(ranked, limit)
+
+    @staticmethod
+    def _reranked_results(ranked: list[tuple[str, float]], limit: int) -> list:
+        return [
+            {"content": text, "score": score, "source": "lancedb_reranked"}
+            for text, score in ranked[:limit]
+        ]
+
+    def _count_rerank(self, counter: str) -> None:
+        with self._rerank_stats_lock:
+            self._rerank_stats[counter] += 1
+
+    def _scored_fallback(self, q_results: list, scores: np.ndarray, limit: int) -> list:
+        return [
+            {
+                "content": q_results[i]["metadata"]["text"],
+                "score": q_results[i]["combined_score"],
+                "source": "lancedb_scored",
+            }
+            for i in self._top_k(scores, limit)
+        ]
+
+    @staticmethod
+    def _error_response(error: str, entities=None, graph_context: str = "") -> dict:
+        return {
+            "results": [],
+            "tier": "error",
+            "entities": entities or [],
+            "graph_context": graph_context,
+            "error": error,
+        }
 
     def query(
         self,
@@ -146,223 +521,217 @@ class MemoryEngine:
         with_graph: bool = True,
         hemisphere: str = "safe",
         seed_entities: list[str] | None = None,
+        embedding_context=None,
+        graph_entities: list[str] | None = None,
     ) -> dict:
         start = time.time()
         with contextlib.suppress(Exception):
             _get_emitter().emit("memory.query_start", {"text": text[:80]})
-        _query_start = time.time()
-
-        # First-person pronouns → include seed_entities in graph lookup even if
-        # no entity name appears literally in the query text ("my condition" etc.)
-        _FIRST_PERSON = {  # noqa: N806
-            "i",
-            "my",
-            "me",
-            "mine",
-            "myself",
-            "i've",
-            "i'm",
-            "i'd",
-            "i'll",
-        }  # noqa: N806
-        _is_self_referential = bool(_FIRST_PERSON & set(text.lower().split()))
 
         try:
-            # Entity extraction (shared keyword_processor)
-            entities = []
-            if self.keyword_processor:
-                entities = self.keyword_processor.extract_keywords(text)
-
-            # Inject seed_entities for self-referential queries so the KG is
-            # consulted even when the user writes "my X" instead of their name
-            if seed_entities and (_is_self_referential or not entities):
-                entities = list(dict.fromkeys(entities + seed_entities))
-
-            # Graph context (shared graph_store)
-            graph_context = ""
-            if with_graph and entities and self.graph_store:
-                neighborhoods = []
-                for ent in entities:
-                    ctx = self.graph_store.get_entity_neighborhood(ent)
-                    if ctx:
-                        neighborhoods.append(f"Context for {ent}:\n{ctx}")
-                graph_context = "\n\n".join(neighborhoods)
-
-            # Temporal routing label
-            query_lower = text.lower()
-            historical = ["was", "did", "history", "back then", "2024", "2025", "past"]
-            current = ["current", "now", "latest", "status", "currently", "today"]
-
-            if any(k in query_lower for k in historical):
-                routing = "Historical"
-            elif any(k in query_lower for k in current):
-                routing = "Current State"
-            else:
-                routing = "Default (Hybrid)"
+            entities = self._resolve_entities(text, seed_entities)
+            graph_context, neighborhoods = (
+                self._graph_context(entities, graph_entities) if with_graph else ("", {})
+            )
+            routing = self._routing_label(text)
 
             # LanceDB search with hemisphere filtering
-            with contextlib.suppress(Exception):
-                _get_emitter().emit("memory.embedding_start", {})
-            query_vec_tuple = self.get_embedding(text)
-            with contextlib.suppress(Exception):
-                _get_emitter().emit(
-                    "memory.embedding_done",
-                    {"dims": len(query_vec_tuple) if hasattr(query_vec_tuple, "__len__") else 768},
-                )
+            query_vec_tuple = self._embed_query(text, embedding_context)
             if query_vec_tuple is None:
+                return self._error_response("Embedding generation failed", entities, graph_context)
+            q_results = self._search_candidates(list(query_vec_tuple), limit, hemisphere, text)
+            scores = self._score_candidates(q_results)
+
+            fast = self._fast_gate(q_results, scores, entities, limit)
+            if fast is not None:
                 return {
-                    "results": [],
-                    "tier": "error",
+                    "results": fast,
+                    "tier": "fast_gate",
                     "entities": entities,
                     "graph_context": graph_context,
-                    "error": "Embedding generation failed",
+                    "graph_neighborhoods": neighborhoods,
+                    "routing": routing,
                 }
-            query_vec = list(query_vec_tuple)
 
-            # Build hemisphere filter (SQL WHERE clause for LanceDB)
-            # Spicy sessions see both safe + spicy; safe sessions see only safe
-            if hemisphere == "spicy":
-                hemisphere_filter = "hemisphere_tag IN ('safe', 'spicy')"
+            # Reranker fallback (gracefully degrades to scored results if reranker fails)
+            shortcut = self._rerank_shortcut(text, q_results, scores, limit)
+            if shortcut is not None:
+                results, tier = shortcut
             else:
-                hemisphere_filter = "hemisphere_tag = 'safe'"
+                try:
+                    results, tier = self._rerank(text, q_results, limit), "reranked"
+                except Exception as rerank_err:
+                    print(f"[WARN] Reranker failed ({rerank_err}) — falling back to scored results")
+                    results = self._scored_fallback(q_results, scores, limit)
+                    tier = "scored_fallback"
+            return {
+                "results": results,
+                "tier": tier,
+                "entities": entities,
+                "graph_context": graph_context,
+                "graph_neighborhoods": neighborhoods,
+                "elapsed": f"{time.time() - start:.4f}s",
+                "routing": routing,
+            }
+        except Exception as e:
+            print(f"[WARN] Memory query failed: {e}")
+            return self._error_response(str(e))
 
-            with contextlib.suppress(Exception):
+    # ------------------------------------------------------------------
+    # Async query path
+    # ------------------------------------------------------------------
 
-                _get_emitter().emit(
-                    "memory.lancedb_search_start", {"hemisphere": hemisphere, "limit": limit * 3}
-                )
-            _search_start = time.time()
-            q_results = self.vector_store.search(
-                query_vec, limit=limit * 3, query_filter=hemisphere_filter
-            )
-            with contextlib.suppress(Exception):
-                _get_emitter().emit(
-                    "memory.lancedb_search_done",
-                    {
-                        "num_candidates": len(q_results),
-                        "latency_ms": round((time.time() - _search_start) * 1000),
-                    },
-                )
+    async def _run_stage(self, stage: str, fn, *args):
+        """Run a blocking query stage on the retrieval executor.
 
-            # Apply 3-factor scoring: relevance + temporal + importance
-            for r in q_results:
-                ts = r["metadata"].get("unix_timestamp")
-                importance = r["metadata"].get("importance", 5)
-                r["combined_score"] = (
-                    (r["score"] * 0.4) + (self._temporal_score(ts) * 0.3) + (importance / 10 * 0.3)
-                )
+        Each stage has its own concurrency limit and timeout. The timeout covers
+        both waiting for a stage slot and the work itself. A timed-out thread
+        cannot be interrupted, so its slot is only released once it actually
+        finishes -- the limit stays a true bound on in-flight work.
+        """
+        loop = asyncio.get_running_loop()
+        sem = self._stage_semaphores.get(stage)
+        if sem is None:
+            sem = self._stage_semaphores[stage] = asyncio.Semaphore(self._stage_limits[stage])
 
-            q_results.sort(key=lambda x: x["combined_score"], reverse=True)
-            try:
-                _top_scored = q_results[:5]
-                _get_emitter().emit(
-                    "memory.scoring",
-                    {
-                        "results": [
-                            {
-                                "text": r.get("metadata", {}).get("text", "")[:60],
-                                "score": round(r.get("combined_score", 0), 3),
-                                "semantic": round(r.get("score", 0), 3),
-                            }
-                            for r in _top_scored
-                        ]
-                    },
-                )
-            except Exception:  # noqa: BLE001
-                pass
+        def _release(_fut) -> None:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                loop.call_soon_threadsafe(sem.release)
 
-            # Smart gate -- fast path
-            high_conf = [
-                r
-                for r in q_results
-                if r["combined_score"] > 0.80
-                and (
-                    any(e.lower() in r["metadata"]["text"].lower() for e in entities)
-                    or not entities
-                )
-            ]
+        try:
+            async with asyncio.timeout(self._stage_timeouts[stage]):
+                await sem.acquire()
+                try:
+                    cfut = self._retrieval_executor.submit(fn, *args)
+                except BaseException:
+                    sem.release()
+                    raise
+                cfut.add_done_callback(_release)
+                return await asyncio.wrap_future(cfut)
+        except TimeoutError:
+            self._stage_timeout_counts[stage] = self._stage_timeout_counts.get(stage, 0) + 1
+            raise
 
-            if len(high_conf) >= limit:
-                with contextlib.suppress(Exception):
-                    _get_emitter().emit(
-                        "memory.fast_gate_hit",
-                        {
-                            "threshold": 0.80,
-                            "top_score": (
-                                round(high_conf[0].get("combined_score", 0), 3) if high_conf else 0
-                            ),
-                        },
+    async def aquery(
+        self,
+        text: str,
+        limit: int = 5,
+        with_graph: bool = True,
+        hemisphere: str = "safe",
+        seed_entities: list[str] | None = None,
+        embedding_context=None,
+        graph_entities: list[str] | None = None,
+    ) -> dict:
+        """Non-blocking query(): same result shape, stages run on the retrieval executor.
+
+        Pass the per-message ``embedding_context`` (see embedding/context.py) so the
+        query vector is shared with skill routing and dual cognition.
+
+        ``graph_entities`` are looked up in the same graph query as the message's
+        entities and returned structured under ``graph_neighborhoods``.
+
+        Graph lookup and query embedding run concurrently. A graph timeout drops
+        graph context, a rerank timeout degrades to scored results, and an
+        embedding or search timeout returns an error result.
+        """
+        start = time.time()
+        with contextlib.suppress(Exception):
+            _get_emitter().emit("memory.query_start", {"text": text[:80]})
+
+        try:
+            entities = self._resolve_entities(text, seed_entities)
+            routing = self._routing_label(text)
+
+            async def _graph() -> tuple[str, dict]:
+                if not (with_graph and (entities or graph_entities) and self.graph_store):
+                    return "", {}
+                try:
+                    return await self._run_stage(
+                        "graph", self._graph_context, entities, graph_entities
                     )
+                except TimeoutError:
+                    print("[WARN] Graph context timed out — continuing without it")
+                    return "", {}
+
+            (graph_context, neighborhoods), query_vec_tuple = await asyncio.gather(
+                _graph(), self._run_stage("embed", self._embed_query, text, embedding_context)
+            )
+            if query_vec_tuple is None:
+                return self._error_response("Embedding generation failed", entities, graph_context)
+
+            q_results = await self._run_stage(
+                "search", self._search_candidates, list(query_vec_tuple), limit, hemisphere, text
+            )
+            scores = self._score_candidates(q_results)
+
+            fast = self._fast_gate(q_results, scores, entities, limit)
+            if fast is not None:
                 return {
-                    "results": [
-                        {
-                            "content": x["metadata"]["text"],
-                            "score": x["combined_score"],
-                            "source": "lancedb_fast",
-                        }
-                        for x in high_conf[:limit]
-                    ],
+                    "results": fast,
                     "tier": "fast_gate",
                     "entities": entities,
                     "graph_context": graph_context,
+                    "graph_neighborhoods": neighborhoods,
                     "routing": routing,
                 }
 
-            # Reranker fallback (gracefully degrades to scored results if reranker fails)
-            with contextlib.suppress(Exception):
-                _get_emitter().emit("memory.reranking_start", {})
-            try:
-                ranker = self._get_ranker()
-                candidates = [
-                    {
-                        "id": r["id"],
-                        "text": r["metadata"]["text"],
-                        "meta": {"score": r["combined_score"]},
-                    }
-                    for r in q_results
-                ]
-                ranked = ranker.rerank(RerankRequest(query=text, passages=candidates))
-                return {
-                    "results": [
-                        {
-                            "content": x["text"],
-                            "score": float(x["score"]),
-                            "source": "lancedb_reranked",
-                        }
-                        for x in ranked[:limit]
-                    ],
-                    "tier": "reranked",
-                    "entities": entities,
-                    "graph_context": graph_context,
-                    "elapsed": f"{time.time() - start:.4f}s",
-                    "routing": routing,
-                }
-            except Exception as rerank_err:
-                print(f"[WARN] Reranker failed ({rerank_err}) — falling back to scored results")
-                return {
-                    "results": [
-                        {
-                            "content": r["metadata"]["text"],
-                            "score": r["combined_score"],
-                            "source": "lancedb_scored",
-                        }
-                        for r in q_results[:limit]
-                    ],
-                    "tier": "scored_fallback",
-                    "entities": entities,
-                    "graph_context": graph_context,
-                    "elapsed": f"{time.time() - start:.4f}s",
-                    "routing": routing,
-                }
-        except Exception as e:
-            print(f"[WARN] Memory query failed: {e}")
+            shortcut = self._rerank_shortcut(text, q_results, scores, limit)
+            if shortcut is not None:
+                results, tier = shortcut
+            else:
+                try:
+                    results = await self._run_stage("rerank", self._rerank, text, q_results, limit)
+                    tier = "reranked"
+                except Exception as rerank_err:
+                    reason = "timed out" if isinstance(rerank_err, TimeoutError) else rerank_err
+                    print(f"[WARN] Reranker failed ({reason}) — falling back to scored results")
+                    results = self._scored_fallback(q_results, scores, limit)
+                    tier = "scored_fallback"
             return {
-                "results": [],
-                "tier": "error",
-                "entities": [],
-                "graph_context": "",
-                "error": str(e),
+                "results": results,
+                "tier": tier,
+                "entities": entities,
+                "graph_context": graph_context,
+                "graph_neighborhoods": neighborhoods,
+                "elapsed": f"{time.time() - start:.4f}s",
+                "routing": routing,
             }
+        except TimeoutError:
+            print("[WARN] Memory query timed out")
+            return self._error_response("Memory query timed out")
+        except Exception as e:
+            print(f"[WARN] Memory query failed: {e}")
+            return self._error_response(str(e))
+
+    def get_retrieval_stats(self) -> dict:
+        """Executor configuration and per-stage timeout counters for health endpoints."""
+        return {
+            "workers": self._retrieval_workers,
+            "stage_concurrency": dict(self._stage_limits),
+            "stage_timeouts_s": dict(self._stage_timeouts),
+            "stage_timeouts_hit": dict(self._stage_timeout_counts),
+            "rerank": self.get_rerank_stats(),
+        }
+
+    def get_rerank_stats(self) -> dict:
+        """Rerank cache hit rate, skip count and FlashRank latency."""
+        with self._rerank_stats_lock:
+            st = dict(self._rerank_stats)
+            latency_max_s = self._rerank_latency_max_s
+        decisions = st["runs"] + st["cache_hits"] + st["skipped"]
+        return {
+            "runs": st["runs"],
+            "cache_hits": st["cache_hits"],
+            "skipped": st["skipped"],
+            "cache_hit_rate": round(st["cache_hits"] / decisions, 3) if decisions else 0.0,
+            "cache_entries": len(self._rerank_cache),
+            "avg_latency_ms": (
+                round(st["latency_total_s"] / st["runs"] * 1000, 2) if st["runs"] else 0.0
+            ),
+            "max_latency_ms": round(latency_max_s * 1000, 2),
+            "fast_gate_threshold": self._fast_gate_threshold,
+            "skip_margin": self._rerank_skip_margin,
+        }
 
     @with_retry(retries=5, delay=0.1)
     def add_memory(
@@ -375,33 +744,40 @@ class MemoryEngine:
             with open(BACKUP_FILE, "a", encoding="utf-8") as f:
                 f.write(json.dumps(entry) + "\n")
 
-            # Store - Unified connection path
-            conn = get_db_connection()
-            cursor = conn.cursor()
+            # Generate embedding before taking the write connection so the
+            # pooled writer is only held for the inserts
+            embedding = self.get_embedding(content)
             importance = self._score_importance_heuristic(content)
-            cursor.execute(
-                "INSERT INTO documents"
-                " (filename, content, hemisphere_tag, processed, unix_timestamp, importance)"
-                " VALUES (?, ?, ?, 0, ?, ?)",
-                (category, content, hemisphere, int(time.time()), importance),
-            )
-            doc_id = cursor.lastrowid
+            ts = int(time.time())
+
+            # Store - pooled write connection, committed on exit
+            with DatabaseManager.writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "INSERT INTO documents"
+                    " (filename, content, hemisphere_tag, processed, unix_timestamp, importance)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (category, content, hemisphere, int(embedding is not None), ts, importance),
+                )
+                doc_id = cursor.lastrowid
+
+                # Store in vec_items so doc is visible to semantic search immediately
+                if embedding is not None:
+                    import struct
+
+                    vec_blob = struct.pack(f"{len(embedding)}f", *embedding)
+                    try:
+                        cursor.execute(
+                            "INSERT INTO vec_items (document_id, embedding) VALUES (?, ?)",
+                            (doc_id, vec_blob),
+                        )
+                    except Exception as vec_err:
+                        print(
+                            f"[WARN] vec_items insert failed (vector search disabled?): {vec_err}"
+                        )
+            invalidate_profile_facts(category)
 
-            # Generate embedding and store in vec_items so doc is visible
-            # to semantic search immediately
-            embedding = self.get_embedding(content)
             if embedding is not None:
-                import struct
-
-                vec_blob = struct.pack(f"{len(embedding)}f", *embedding)
-                try:
-                    cursor.execute(
-                        "INSERT INTO vec_items (document_id, embedding) VALUES (?, ?)",
-                        (doc_id, vec_blob),
-                    )
-                except Exception as vec_err:
-                    print(f"[WARN] vec_items insert failed (vector search disabled?): {vec_err}")
-
                 # Also upsert to LanceDB for ANN search
                 try:
                     self.vector_store.upsert_facts(
@@ -412,7 +788,7 @@ class MemoryEngine:
                                 "metadata": {
                                     "text": content,
                                     "hemisphere_tag": hemisphere,
-                                    "unix_timestamp": int(time.time()),
+                                    "unix_timestamp": ts,
                                     "importance": importance,
                                 },
                             }
@@ -420,17 +796,133 @@ class MemoryEngine:
                     )
                 except Exception as lancedb_err:
                     print(f"[WARN] LanceDB upsert failed: {lancedb_err}")
-
-                cursor.execute("UPDATE documents SET processed = 1 WHERE id = ?", (doc_id,))
             else:
                 print(f"[WARN] Embedding failed for doc {doc_id}; queued for later processing")
 
-            conn.commit()
-            conn.close()
             return {"status": "stored", "id": doc_id, "embedded": embedding is not None}
         except Exception as e:
             return {"error": str(e)}
 
+    def add_memories(
+        self,
+        contents: list[str],
+        category: str = "direct_entry",
+        hemisphere: str = "safe",
+        chunk_size: int = 64,
+    ) -> dict:
+        """Bulk counterpart of add_memory() for session ingest and importers.
+
+        Embeds with ``embed_documents`` in chunks of *chunk_size*, writes every
+        ``documents`` / ``vec_items`` row on the pooled writer in a single
+        transaction, then sends one LanceDB merge_insert per chunk and rebuilds
+        the ANN index once at the end.  A chunk whose embedding fails is still
+        stored with ``processed = 0`` so the nightly pass can pick it up.
+
+        The whole call is held in memory until commit — callers importing very
+        large histories should split them into calls of a few thousand texts.
+        """
+        contents = [c for c in contents if c and c.strip()]
+        if not contents:
+            return {"status": "stored", "ids": [], "stored": 0, "embedded": 0}
+        chunk_size = max(1, int(chunk_size))
+
+        try:
+            # Backup -- one append for the whole batch
+            os.makedirs(os.path.dirname(BACKUP_FILE), exist_ok=True)
+            now = time.time()
+            with open(BACKUP_FILE, "a", encoding="utf-8") as f:
+                for content in contents:
+                    entry = {"timestamp": now, "category": category, "content": content}
+                    f.write(json.dumps(entry) + "\n")
+
+            import struct
+
+            # Embed everything before taking the pooled writer, so other writers
+            # are only blocked for the inserts themselves
+            chunks = [contents[i : i + chunk_size] for i in range(0, len(contents), chunk_size)]
+            chunk_vectors: list[list[list[float]] | None] = []
+            for chunk in chunks:
+                vectors = None
+                if self._embed_provider is not None:
+                    try:
+                        vectors = self._embed_provider.embed_documents(chunk)
+                    except Exception as e:
+                        print(f"[WARN] Bulk embedding failed for {len(chunk)} docs: {e}")
+                chunk_vectors.append(vectors)
+
+            ts = int(now)
+            ids: list[int] = []
+            lance_chunks: list[list[dict]] = []
+            with DatabaseManager.writer() as conn:
+                cursor = conn.cursor()
+                vec_table_ok = True
+                for chunk, vectors in zip(chunks, chunk_vectors, strict=True):
+                    facts = []
+                    vec_rows = []
+                    for i, content in enumerate(chunk):
+                        importance = self._score_importance_heuristic(content)
+                        cursor.execute(
+                            "INSERT INTO documents"
+                            " (filename, content, hemisphere_tag, processed,"
+                            " unix_timestamp, importance)"
+                            " VALUES (?, ?, ?, ?, ?, ?)",
+                            (
+                                category,
+                                content,
+                                hemisphere,
+                                int(vectors is not None),
+                                ts,
+                                importance,
+                            ),
+                        )
+                        doc_id = cursor.lastrowid
+                        ids.append(doc_id)
+                        if vectors is None:
+                            continue
+                        vec = vectors[i]
+                        vec_rows.append((doc_id, struct.pack(f"{len(vec)}f", *vec)))
+                        facts.append(
+                            {
+                                "id": doc_id,
+                                "vector": list(vec),
+                                "metadata": {
+                                    "text": content,
+                                    "hemisphere_tag": hemisphere,
+                                    "unix_timestamp": ts,
+                                    "importance": importance,
+                                },
+                            }
+                        )
+
+                    if vec_rows and vec_table_ok:
+                        try:
+                            cursor.executemany(
+                                "INSERT INTO vec_items (document_id, embedding) VALUES (?, ?)",
+                                vec_rows,
+                            )
+                        except Exception as vec_err:
+                            vec_table_ok = False
+                            print(
+                                f"[WARN] vec_items insert failed (vector search disabled?): {vec_err}"
+                            )
+                    if facts:
+                        lance_chunks.append(facts)
+            invalidate_profile_facts(category)
+
+            # LanceDB after commit so it never holds ids that memory.db rolled back
+            for facts in lance_chunks:
+                try:
+                    self.vector_store.upsert_facts(facts, defer_index=True)
+                except Exception as lancedb_err:
+                    print(f"[WARN] LanceDB bulk upsert failed: {lancedb_err}")
+            if lance_chunks:
+                self.vector_store.ensure_index()
+
+            embedded = sum(len(facts) for facts in lance_chunks)
+            return {"status": "stored", "ids": ids, "stored": len(ids), "embedded": embedded}
+        except Exception as e:
+            return {"error": str(e)}
+
     def _score_importance_heuristic(self, content: str) -> int:
         """Tier 1: Fast keyword-based importance scoring. Zero tokens."""
         score = 3
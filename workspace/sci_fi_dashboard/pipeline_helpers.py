@@ -13,7 +13,7 @@ import psutil
 from synapse_config import SynapseConfig
 
 from sci_fi_dashboard import _deps as deps
-from sci_fi_dashboard.conv_kg_extractor import run_batch_extraction
+from sci_fi_dashboard.kg_scheduler import sbs_dirs_for
 from sci_fi_dashboard.schemas import ChatRequest
 from sci_fi_dashboard.session_ingest import _ingest_session_background
 
@@ -550,24 +550,21 @@ async def gentle_worker_loop():
                 deps.brain.prune_graph()
                 deps.conflicts.prune_conflicts()
 
+                # Decay / evidence folding / VACUUM, every memory.graph.compaction.interval_hours
+                if deps.graph_compactor.due():
+                    try:
+                        await asyncio.to_thread(deps.graph_compactor.run)
+                    except Exception as e:
+                        logger.warning("[WARN] Graph compaction failed: %s", e)
+
                 # KG extraction every 2 cycles (~20 min) or 30-min fallback
                 _kg_tick += 1
                 if _kg_tick >= 2 or (time.time() - _kg_last_time) >= 1800:
                     _kg_tick = 0
                     _kg_last_time = time.time()
                     try:
-                        cfg = SynapseConfig.load()
-                        for pid, sbs in deps.sbs_registry.items():
-                            await run_batch_extraction(
-                                persona_id=pid,
-                                sbs_data_dir=str(sbs.data_dir),
-                                llm_router=deps.synapse_llm_router,
-                                graph=deps.brain,
-                                memory_db_path=str(cfg.db_dir / "memory.db"),
-                                entities_json_path=str(Path(__file__).parent / "entities.json"),
-                                min_messages=cfg.kg_extraction.min_messages,
-                                kg_role=cfg.kg_extraction.kg_role,
-                            )
+                        # Personas run concurrently and drain their backlog page by page
+                        await deps.kg_scheduler.run_cycle(sbs_dirs_for(deps.sbs_registry))
                     except Exception as e:
                         logger.warning("[WARN] KG extraction failed: %s", e)
 
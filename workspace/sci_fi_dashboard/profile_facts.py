@@ -0,0 +1,118 @@
+"""
+profile_facts.py — Cached [PERMANENT USER PROFILE] facts.
+
+persona_chat() injects the user's relationship memories plus the latest
+memory distillation into every prompt.  Those rows change rarely, so they are
+loaded once and served from memory until a write to one of
+PROFILE_CATEGORIES invalidates the snapshot (MemoryEngine.add_memory /
+add_memories and ingest call invalidate_profile_facts()).  A TTL backstops
+writers outside this process, e.g. scripts run against the same memory.db.
+
+The lookups themselves are served by idx_documents_filename (see db.py).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+PROFILE_CATEGORIES = frozenset({"relationship_memory", "memory_distillation"})
+_TTL_S = 300.0
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    facts: tuple[str, ...]
+    block: str  # "* fact" lines for the memory context block
+    lines: str  # "- fact" lines for the pre-user-turn system message
+    loaded_at: float
+
+
+_EMPTY = ProfileSnapshot(facts=(), block="", lines="", loaded_at=0.0)
+
+
+def _load() -> ProfileSnapshot:
+    from sci_fi_dashboard.db import DatabaseManager
+
+    with DatabaseManager.reader() as conn:
+        # Relationship memories first (core knowledge, compact)
+        rel = conn.execute(
+            "SELECT content FROM documents WHERE filename='relationship_memory' ORDER BY id ASC"
+        ).fetchall()
+        # Latest distillation only (avoid token bloat)
+        dist = conn.execute(
+            "SELECT content FROM documents WHERE filename='memory_distillation'"
+            " ORDER BY id DESC LIMIT 1"
+        ).fetchall()
+    facts = tuple(r[0] for r in rel if r[0]) + tuple(r[0] for r in dist if r[0])
+    return ProfileSnapshot(
+        facts=facts,
+        block="\n".join(f"* {f}" for f in facts),
+        lines="\n".join(f"- {f}" for f in facts),
+        loaded_at=time.time(),
+    )
+
+
+class ProfileFactsCache:
+    """Process-wide snapshot of the permanent profile, reloaded on invalidation."""
+
+    def __init__(self, ttl_s: float = _TTL_S) -> None:
+        self._ttl_s = ttl_s
+        self._snapshot: ProfileSnapshot | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def get(self) -> ProfileSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and time.time() - snapshot.loaded_at < self._ttl_s:
+            self.hits += 1
+            return snapshot
+
+        with self._lock:
+            generation = self._generation
+        try:
+            snapshot = _load()
+        except Exception:
+            # Keep serving the last good snapshot if memory.db is unavailable
+            return self._snapshot or _EMPTY
+        with self._lock:
+            # An invalidation that raced the load means this snapshot may be stale
+            if generation == self._generation:
+                self._snapshot = snapshot
+            self.loads += 1
+        return snapshot
+
+    def invalidate(self, category: str | None = None) -> None:
+        """Drop the snapshot if *category* is a profile category (or None = always)."""
+        if category is not None and category not in PROFILE_CATEGORIES:
+            return
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+
+    def get_stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "facts": len(snapshot.facts) if snapshot else 0,
+            "hits": self.hits,
+            "loads": self.loads,
+            "age_s": round(time.time() - snapshot.loaded_at, 1) if snapshot else None,
+        }
+
+
+_cache = ProfileFactsCache()
+
+
+def get_profile_facts() -> ProfileSnapshot:
+    return _cache.get()
+
+
+def invalidate_profile_facts(category: str | None = None) -> None:
+    _cache.invalidate(category)
+
+
+def get_profile_stats() -> dict:
+    return _cache.get_stats()
@@ -7,15 +7,20 @@ for cosine distance search against both atomic_facts_vec and vec_items tables.
 Falls back to FTS (full-text search) if no embedding provider is available.
 """
 
+import contextlib
 import json
 import os
+import re
 import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Import centralized DB module
 try:
-    from .db import get_db_connection
+    from .db import DatabaseManager
 except ImportError:
-    from db import get_db_connection
+    from db import DatabaseManager
 
 try:
     from sci_fi_dashboard.embedding import get_provider
@@ -26,8 +31,18 @@ except ImportError:
         get_provider = lambda: None  # noqa: E731
 
 
-def get_embedding(text: str) -> list[float] | None:
-    """Generate an embedding vector for the given text. Returns None on failure."""
+def get_embedding(text: str, embedding_context=None) -> list[float] | None:
+    """Generate an embedding vector for the given text. Returns None on failure.
+
+    ``embedding_context`` (a MessageEmbeddingContext) reuses a vector already
+    computed for the same message elsewhere in the request.
+    """
+    if embedding_context is not None:
+        try:
+            return embedding_context.embed_query(text)
+        except Exception as e:
+            print(f"[WARN] get_embedding failed: {e}")
+            return None
     provider = get_provider()
     if provider is None:
         return None
@@ -43,7 +58,161 @@ def _serialize_f32(vector: list) -> bytes:
     return struct.pack(f"{len(vector)}f", *vector)
 
 
-# _get_connection removed; use get_db_connection() imported from db.py
+# _get_connection removed; read paths check out DatabaseManager.reader() connections
+
+
+# Entity names matched against entity_links for context enrichment
+_ENTITY_KEYWORDS = frozenset(
+    {
+        "the_creator",
+        "the_partner",
+        "the_partner_nickname",
+        "yourworkplace",
+        "synapse",
+        "friend_name",
+        "sikkim",
+        "kolkata",
+        "elden",
+        "sims",
+    }
+)
+
+# relationship_memories is only written by offline scripts; a TTL bounds staleness
+_RELATIONSHIP_TTL_S = 300.0
+_relationship_cache: tuple[float, list[dict]] | None = None
+_relationship_lock = threading.Lock()
+
+# Runs FTS next to the other sub-queries when there is no embedding (on its own pooled reader)
+_fts_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="retriever-fts")
+
+
+def _timed(timings: dict, name: str, fn, *args):
+    """Run ``fn(*args)``, recording its wall time in ms under *name*."""
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
+
+def _vector_facts(cursor, vec_blob: bytes, limit: int) -> list[dict]:
+    """atomic_facts_vec KNN joined to atomic_facts in ONE statement."""
+    # The CTE keeps sqlite-vec's KNN (MATCH + k) as the driving scan
+    cursor.execute(
+        """
+        WITH knn AS (
+            SELECT fact_id, distance
+            FROM atomic_facts_vec
+            WHERE embedding MATCH ?
+              AND k = ?
+        )
+        SELECT f.entity, f.content, f.category, knn.distance
+        FROM knn
+        JOIN atomic_facts f ON f.id = knn.fact_id
+        ORDER BY knn.distance
+        """,
+        (vec_blob, limit),
+    )
+    return [
+        {
+            "entity": row[0],
+            "content": row[1],
+            "category": row[2],
+            "distance": round(row[3], 4),
+        }
+        for row in cursor.fetchall()
+    ]
+
+
+def _vector_documents(cursor, vec_blob: bytes, limit: int, session_type: str) -> list[dict]:
+    """vec_items KNN joined to documents -- WITH HIERARCHICAL ACCESS.
+
+    - 'spicy' sees ALL (safe + spicy)
+    - 'safe' sees ONLY safe
+    """
+    if session_type == "spicy":
+        filter_clause = "d.hemisphere_tag IN ('safe', 'spicy')"
+        params = (vec_blob, limit)
+    else:
+        filter_clause = "d.hemisphere_tag = ?"
+        params = (vec_blob, limit, "safe")
+
+    # Optimized JOIN query with Session-Aware filtering
+    cursor.execute(
+        f"""
+        SELECT
+            d.filename,
+            d.content,
+            v.distance
+        FROM vec_items v
+        JOIN documents d ON v.document_id = d.id
+        WHERE v.embedding MATCH ?
+          AND k = ?
+          AND {filter_clause}
+    """,
+        params,
+    )
+    return [
+        {
+            "source": filename,
+            "content": content[:500],  # Truncate for prompt size
+            "distance": round(dist, 4),
+        }
+        for filename, content, dist in cursor.fetchall()
+    ]
+
+
+def _fts_documents(user_message: str, limit: int, session_type: str) -> list[dict]:
+    """FTS5 search over documents on its own pooled reader (thread-safe)."""
+    # Sanitize FTS5 query: keep only alphanumeric and spaces
+    sanitized = re.sub(r"[^\w\s]", "", user_message)
+    # Split into words for OR-style matching
+    words = [w for w in sanitized.split() if len(w) > 2]
+    if not words:
+        return []
+    fts_query = " OR ".join(words)
+    # For FTS, we do a post-filter join since FTS table doesn't have tags
+    # directly. documents_fts is content=documents so we join on rowid.
+    # Hierarchy: spicy sessions see safe+spicy; safe sees only safe.
+    if session_type == "spicy":
+        hemisphere_clause = "d.hemisphere_tag IN ('safe', 'spicy')"
+        fts_params = (fts_query, limit)
+    else:
+        hemisphere_clause = "d.hemisphere_tag = ?"
+        fts_params = (fts_query, "safe", limit)
+
+    with DatabaseManager.reader() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT d.content, fts.rank
+            FROM documents_fts fts
+            JOIN documents d ON fts.rowid = d.id
+            WHERE documents_fts MATCH ?
+            AND {hemisphere_clause}
+            ORDER BY rank
+            LIMIT ?
+        """,
+            fts_params,
+        ).fetchall()
+    return [{"source": "fts", "content": row[0][:500], "distance": abs(row[1])} for row in rows]
+
+
+def _relationship_memories(cursor) -> list[dict]:
+    """Latest 5 relationship_memories rows, cached for _RELATIONSHIP_TTL_S."""
+    global _relationship_cache
+    cached = _relationship_cache
+    if cached is not None and time.monotonic() - cached[0] < _RELATIONSHIP_TTL_S:
+        return cached[1]
+    cursor.execute("""
+        SELECT category, content, source_event
+        FROM relationship_memories
+        ORDER BY created_at DESC
+        LIMIT 5
+    """)
+    rows = [{"category": row[0], "content": row[1], "source": row[2]} for row in cursor.fetchall()]
+    with _relationship_lock:
+        _relationship_cache = (time.monotonic(), rows)
+    return rows
 
 
 def query_memories(
@@ -52,6 +221,7 @@ def query_memories(
     use_atomic: bool = True,
     use_docs: bool = True,
     session_type: str = "safe",  # 'safe' or 'spicy'
+    embedding_context=None,
 ) -> dict[str, any]:
     """
     Query memory.db for relevant context.
@@ -59,21 +229,36 @@ def query_memories(
     Returns facts from both atomic_facts (structured knowledge)
     and documents (raw ingested text), plus relationship memories.
 
-    Falls back to FTS if no embedding model is available.
+    Plan: embed first (no connection held during inference), then run the
+    vector KNN sub-queries, the cached relationship memories and the
+    entity_links lookup on ONE reader.  FTS is a fallback: without an
+    embedding it is the only source and runs concurrently on a second pooled
+    reader; otherwise it runs afterwards, and only if vector search found
+    nothing.  ``timings_ms`` reports each sub-query plus the total.
     """
     provider = get_provider()
     embed_mode = provider.info().name if provider is not None else "fts_only"
-    conn = get_db_connection()
     results = {
         "facts": [],
         "documents": [],
         "relationships": [],
         "method": embed_mode,
     }
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
 
-    try:
+    # Embed before checking out a pooled connection so it isn't held during inference
+    vec = _timed(timings, "embed", get_embedding, user_message, embedding_context)
+
+    # Note: FTS filtering by tag would require FTS5 vocabulary update or join, keeping simple for now
+    fts_future = None
+    if vec is None:
+        fts_future = _fts_executor.submit(
+            _timed, timings, "fts", _fts_documents, user_message, limit, session_type
+        )
+
+    with DatabaseManager.reader() as conn:
         cursor = conn.cursor()
-        vec = get_embedding(user_message)
 
         # --- Vector Search (if embeddings available) ---
         if vec is not None:
@@ -83,198 +268,109 @@ def query_memories(
             # Atomic facts don't currently have tags, so we keep them global/common knowledge
             if use_atomic:
                 try:
-                    cursor.execute(
-                        """
-                        SELECT
-                            fact_id,
-                            distance
-                        FROM atomic_facts_vec
-                        WHERE embedding MATCH ?
-                        AND k = ?
-                    """,
-                        (vec_blob, limit),
+                    results["facts"].extend(
+                        _timed(timings, "vector_facts", _vector_facts, cursor, vec_blob, limit)
                     )
-
-                    for row in cursor.fetchall():
-                        fid, dist = row[0], row[1]
-                        # Look up the actual fact
-                        cursor.execute(
-                            "SELECT entity, content, category FROM atomic_facts WHERE id = ?",
-                            (fid,),
-                        )
-                        fact = cursor.fetchone()
-                        if fact:
-                            results["facts"].append(
-                                {
-                                    "entity": fact[0],
-                                    "content": fact[1],
-                                    "category": fact[2],
-                                    "distance": round(dist, 4),
-                                }
-                            )
                 except Exception as e:
                     print(f"[WARN] atomic_facts_vec query failed: {e}")
 
-            # 2. Search vec_items (documents) - WITH HIERARCHICAL ACCESS
+            # 2. Search vec_items (documents)
             if use_docs:
                 try:
-                    # HIERARCHY LOGIC:
-                    # - 'spicy' sees ALL (safe + spicy)
-                    # - 'safe' sees ONLY safe
-                    if session_type == "spicy":
-                        filter_clause = "d.hemisphere_tag IN ('safe', 'spicy')"
-                        params = (vec_blob, limit)
-                    else:
-                        filter_clause = "d.hemisphere_tag = ?"
-                        params = (vec_blob, limit, "safe")
-
-                    # Optimized JOIN query with Session-Aware filtering
-                    cursor.execute(
-                        f"""
-                        SELECT
-                            d.filename,
-                            d.content,
-                            v.distance
-                        FROM vec_items v
-                        JOIN documents d ON v.document_id = d.id
-                        WHERE v.embedding MATCH ?
-                          AND k = ?
-                          AND {filter_clause}
-                    """,
-                        params,
-                    )
-
-                    for row in cursor.fetchall():
-                        filename, content, dist = row[0], row[1], row[2]
-                        results["documents"].append(
-                            {
-                                "source": filename,
-                                "content": content[:500],  # Truncate for prompt size
-                                "distance": round(dist, 4),
-                            }
+                    results["documents"].extend(
+                        _timed(
+                            timings,
+                            "vector_documents",
+                            _vector_documents,
+                            cursor,
+                            vec_blob,
+                            limit,
+                            session_type,
                         )
-
+                    )
                     if session_type == "spicy":
                         results["method"] = "sqlite-vec (spicy-mode)"
                     else:
                         results["method"] = "sqlite-vec (safe-mode)"
-
                 except Exception as e:
                     print(f"[WARN] vec_items query failed: {e}")
 
-        # --- FTS Fallback (always try as supplement) ---
-        # Note: FTS filtering by tag would require FTS5 vocabulary update or join, keeping simple for now
-        if not results["facts"] and not results["documents"]:
-            try:
-                import re
-
-                # Sanitize FTS5 query: keep only alphanumeric and spaces
-                sanitized = re.sub(r"[^\w\s]", "", user_message)
-                # Split into words for OR-style matching
-                words = [w for w in sanitized.split() if len(w) > 2]
-                if words:
-                    fts_query = " OR ".join(words)
-                    # For FTS, we do a post-filter join since FTS table doesn't have tags
-                    # directly. documents_fts is content=documents so we join on rowid.
-                    # Hierarchy: spicy sessions see safe+spicy; safe sees only safe.
-                    if session_type == "spicy":
-                        hemisphere_clause = "d.hemisphere_tag IN ('safe', 'spicy')"
-                        fts_params = (fts_query, limit)
-                    else:
-                        hemisphere_clause = "d.hemisphere_tag = ?"
-                        fts_params = (fts_query, "safe", limit)
-
-                    cursor.execute(
-                        f"""
-                        SELECT d.content, fts.rank
-                        FROM documents_fts fts
-                        JOIN documents d ON fts.rowid = d.id
-                        WHERE documents_fts MATCH ?
-                        AND {hemisphere_clause}
-                        ORDER BY rank
-                        LIMIT ?
-                    """,
-                        fts_params,
-                    )
-
-                    for row in cursor.fetchall():
-                        results["documents"].append(
-                            {
-                                "source": "fts",
-                                "content": row[0][:500],
-                                "distance": abs(row[1]),
-                            }
-                        )
-                    results["method"] = "fts_fallback"
-            except Exception as e:
-                print(f"[WARN] FTS fallback failed: {e}")
-
-        # --- Always check relationship memories ---
-        try:
-            cursor.execute("""
-                SELECT category, content, source_event
-                FROM relationship_memories
-                ORDER BY created_at DESC
-                LIMIT 5
-            """)
-            for row in cursor.fetchall():
-                results["relationships"].append(
-                    {
-                        "category": row[0],
-                        "content": row[1],
-                        "source": row[2],
-                    }
-                )
-        except Exception:
-            pass
+        # --- Always include relationship memories ---
+        with contextlib.suppress(Exception):
+            results["relationships"] = _timed(
+                timings, "relationships", _relationship_memories, cursor
+            )
 
         # --- Entity links for context enrichment ---
         try:
             # Extract potential entities from message
-            words = set(user_message.lower().split())
-            entity_keywords = {
-                "the_creator",
-                "the_partner",
-                "the_partner_nickname",
-                "yourworkplace",
-                "synapse",
-                "friend_name",
-                "sikkim",
-                "kolkata",
-                "elden",
-                "sims",
-            }
-            matched = words & entity_keywords
-
+            matched = set(user_message.lower().split()) & _ENTITY_KEYWORDS
             if matched:
-                for entity in matched:
-                    cursor.execute(
-                        """
-                        SELECT subject, relation, object
-                        FROM entity_links
-                        WHERE LOWER(subject) = ? OR LOWER(object) = ?
-                        LIMIT 5
-                    """,
-                        (entity, entity),
+                rows = _timed(timings, "entity_links", _entity_link_rows, cursor, sorted(matched))
+                for row in rows:
+                    results["facts"].append(
+                        {
+                            "entity": row[0],
+                            "content": f"{row[0]} {row[1]} {row[2]}",
+                            "category": "entity_link",
+                            "distance": 0.0,
+                        }
                     )
-                    for row in cursor.fetchall():
-                        results["facts"].append(
-                            {
-                                "entity": row[0],
-                                "content": f"{row[0]} {row[1]} {row[2]}",
-                                "category": "entity_link",
-                                "distance": 0.0,
-                            }
-                        )
         except Exception:
             pass
 
-    finally:
-        conn.close()
-
+    # --- FTS Fallback (only when vector search found nothing) ---
+    has_vector_hits = any(f["category"] != "entity_link" for f in results["facts"])
+    if not has_vector_hits and not results["documents"]:
+        try:
+            if fts_future is not None:
+                fts_docs = fts_future.result()
+            else:
+                fts_docs = _timed(timings, "fts", _fts_documents, user_message, limit, session_type)
+            if fts_docs:
+                results["documents"].extend(fts_docs)
+                results["method"] = "fts_fallback"
+        except Exception as e:
+            print(f"[WARN] FTS fallback failed: {e}")
+
+    timings["total"] = round((time.perf_counter() - start) * 1000, 2)
+    results["timings_ms"] = timings
     return results
 
 
+def _entity_link_rows(cursor, entities: list[str], per_entity: int = 5) -> list[tuple]:
+    """Active entity_links rows mentioning any of *entities* -- ONE query.
+
+    Matches the LOWER()-normalized subject_norm / object_norm columns through
+    their covering indexes (db._ensure_entity_links), newest first, at most
+    *per_entity* rows per entity.  Returns ``(subject, relation, object)`` tuples.
+    """
+    placeholders = ",".join("?" * len(entities))
+    cursor.execute(
+        f"""
+        WITH hits AS (
+            SELECT subject_norm AS entity, id, subject, relation, object
+            FROM entity_links
+            WHERE subject_norm IN ({placeholders}) AND archived = 0
+            UNION
+            SELECT object_norm, id, subject, relation, object
+            FROM entity_links
+            WHERE object_norm IN ({placeholders}) AND archived = 0
+        ),
+        ranked AS (
+            SELECT entity, subject, relation, object,
+                   ROW_NUMBER() OVER (PARTITION BY entity ORDER BY id DESC) AS rn
+            FROM hits
+        )
+        SELECT subject, relation, object FROM ranked
+        WHERE rn <= ?
+        ORDER BY entity, rn
+        """,
+        (*entities, *entities, per_entity),
+    )
+    return cursor.fetchall()
+
+
 def format_context_for_prompt(memory_results: dict) -> str:
     """Format retrieved memories into a clean text block for the LLM prompt."""
     sections = []
@@ -304,45 +400,45 @@ def get_db_stats() -> dict:
     """Get basic stats about the memory database."""
     # DB path check handled by db.py
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
     stats = {}
+    with DatabaseManager.reader() as conn:
+        cursor = conn.cursor()
 
-    try:
-        cursor.execute("SELECT COUNT(*) FROM atomic_facts")
-        stats["atomic_facts"] = cursor.fetchone()[0]
-    except Exception:
-        stats["atomic_facts"] = 0
+        try:
+            cursor.execute("SELECT COUNT(*) FROM atomic_facts")
+            stats["atomic_facts"] = cursor.fetchone()[0]
+        except Exception:
+            stats["atomic_facts"] = 0
 
-    try:
-        cursor.execute("SELECT COUNT(*) FROM documents")
-        stats["documents"] = cursor.fetchone()[0]
-    except Exception:
-        stats["documents"] = 0
+        try:
+            cursor.execute("SELECT COUNT(*) FROM documents")
+            stats["documents"] = cursor.fetchone()[0]
+        except Exception:
+            stats["documents"] = 0
 
-    try:
-        cursor.execute("SELECT COUNT(*) FROM entity_links WHERE archived = 0")
-        stats["entity_links"] = cursor.fetchone()[0]
-    except Exception:
-        stats["entity_links"] = 0
+        try:
+            cursor.execute("SELECT COUNT(*) FROM entity_links WHERE archived = 0")
+            stats["entity_links"] = cursor.fetchone()[0]
+        except Exception:
+            stats["entity_links"] = 0
 
-    try:
-        cursor.execute("SELECT COUNT(*) FROM relationship_memories")
-        stats["relationship_memories"] = cursor.fetchone()[0]
-    except Exception:
-        stats["relationship_memories"] = 0
+        try:
+            cursor.execute("SELECT COUNT(*) FROM relationship_memories")
+            stats["relationship_memories"] = cursor.fetchone()[0]
+        except Exception:
+            stats["relationship_memories"] = 0
 
-    try:
-        cursor.execute("SELECT COUNT(*) FROM roast_vault")
-        stats["roasts"] = cursor.fetchone()[0]
-    except Exception:
-        stats["roasts"] = 0
+        try:
+            cursor.execute("SELECT COUNT(*) FROM roast_vault")
+            stats["roasts"] = cursor.fetchone()[0]
+        except Exception:
+            stats["roasts"] = 0
 
-    try:
-        cursor.execute("SELECT COUNT(*) FROM gift_date_vault")
-        stats["gift_ideas"] = cursor.fetchone()[0]
-    except Exception:
-        stats["gift_ideas"] = 0
+        try:
+            cursor.execute("SELECT COUNT(*) FROM gift_date_vault")
+            stats["gift_ideas"] = cursor.fetchone()[0]
+        except Exception:
+            stats["gift_ideas"] = 0
 
     # Size check redundant with db.py but nice to have in stats
     try:
@@ -357,7 +453,6 @@ def get_db_stats() -> dict:
     _provider = get_provider()
     stats["embed_mode"] = _provider.info().name if _provider is not None else "not_available"
 
-    conn.close()
     return stats
 
 
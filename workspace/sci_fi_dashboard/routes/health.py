@@ -5,7 +5,10 @@ import logging
 from fastapi import APIRouter, Depends
 
 from sci_fi_dashboard import _deps as deps
+from sci_fi_dashboard.db import get_pool_stats
+from sci_fi_dashboard.kg_scheduler import sbs_dirs_for
 from sci_fi_dashboard.middleware import _require_gateway_auth
+from sci_fi_dashboard.profile_facts import get_profile_stats
 from sci_fi_dashboard.retriever import get_db_stats
 
 logger = logging.getLogger(__name__)
@@ -55,6 +58,100 @@ async def health():
 async def gateway_status():
     return {
         "queue": deps.task_queue.get_stats(),
+        "flood": deps.flood.get_stats(),
+        "dedup": deps.dedup.get_stats(),
         "workers": deps.app.state.worker.num_workers if hasattr(deps.app.state, "worker") else 0,
+        "sessions": _session_stats(),
+        "autoscaler": _autoscaler_stats(),
+        "memory_retrieval": _retrieval_stats(),
+        "vector_index": _vector_index_stats(),
+        "db_pool": get_pool_stats(),
+        "profile_cache": get_profile_stats(),
+        "graph_cache": _graph_cache_stats(),
+        "graph_compaction": _graph_compaction_stats(),
+        "entity_gate": _entity_gate_stats(),
+        "kg_extraction": _kg_extraction_stats(),
         "timestamp": __import__("datetime").datetime.now().isoformat(),
     }
+
+
+def _session_stats() -> dict:
+    worker = getattr(deps.app.state, "worker", None)
+    if worker is None:
+        return {}
+    try:
+        return worker.get_stats()
+    except Exception:
+        return {}
+
+
+def _autoscaler_stats() -> dict:
+    autoscaler = getattr(deps.app.state, "worker_autoscaler", None)
+    if autoscaler is None:
+        return {}
+    try:
+        return autoscaler.get_stats()
+    except Exception:
+        return {}
+
+
+def _vector_index_stats() -> dict:
+    store = getattr(deps.memory_engine, "vector_store", None)
+    get_stats = getattr(store, "get_index_stats", None)
+    if get_stats is None:
+        return {}
+    try:
+        return get_stats()
+    except Exception:
+        return {}
+
+
+def _graph_cache_stats() -> dict:
+    get_stats = getattr(deps.brain, "get_cache_stats", None)
+    if get_stats is None:
+        return {}
+    try:
+        return get_stats()
+    except Exception:
+        return {}
+
+
+def _graph_compaction_stats() -> dict:
+    compactor = getattr(deps, "graph_compactor", None)
+    if compactor is None:
+        return {}
+    try:
+        return compactor.get_stats()
+    except Exception:
+        return {}
+
+
+def _entity_gate_stats() -> dict:
+    get_stats = getattr(deps.gate, "get_stats", None)
+    if get_stats is None:
+        return {}
+    try:
+        return get_stats()
+    except Exception:
+        return {}
+
+
+def _kg_extraction_stats() -> dict:
+    scheduler = getattr(deps, "kg_scheduler", None)
+    if scheduler is None:
+        return {}
+    try:
+        scheduler.refresh_backlog(sbs_dirs_for(deps.sbs_registry))
+        return scheduler.get_stats()
+    except Exception:
+        return {}
+
+
+def _retrieval_stats() -> dict:
+    get_stats = getattr(deps.memory_engine, "get_retrieval_stats", None)
+    if get_stats is None:
+        return {}
+    try:
+        return get_stats()
+    except Exception:
+        return {}
@@ -1,6 +1,7 @@
 """Knowledge graph and memory endpoints."""
 
 import ast
+import asyncio
 import json
 import logging
 from contextlib import suppress
@@ -90,22 +91,26 @@ async def query_memory(item: QueryItem, request: Request):
     validate_api_key(request)
     logger.info("Query: %s", item.text)
 
-    # Graph search
+    # Graph search -- one neighborhood lookup for every token
     graph_results = []
     try:
-        tokens = item.text.split()
+        tokens = list(dict.fromkeys(item.text.split()))
+        hoods = deps.brain.get_neighborhoods(tokens, hops=1, per_entity_limit=1000)
         for token in tokens:
-            if deps.brain.graph.has_node(token):
-                graph_results.append(token)
-                for n in deps.brain.graph.neighbors(token):
-                    graph_results.append(f"{token} -> {n}")
+            edges = hoods.get(token, [])
+            if not edges and not deps.brain.graph.has_node(token):
+                continue
+            graph_results.append(token)
+            # Outgoing neighbors, heaviest first
+            for n in dict.fromkeys(e["target"] for e in edges if e["source"] == token):
+                graph_results.append(f"{token} -> {n}")
     except Exception:
         pass
 
-    # Vector search
+    # Vector search -- sync SQLite plan, kept off the event loop
     memory_results = {}
     with suppress(Exception):
-        memory_results = query_memories(item.text, limit=3)
+        memory_results = await asyncio.to_thread(query_memories, item.text, limit=3)
 
     return {
         "graph": graph_results,
@@ -2,10 +2,11 @@
 
 Runs as asyncio.create_task() from pipeline_helpers._handle_new_command().
 
-Per batch of conversation turns:
-  1. Vector ingestion: MemoryEngine.add_memory() → LanceDB + sqlite-vec
+  1. Vector ingestion: MemoryEngine.add_memories() → LanceDB + sqlite-vec,
+                       all batches in one bulk write
+Then per batch of conversation turns:
   2. KG extraction:    ConvKGExtractor.extract() via LLM router → validated triples
-  3. Triple writes:    SQLiteGraph.add_relation() + entity_links table in memory.db
+  3. Triple writes:    SQLiteGraph.bulk_upsert() + entity_links table in memory.db
 
 Batched with BATCH_SLEEP_S between batches to avoid rate limits.
 Never blocks the chat pipeline.
@@ -53,7 +54,7 @@ async def _ingest_session_background(
     """Background coroutine: run full memory loop on an archived session transcript.
 
     Reads the archived JSONL, groups messages into batches, then for each batch:
-      - Ingests into vector memory (MemoryEngine.add_memory)
+      - Ingests into vector memory (MemoryEngine.add_memories)
       - Extracts KG triples (ConvKGExtractor.extract via LLM router)
       - Writes triples to SQLiteGraph (deps.brain) and entity_links table
 
@@ -70,7 +71,7 @@ async def _ingest_session_background(
     from sci_fi_dashboard.conv_kg_extractor import (
         ConvKGExtractor,
         _ensure_entity_links,
-        _write_triple_to_entity_links,
+        _write_triples_to_entity_links,
     )
     from sci_fi_dashboard.multiuser.transcript import load_messages
 
@@ -131,23 +132,26 @@ async def _ingest_session_background(
         session_key,
     )
 
-    ingested_vec = 0
+    texts = [_format_batch(batch, date_str) for batch in batches]
     ingested_kg = 0
 
-    for i, batch in enumerate(batches):
-        text = _format_batch(batch, date_str)
-
-        # ── 1. Vector ingestion ──
-        try:
-            deps.memory_engine.add_memory(
-                content=text,
-                category="session",
-                hemisphere=hemisphere,
-            )
-            ingested_vec += 1
-        except Exception as exc:
-            log.error("[session_ingest] vector batch %d/%d failed: %s", i + 1, len(batches), exc)
+    # ── 1. Vector ingestion — one bulk write for the whole session ──
+    ingested_vec = 0
+    try:
+        result = await asyncio.to_thread(
+            deps.memory_engine.add_memories,
+            texts,
+            category="session",
+            hemisphere=hemisphere,
+        )
+        if "error" in result:
+            log.error("[session_ingest] vector ingestion failed: %s", result["error"])
+        else:
+            ingested_vec = result["stored"]
+    except Exception as exc:
+        log.error("[session_ingest] vector ingestion failed: %s", exc)
 
+    for i, text in enumerate(texts):
         # ── 2. KG extraction + triple writes ──
         if extractor is not None:
             try:
@@ -158,25 +162,18 @@ async def _ingest_session_background(
                     conn = sqlite3.connect(memory_db_path)
                     try:
                         _ensure_entity_links(conn)
+                        links = []
                         for triple, confidence in validated:
                             if len(triple) < 3:
                                 continue
                             subj, rel, obj = str(triple[0]), str(triple[1]), str(triple[2])
                             if not subj.strip() or not rel.strip() or not obj.strip():
                                 continue
-                            # Write to SQLiteGraph (in-memory + persisted on save_graph)
-                            deps.brain.add_node(subj)
-                            deps.brain.add_node(obj)
-                            deps.brain.add_relation(subj, rel, obj, weight=confidence)
-                            # Write to entity_links table in memory.db
-                            _write_triple_to_entity_links(
-                                conn,
-                                subj,
-                                rel,
-                                obj,
-                                fact_id=0,
-                                confidence=confidence,
-                            )
+                            links.append((subj, rel, obj, confidence))
+                        # Write to entity_links table in memory.db -- one executemany
+                        _write_triples_to_entity_links(conn, links)
+                        # Write to SQLiteGraph -- one transaction per batch
+                        deps.brain.bulk_upsert(edges=[(s, o, r, c) for s, r, o, c in links])
                         conn.commit()
                     finally:
                         conn.close()
@@ -70,8 +70,12 @@ class SkillRouter:
             self._embeddings = []
             self._embed_fn = None
 
-    def match(self, user_message: str) -> SkillManifest | None:
-        """Find the best-matching skill for the user message, or None."""
+    def match(self, user_message: str, embedding_context=None) -> SkillManifest | None:
+        """Find the best-matching skill for the user message, or None.
+
+        ``embedding_context`` is the per-message MessageEmbeddingContext; when
+        given, the message vector already computed for memory retrieval is reused.
+        """
         if not self._skills:
             return None
 
@@ -86,7 +90,7 @@ class SkillRouter:
             return trigger_hit
 
         # Stage 2: Embedding similarity
-        embedding_hit, score = self._try_embedding_match(user_message)
+        embedding_hit, score = self._try_embedding_match(user_message, embedding_context)
         if embedding_hit is not None:
             logger.info(
                 "[Skills] Embedding match: '%s...' -> %s (score=%.3f)",
@@ -112,13 +116,18 @@ class SkillRouter:
                     return skill
         return None
 
-    def _try_embedding_match(self, user_message: str) -> tuple[SkillManifest | None, float]:
+    def _try_embedding_match(
+        self, user_message: str, embedding_context=None
+    ) -> tuple[SkillManifest | None, float]:
         """Embed user message and find highest-similarity skill above threshold."""
         if self._embed_fn is None or not self._embeddings:
             return None, 0.0
 
         try:
-            query_vec = self._embed_fn(user_message)
+            if embedding_context is not None:
+                query_vec = embedding_context.embed_query(user_message)
+            else:
+                query_vec = self._embed_fn(user_message)
         except Exception as exc:
             logger.warning("[Skills] Embedding query failed: %s", exc)
             return None, 0.0
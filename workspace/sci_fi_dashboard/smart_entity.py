@@ -1,49 +1,297 @@
 import json
 import os
+import threading
+import time
 
 from flashtext import KeywordProcessor
 
+_TRIE_VERSION = 1
+_SAVE_INTERVAL_S = 300.0  # min gap between background trie saves
+_ALIAS_CHECK_INTERVAL_S = 30.0  # how often extract_entities() stats entities.json
+
+
+def _mtime(path: str) -> float | None:
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
 
 class EntityGate:
-    def __init__(self, graph_store=None, entities_file="entities.json"):
+    """FlashText gate over knowledge-graph node names plus entities.json aliases.
+
+    Kept live: the gate subscribes to SQLiteGraph writes and adds new node
+    names as they are committed, and re-reads entities.json when its mtime
+    changes (conv_kg_extractor appends to it, possibly from another process).
+    Both are applied incrementally; only when graph compaction merges nodes
+    away or aliases are deleted from entities.json is the trie rebuilt, so
+    names that no longer exist stop matching.
+
+    The trie is persisted to ``trie_file`` (default: entity_gate_trie.json
+    next to knowledge_graph.db) together with the highest node rowid it
+    covers and the entities.json mtime it was built with, so startup loads
+    it and only scans nodes inserted since.
+    """
+
+    def __init__(self, graph_store=None, entities_file="entities.json", trie_file=None):
         self.keyword_processor = KeywordProcessor()
         # Resolve path relative to this script
         base_dir = os.path.dirname(os.path.abspath(__file__))
         self.entities_file = os.path.join(base_dir, entities_file)
-        self._load_from_graph(graph_store)
-        self._load_aliases(self.entities_file)
+        self._graph = graph_store
+        db_path = getattr(graph_store, "db_path", None)
+        self._graph_path = os.path.abspath(db_path) if db_path else None
+        if trie_file is None and db_path:
+            trie_file = os.path.join(os.path.dirname(db_path), "entity_gate_trie.json")
+        self.trie_file = trie_file
+
+        self._lock = threading.Lock()  # guards trie mutation vs. serialization
+        self._max_rowid = 0
+        self._dirty = False
+        self._saving = False
+        self._last_save = 0.0
+        self._aliases: dict[str, list] = {}  # alias groups currently in the trie
+        self._aliases_mtime: float | None = None
+        self._trie_aliases_mtime: float | None = None  # as recorded in the saved trie
+        self._aliases_checked = time.monotonic()
+        self.live_added = 0
+        self.rebuilds = 0
+
+        restored = self._load_from_graph(graph_store)
+        if restored and self._trie_aliases_mtime != _mtime(self.entities_file):
+            # entities.json changed while we were down -- removed aliases are still in the trie
+            print("[WARN] EntityGate: entities.json changed since the trie was saved — rebuilding")
+            self.rebuild()
+        else:
+            self._load_aliases(self.entities_file)
+            if self._dirty or self._aliases_mtime != self._trie_aliases_mtime:
+                self.save_trie()
+        if graph_store is not None and hasattr(graph_store, "add_listener"):
+            graph_store.add_listener(self.on_graph_write)
 
-    def _load_from_graph(self, graph_store) -> None:
-        """Loads entity names from a SQLiteGraph (or duck-typed equivalent) into FlashText."""
+    def _load_from_graph(self, graph_store) -> bool:
+        """Loads entity names from a SQLiteGraph (or duck-typed equivalent) into FlashText.
+
+        Returns True if the persisted trie was restored.
+        """
         if graph_store is None:
             print("[WARN] EntityGate: no graph_store provided — skipping KG load")
-            return
-        names = graph_store.get_all_node_names()
+            return False
+        if not hasattr(graph_store, "get_node_names_since"):
+            names = graph_store.get_all_node_names()
+            for name in names:
+                self.keyword_processor.add_keyword(name)
+            print(f"[OK] EntityGate: loaded {len(names)} entities from knowledge graph")
+            return False
+
+        restored = self._load_trie()
+        names, max_rowid = graph_store.get_node_names_since(self._max_rowid)
+        if restored and max_rowid < self._max_rowid:
+            # knowledge_graph.db was recreated -- the saved trie describes another graph
+            print("[WARN] EntityGate: saved trie is ahead of the graph — rebuilding")
+            self.keyword_processor = KeywordProcessor()
+            restored = False
+            names, max_rowid = graph_store.get_node_names_since(0)
+        restored_terms = len(self.keyword_processor)
         for name in names:
             self.keyword_processor.add_keyword(name)
-        print(f"[OK] EntityGate: loaded {len(names)} entities from knowledge graph")
+        self._max_rowid = max_rowid
+
+        if restored:
+            print(
+                f"[OK] EntityGate: restored {restored_terms} terms from "
+                f"{self.trie_file} (+{len(names)} new entities)"
+            )
+        else:
+            print(f"[OK] EntityGate: loaded {len(names)} entities from knowledge graph")
+        if names or not restored:
+            self._dirty = True  # saved by __init__ once aliases are merged
+        return restored
+
+    def _load_trie(self) -> bool:
+        """Restore the persisted trie. Returns False if absent, stale or unreadable."""
+        if not self.trie_file or not os.path.exists(self.trie_file):
+            return False
+        try:
+            with open(self.trie_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != _TRIE_VERSION or data.get("graph") != self._graph_path:
+                return False
+            self.keyword_processor.keyword_trie_dict = data["trie"]
+            self.keyword_processor._terms_in_trie = int(data["terms"])
+            self._max_rowid = int(data["max_rowid"])
+            self._trie_aliases_mtime = data.get("aliases_mtime")
+        except Exception as e:
+            print(f"[WARN] EntityGate: could not load {self.trie_file} ({e}) — rebuilding")
+            self.keyword_processor = KeywordProcessor()
+            self._max_rowid = 0
+            return False
+        return True
+
+    def save_trie(self) -> None:
+        """Persist the trie atomically, first catching up on nodes it hasn't seen."""
+        if not self.trie_file:
+            return
+        with self._lock:
+            if hasattr(self._graph, "get_node_names_since"):
+                names, max_rowid = self._graph.get_node_names_since(self._max_rowid)
+                for name in names:
+                    self.keyword_processor.add_keyword(name)
+                self._max_rowid = max(self._max_rowid, max_rowid)
+            payload = json.dumps(
+                {
+                    "version": _TRIE_VERSION,
+                    "graph": self._graph_path,
+                    "max_rowid": self._max_rowid,
+                    "aliases_mtime": self._aliases_mtime,
+                    "terms": len(self.keyword_processor),
+                    "trie": self.keyword_processor.keyword_trie_dict,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            self._dirty = False
+            self._trie_aliases_mtime = self._aliases_mtime
+            self._last_save = time.monotonic()
+        tmp = f"{self.trie_file}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, self.trie_file)
+
+    def rebuild(self) -> None:
+        """Rebuild the trie from the graph and entities.json, dropping names that are gone."""
+        kp = KeywordProcessor()
+        max_rowid = 0
+        if hasattr(self._graph, "get_node_names_since"):
+            names, max_rowid = self._graph.get_node_names_since(0)
+        elif self._graph is not None:
+            names = self._graph.get_all_node_names()
+        else:
+            names = []
+        for name in names:
+            kp.add_keyword(name)
+        aliases, mtime = self._read_aliases(self.entities_file)
+        if aliases:
+            kp.add_keywords_from_dict(aliases)
+        with self._lock:
+            self.keyword_processor = kp
+            self._max_rowid = max_rowid
+            self._aliases = aliases
+            self._aliases_mtime = mtime
+            self._dirty = True
+            self.rebuilds += 1
+        print(f"[OK] EntityGate: rebuilt trie ({len(kp)} terms)")
+        self.save_trie()  # also picks up nodes written while rebuilding
+
+    def on_graph_write(self, names, removed=None) -> None:
+        """SQLiteGraph listener: add newly committed node names to the gate.
+
+        A name whose keyword already maps to a different spelling (e.g. after
+        graph compaction merged "Alice" into "alice") is re-pointed too.
+        *removed* names (merged away by compaction) trigger a rebuild, since
+        FlashText can't tell which other spellings share their trie path.
+        """
+        if removed:
+            self.rebuild()
+            return
+        new = [n for n in names if n and self.keyword_processor.get_keyword(n) != n]
+        if not new:
+            return
+        with self._lock:
+            for name in new:
+                self.keyword_processor.add_keyword(name)
+            self.live_added += len(new)
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Mark the trie dirty and save it in the background if the last save is old enough."""
+        with self._lock:
+            self._dirty = True
+            due = not self._saving and time.monotonic() - self._last_save >= _SAVE_INTERVAL_S
+            if due:
+                self._saving = True
+        if due:
+            threading.Thread(
+                target=self._background_save, name="entity-gate-save", daemon=True
+            ).start()
+
+    def _background_save(self) -> None:
+        try:
+            self.save_trie()
+        except Exception as e:
+            print(f"[WARN] EntityGate: trie save failed: {e}")
+        finally:
+            self._saving = False
+
+    @staticmethod
+    def _read_aliases(entities_file: str) -> tuple[dict, float | None]:
+        """Parse the alias file into {standard_name: [variations]} plus its mtime."""
+        if not os.path.exists(entities_file):
+            return {}, None
+        mtime = os.path.getmtime(entities_file)
+        with open(entities_file, encoding="utf-8") as f:
+            raw = json.load(f)
+        # Normalize: values may be lists (variations) or ints (counts from bulk extractor)
+        return {k: v if isinstance(v, list) else [k] for k, v in (raw or {}).items()}, mtime
 
     def _load_aliases(self, entities_file: str) -> None:
         """Merges optional alias overrides from a JSON file on top of KG-loaded names."""
         if not os.path.exists(entities_file):
             print(f"[WARN] EntityGate: alias file {entities_file} not found — skipping")
             return
-        with open(entities_file, encoding="utf-8") as f:
-            raw = json.load(f)
-        if not raw:
+        aliases_dict, mtime = self._read_aliases(entities_file)
+        self._aliases = aliases_dict
+        self._aliases_mtime = mtime
+        if not aliases_dict:
             # Empty dict is normal for OSS repo — skip silently
             return
-        # Normalize: values may be lists (variations) or ints (counts from bulk extractor)
-        aliases_dict = {k: v if isinstance(v, list) else [k] for k, v in raw.items()}
-        self.keyword_processor.add_keywords_from_dict(aliases_dict)
+        with self._lock:
+            self.keyword_processor.add_keywords_from_dict(aliases_dict)
         print(f"[OK] EntityGate: merged {len(aliases_dict)} alias groups from {entities_file}")
 
+    def _maybe_reload_aliases(self) -> None:
+        now = time.monotonic()
+        if now - self._aliases_checked < _ALIAS_CHECK_INTERVAL_S:
+            return
+        self._aliases_checked = now
+        try:
+            if _mtime(self.entities_file) != self._aliases_mtime:
+                self._apply_alias_changes()
+        except (OSError, ValueError) as e:
+            print(f"[WARN] EntityGate: alias reload failed: {e}")
+
+    def _apply_alias_changes(self) -> None:
+        """Add new alias groups/variations; rebuild only if something was deleted."""
+        aliases, mtime = self._read_aliases(self.entities_file)
+        old = self._aliases
+        if any(k not in aliases or not set(v) <= set(aliases[k]) for k, v in old.items()):
+            self.rebuild()  # FlashText can't safely remove a shared trie path
+            return
+        added = {k: v for k, v in aliases.items() if k not in old or set(v) != set(old[k])}
+        with self._lock:
+            if added:
+                self.keyword_processor.add_keywords_from_dict(added)
+            self._aliases = aliases
+            self._aliases_mtime = mtime
+        if added:
+            self._schedule_save()
+
+    def get_stats(self) -> dict:
+        return {
+            "terms": len(self.keyword_processor),
+            "live_added": self.live_added,
+            "rebuilds": self.rebuilds,
+            "max_rowid": self._max_rowid,
+            "unsaved_changes": self._dirty,
+            "seconds_since_save": (
+                round(time.monotonic() - self._last_save, 1) if self._last_save else None
+            ),
+        }
+
     def extract_entities(self, text):
         """
         Extracts entities from text.
         Returns a list of 'Standard Names' regardless of which variation was found.
         Example: 'I love SOTE' -> ['Elden Ring']
         """
+        self._maybe_reload_aliases()
         return self.keyword_processor.extract_keywords(text)
 
     def extract_keywords(self, text):
@@ -58,7 +306,9 @@ class EntityGate:
         if isinstance(variations, str):
             variations = [variations]
 
-        self.keyword_processor.add_keyword(standard_name, variations)
+        with self._lock:
+            self.keyword_processor.add_keyword(standard_name, variations)
+            self._dirty = True
 
         # In a real app, we might want to persist this back to the JSON file
         # self.save_entities()
@@ -8,7 +8,11 @@ import gzip
 import json
 import os
 import sqlite3
+import threading
 import time
+from collections.abc import Collection, Iterable
+
+from sci_fi_dashboard.graph_index import AdjacencyIndex
 
 
 def _get_db_path() -> str:
@@ -17,21 +21,85 @@ def _get_db_path() -> str:
     return str(SynapseConfig.load().db_dir / "knowledge_graph.db")
 
 
+def _adjacency_cache_enabled() -> bool:
+    """synapse.json → memory.graph.adjacency_cache (default on)."""
+    try:
+        from synapse_config import SynapseConfig  # noqa: PLC0415
+
+        return bool(SynapseConfig.load().memory.get("graph", {}).get("adjacency_cache", True))
+    except Exception:
+        return True
+
+
 DB_PATH = _get_db_path()
+_MAX_HOPS = 3  # neighborhoods grow geometrically; deeper walks flood the prompt
+
+_UPSERT_NODE_SQL = """INSERT INTO nodes (name, type, properties, created_at, updated_at)
+   VALUES (?, ?, ?, ?, ?)
+   ON CONFLICT(name) DO UPDATE SET
+       properties = ?, updated_at = ?"""
+_INSERT_ENDPOINT_SQL = "INSERT OR IGNORE INTO nodes (name, created_at, updated_at) VALUES (?, ?, ?)"
+# Re-observing an edge refreshes weight and updated_at (restarting decay) and
+# appends its evidence; graph_compaction.py folds the appended text into
+# edge_evidence so the column stays short.
+_UPSERT_EDGE_SQL = """INSERT INTO edges
+       (source, target, relation, weight, evidence, created_at, updated_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(source, target, relation) DO UPDATE SET
+       weight = excluded.weight,
+       updated_at = excluded.updated_at,
+       evidence = CASE
+           WHEN excluded.evidence = '' THEN evidence
+           WHEN COALESCE(evidence, '') = '' THEN excluded.evidence
+           ELSE evidence || ' | ' || excluded.evidence
+       END"""
+
+
+class GraphBatch:
+    """Write buffer handed out by SQLiteGraph.batch(); mirrors the write API."""
+
+    def __init__(self) -> None:
+        self.nodes: list[tuple] = []
+        self.edges: list[tuple] = []
+        self.result: dict | None = None
+
+    def add_node(self, name: str, node_type: str = "entity", **properties) -> None:
+        self.nodes.append((name, node_type, properties))
+
+    def add_edge(
+        self, source: str, target: str, relation: str, weight: float = 1.0, evidence: str = ""
+    ) -> None:
+        self.edges.append((source, target, relation, weight, evidence))
+
+    def add_relation(
+        self, source: str, relation: str, target: str, weight: float = 1.0, evidence: str = ""
+    ) -> None:
+        self.add_edge(source, target, relation, weight, evidence)
 
 
 class SQLiteGraph:
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, adjacency_cache: bool | None = None):
         self.db_path = db_path
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         # Persistent connection -- reused across all method calls
         self._persistent_conn = self._create_conn()
+        # Serializes writers on the shared connection so one caller's commit
+        # can never land in the middle of another caller's bulk transaction
+        self._write_lock = threading.RLock()
         self._init_schema()
+        # Read-side adjacency snapshot (graph_index.py); None = every read hits SQLite
+        if adjacency_cache is None:
+            adjacency_cache = _adjacency_cache_enabled()
+        self._adjacency = AdjacencyIndex(self) if adjacency_cache else None
+        self._listeners: list = []
 
     def _create_conn(self) -> sqlite3.Connection:
         """Create a new configured SQLite connection."""
         conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        # Only takes effect on a fresh file (must precede WAL); older databases
+        # are converted once by graph_compaction.py
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         return conn
@@ -43,8 +111,40 @@ class SQLiteGraph:
             self._persistent_conn.execute("SELECT 1")
         except (sqlite3.ProgrammingError, sqlite3.OperationalError):
             self._persistent_conn = self._create_conn()
+            # data_version is per connection -- the snapshot can't be validated any more
+            self.invalidate_cache()
         return self._persistent_conn
 
+    def invalidate_cache(self) -> None:
+        """Drop the adjacency snapshot. Call after writing through _conn() directly."""
+        adjacency = getattr(self, "_adjacency", None)
+        if adjacency is not None:
+            adjacency.invalidate()
+
+    def add_listener(self, callback) -> None:
+        """Call ``callback(names: set[str])`` after every committed write that touched nodes.
+
+        Writes that delete nodes (graph compaction merging duplicates) also
+        pass ``removed=set[str]`` with the names that no longer exist.
+        Listeners run on the writer's thread after the write lock is released;
+        exceptions are logged and swallowed so they can never fail a write.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, names: set[str], removed: set[str] | None = None) -> None:
+        for callback in list(self._listeners):
+            try:
+                if removed:
+                    callback(names, removed=removed)
+                else:
+                    callback(names)
+            except Exception as e:
+                print(f"[WARN] SQLiteGraph listener failed: {e}")
+
+    def get_cache_stats(self) -> dict:
+        """Adjacency snapshot size / hit counters ({} when the cache is disabled)."""
+        return self._adjacency.get_stats() if self._adjacency is not None else {}
+
     def close(self):
         """Close the persistent connection. Call during shutdown."""
         with contextlib.suppress(Exception):
@@ -67,6 +167,8 @@ class SQLiteGraph:
                 weight REAL DEFAULT 1.0,
                 evidence TEXT DEFAULT '',
                 created_at REAL,
+                updated_at REAL,
+                decayed_at REAL,
                 PRIMARY KEY (source, target, relation),
                 FOREIGN KEY (source) REFERENCES nodes(name),
                 FOREIGN KEY (target) REFERENCES nodes(name)
@@ -75,60 +177,266 @@ class SQLiteGraph:
             CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target);
             CREATE INDEX IF NOT EXISTS idx_edges_relation ON edges(relation);
             CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type);
+            CREATE TABLE IF NOT EXISTS edge_evidence (
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                relation TEXT NOT NULL,
+                evidence TEXT NOT NULL,
+                count INTEGER DEFAULT 1,
+                last_seen REAL,
+                PRIMARY KEY (source, target, relation, evidence)
+            );
+            CREATE TABLE IF NOT EXISTS graph_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
         """)
+        # Databases created before decay tracking: their edges start the decay
+        # clock now instead of at created_at, or the first pass would prune
+        # edges that are still in use
+        columns = {r["name"] for r in conn.execute("PRAGMA table_info(edges)")}
+        for column in ("updated_at", "decayed_at"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE edges ADD COLUMN {column} REAL")
+                conn.execute(f"UPDATE edges SET {column} = ?", (time.time(),))
         conn.commit()
 
     def add_node(self, name: str, node_type: str = "entity", **properties):
         now = time.time()
-        conn = self._conn()
-        conn.execute(
-            """INSERT INTO nodes (name, type, properties, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?)
-               ON CONFLICT(name) DO UPDATE SET
-                   properties = ?, updated_at = ?""",
-            (name, node_type, json.dumps(properties), now, now, json.dumps(properties), now),
-        )
-        conn.commit()
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute(
+                _UPSERT_NODE_SQL,
+                (name, node_type, json.dumps(properties), now, now, json.dumps(properties), now),
+            )
+            conn.commit()
+            self.invalidate_cache()
+        self._notify({name})
 
     def add_edge(
         self, source: str, target: str, relation: str, weight: float = 1.0, evidence: str = ""
     ):
         now = time.time()
-        conn = self._conn()
-        for node in (source, target):
+        with self._write_lock:
+            conn = self._conn()
+            for node in (source, target):
+                conn.execute(_INSERT_ENDPOINT_SQL, (node, now, now))
             conn.execute(
-                "INSERT OR IGNORE INTO nodes (name, created_at, updated_at) VALUES (?, ?, ?)",
-                (node, now, now),
+                _UPSERT_EDGE_SQL,
+                (source, target, relation, weight, evidence, now, now),
             )
-        conn.execute(
-            """INSERT INTO edges (source, target, relation, weight, evidence, created_at)
-               VALUES (?, ?, ?, ?, ?, ?)
-               ON CONFLICT(source, target, relation) DO UPDATE SET
-                   weight = ?, evidence = evidence || ' | ' || ?""",
-            (source, target, relation, weight, evidence, now, weight, evidence),
-        )
-        conn.commit()
+            conn.commit()
+            self.invalidate_cache()
+        self._notify({source, target})
+
+    def bulk_upsert(
+        self,
+        nodes: Iterable = (),
+        edges: Iterable[tuple] = (),
+        single_valued: Collection[str] = (),
+    ) -> dict:
+        """Write many nodes and edges in ONE transaction (one commit / fsync).
+
+        nodes: names, or ``(name, node_type[, properties])`` tuples -- same
+            upsert semantics as add_node().
+        edges: ``(source, target, relation[, weight[, evidence]])`` tuples --
+            same upsert semantics as add_edge(); endpoints are created as needed.
+        single_valued: relations where a subject holds only one object at a
+            time (works_at, lives_in, ...).  Existing edges that the batch
+            contradicts are deleted set-wise in SQL before the insert, and
+            within the batch the last triple for a (source, relation) wins.
+
+        Duplicates inside the batch are collapsed before hitting SQLite.
+        Returns ``{"nodes": int, "edges": int, "replaced": int}``.
+        """
+        now = time.time()
 
-    def get_entity_neighborhood(self, entity: str, hops: int = 1) -> str:
-        conn = self._conn()
-        rows = conn.execute(
-            """SELECT source, relation, target, weight
-               FROM edges
-               WHERE source = ? OR target = ?
-               ORDER BY weight DESC LIMIT 50""",
-            (entity, entity),
-        ).fetchall()
+        node_rows: dict[str, tuple] = {}
+        for node in nodes:
+            if isinstance(node, str):
+                node = (node,)
+            name = node[0]
+            node_type = node[1] if len(node) > 1 else "entity"
+            props = json.dumps(node[2] if len(node) > 2 else {})
+            node_rows[name] = (name, node_type, props, now, now, props, now)
+
+        edge_rows: dict[tuple[str, str, str], list] = {}
+        latest_single: dict[tuple[str, str], str] = {}
+        for edge in edges:
+            source, target, relation = edge[0], edge[1], edge[2]
+            weight = edge[3] if len(edge) > 3 else 1.0
+            evidence = edge[4] if len(edge) > 4 else ""
+            key = (source, target, relation)
+            if key in edge_rows:
+                row = edge_rows[key]
+                row[3] = weight
+                if evidence and evidence not in row[4].split(" | "):
+                    row[4] = f"{row[4]} | {evidence}" if row[4] else evidence
+            else:
+                edge_rows[key] = [source, target, relation, weight, evidence, now, now]
+            if relation in single_valued:
+                latest_single[(source, relation)] = target
+
+        # Within the batch, a later single-valued triple supersedes earlier ones
+        for key in [k for k in edge_rows if (k[0], k[2]) in latest_single]:
+            if latest_single[(key[0], key[2])] != key[1]:
+                del edge_rows[key]
+
+        endpoints = {n for key in edge_rows for n in (key[0], key[1])} - node_rows.keys()
+        replaced = 0
+        with self._write_lock:
+            conn = self._conn()
+            try:
+                if latest_single:
+                    conn.execute(
+                        "CREATE TEMP TABLE IF NOT EXISTS _batch_single"
+                        " (source TEXT, relation TEXT, target TEXT)"
+                    )
+                    conn.execute("DELETE FROM _batch_single")
+                    conn.executemany(
+                        "INSERT INTO _batch_single (source, relation, target) VALUES (?, ?, ?)",
+                        [(s, r, t) for (s, r), t in latest_single.items()],
+                    )
+                    replaced = conn.execute("""
+                        DELETE FROM edges WHERE EXISTS (
+                            SELECT 1 FROM _batch_single b
+                            WHERE b.source = edges.source
+                              AND b.relation = edges.relation
+                              AND b.target != edges.target
+                        )
+                    """).rowcount
+                conn.executemany(_UPSERT_NODE_SQL, list(node_rows.values()))
+                conn.executemany(_INSERT_ENDPOINT_SQL, [(n, now, now) for n in endpoints])
+                conn.executemany(_UPSERT_EDGE_SQL, [tuple(r) for r in edge_rows.values()])
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self.invalidate_cache()
+        if node_rows or endpoints:
+            self._notify(set(node_rows) | endpoints)
+        return {"nodes": len(node_rows), "edges": len(edge_rows), "replaced": replaced}
+
+    @contextlib.contextmanager
+    def batch(self, single_valued: Collection[str] = ()):
+        """Collect writes and flush them with bulk_upsert() on exit.
+
+        Usage::
+
+            with graph.batch(single_valued=_SINGLE_VALUED_RELATIONS) as b:
+                for s, r, o in triples:
+                    b.add_relation(s, r, o, weight=0.9)
+            b.result  # {"nodes": ..., "edges": ..., "replaced": ...}
+
+        Nothing is written if the block raises.
+        """
+        writer = GraphBatch()
+        yield writer
+        writer.result = self.bulk_upsert(writer.nodes, writer.edges, single_valued)
+
+    def get_neighborhoods(
+        self, entities: Iterable[str], hops: int = 1, per_entity_limit: int = 50
+    ) -> dict[str, list[dict]]:
+        """Edges within *hops* of each entity, for all entities in ONE query.
+
+        A recursive CTE walks outward from every seed at once; each hop is a
+        UNION of two lookups (``source = ?`` and ``target = ?``) so both edge
+        indexes are used.  Each edge is reported once per seed with the hop at
+        which it was first reached, ordered by hop then weight and capped at
+        *per_entity_limit*.  Served by BFS over the adjacency snapshot when the
+        cache is enabled.
+
+        Returns ``{entity: [{"source", "relation", "target", "weight", "hop"}]}``
+        with an (empty) entry for every requested entity.
+        """
+        seeds = list(dict.fromkeys(e for e in entities if e))
+        if not seeds:
+            return {}
+        hops = min(max(int(hops), 1), _MAX_HOPS)
+        if self._adjacency is not None:
+            return self._adjacency.neighborhoods(seeds, hops, per_entity_limit)
+        return self._query_neighborhoods(seeds, hops, per_entity_limit)
+
+    def _query_neighborhoods(
+        self, seeds: list[str], hops: int, per_entity_limit: int
+    ) -> dict[str, list[dict]]:
+        """SQL path of get_neighborhoods() (also timed by graph_compaction.py)."""
+        rows = (
+            self._conn()
+            .execute(
+                """
+            WITH RECURSIVE
+            seeds(seed) AS (SELECT value FROM json_each(?)),
+            reach(seed, node, depth) AS (
+                SELECT seed, seed, 0 FROM seeds
+                UNION
+                SELECT r.seed, e.target, r.depth + 1
+                FROM reach r JOIN edges e ON e.source = r.node
+                WHERE r.depth < ?
+                UNION
+                SELECT r.seed, e.source, r.depth + 1
+                FROM reach r JOIN edges e ON e.target = r.node
+                WHERE r.depth < ?
+            ),
+            frontier(seed, node, depth) AS (
+                SELECT seed, node, MIN(depth) FROM reach GROUP BY seed, node
+            ),
+            hood(seed, source, relation, target, weight, hop) AS (
+                SELECT f.seed, e.source, e.relation, e.target, e.weight, f.depth + 1
+                FROM frontier f JOIN edges e ON e.source = f.node
+                UNION ALL
+                SELECT f.seed, e.source, e.relation, e.target, e.weight, f.depth + 1
+                FROM frontier f JOIN edges e ON e.target = f.node
+            ),
+            ranked AS (
+                SELECT seed, source, relation, target, weight, MIN(hop) AS hop,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY seed ORDER BY MIN(hop), weight DESC
+                       ) AS rn
+                FROM hood
+                GROUP BY seed, source, relation, target
+            )
+            SELECT seed, source, relation, target, weight, hop
+            FROM ranked WHERE rn <= ?
+            ORDER BY seed, rn
+            """,
+                (json.dumps(seeds), hops - 1, hops - 1, per_entity_limit),
+            )
+            .fetchall()
+        )
 
-        if not rows:
-            return ""
-        lines = []
+        result: dict[str, list[dict]] = {seed: [] for seed in seeds}
         for r in rows:
-            lines.append(
-                f"  {r['source']} --[{r['relation']}]--> {r['target']} (w={r['weight']:.2f})"
+            result[r["seed"]].append(
+                {
+                    "source": r["source"],
+                    "relation": r["relation"],
+                    "target": r["target"],
+                    "weight": r["weight"],
+                    "hop": r["hop"],
+                }
             )
+        return result
+
+    @staticmethod
+    def format_neighborhood(entity: str, edges: list[dict]) -> str:
+        """Render get_neighborhoods() edges as the prompt text block."""
+        if not edges:
+            return ""
+        lines = [
+            f"  {e['source']} --[{e['relation']}]--> {e['target']} (w={e['weight']:.2f})"
+            for e in edges
+        ]
         return f"Knowledge about {entity}:\n" + "\n".join(lines)
 
+    def get_entity_neighborhood(self, entity: str, hops: int = 1) -> str:
+        edges = self.get_neighborhoods([entity], hops=hops).get(entity, [])
+        return self.format_neighborhood(entity, edges)
+
     def find_connection_path(self, start: str, end: str, max_depth: int = 4) -> list:
+        if self._adjacency is not None:
+            return self._adjacency.shortest_path(start, end, max_depth)
         conn = self._conn()
         row = conn.execute(
             """
@@ -150,6 +458,55 @@ class SQLiteGraph:
             return json.loads(row["trail"])
         return []
 
+    def get_edge_evidence(
+        self, source: str, target: str, relation: str, limit: int = 10
+    ) -> list[dict]:
+        """Evidence snippets for one edge, most observed first.
+
+        Combines the compacted ``edge_evidence`` counts with text appended to
+        the edge since the last compaction.  Returns
+        ``[{"evidence", "count", "last_seen"}]``.
+        """
+        conn = self._conn()
+        merged: dict[str, dict] = {}
+        for r in conn.execute(
+            "SELECT evidence, count, last_seen FROM edge_evidence"
+            " WHERE source = ? AND target = ? AND relation = ?",
+            (source, target, relation),
+        ):
+            merged[r["evidence"]] = dict(r)
+        row = conn.execute(
+            "SELECT evidence, COALESCE(updated_at, created_at) AS seen FROM edges"
+            " WHERE source = ? AND target = ? AND relation = ?",
+            (source, target, relation),
+        ).fetchone()
+        if row and row["evidence"]:
+            for snippet in row["evidence"].split(" | "):
+                snippet = snippet.strip()
+                if not snippet:
+                    continue
+                entry = merged.setdefault(
+                    snippet, {"evidence": snippet, "count": 0, "last_seen": row["seen"]}
+                )
+                entry["count"] += 1
+                entry["last_seen"] = max(entry["last_seen"] or 0, row["seen"] or 0)
+        ranked = sorted(merged.values(), key=lambda e: (-e["count"], -(e["last_seen"] or 0)))
+        return ranked[:limit]
+
+    def get_node_names_since(self, rowid: int = 0) -> tuple[list[str], int]:
+        """Names of nodes inserted after *rowid*, plus the current max rowid.
+
+        Lets a consumer holding a persisted copy of the node set catch up
+        incrementally instead of rescanning the whole table.  A max rowid
+        below *rowid* means the table was rebuilt and the copy is invalid.
+        """
+        conn = self._conn()
+        max_rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM nodes").fetchone()[0]
+        rows = conn.execute(
+            "SELECT name FROM nodes WHERE rowid > ? AND rowid <= ?", (rowid, max_rowid)
+        ).fetchall()
+        return [r["name"] for r in rows], max_rowid
+
     def get_all_node_names(self) -> list[str]:
         conn = self._conn()
         rows = conn.execute("SELECT name FROM nodes").fetchall()
@@ -174,12 +531,16 @@ class SQLiteGraph:
 
     def has_node(self, name: str) -> bool:
         """Check if a node exists."""
+        if self._adjacency is not None:
+            return self._adjacency.has_node(name)
         conn = self._conn()
         row = conn.execute("SELECT 1 FROM nodes WHERE name = ? LIMIT 1", (name,)).fetchone()
         return row is not None
 
     def neighbors(self, node: str) -> list[str]:
         """Get all nodes connected to this node (outgoing edges)."""
+        if self._adjacency is not None:
+            return self._adjacency.neighbors(node)
         conn = self._conn()
         rows = conn.execute(
             "SELECT DISTINCT target FROM edges WHERE source = ?", (node,)
@@ -192,9 +553,11 @@ class SQLiteGraph:
         return self
 
     def prune_weak_edges(self, min_weight: float = 0.1):
-        conn = self._conn()
-        deleted = conn.execute("DELETE FROM edges WHERE weight < ?", (min_weight,)).rowcount
-        conn.commit()
+        with self._write_lock:
+            conn = self._conn()
+            deleted = conn.execute("DELETE FROM edges WHERE weight < ?", (min_weight,)).rowcount
+            conn.commit()
+            self.invalidate_cache()
         if deleted:
             print(f"[CUT] Pruned {deleted} weak edges")
 
@@ -223,20 +586,21 @@ class SQLiteGraph:
         g = nx.node_link_graph(data)
         db = cls(db_path)
 
-        node_count = 0
-        for node, attrs in g.nodes(data=True):
-            db.add_node(str(node), node_type=attrs.get("type", "entity"))
-            node_count += 1
-
-        edge_count = 0
-        for src, tgt, attrs in g.edges(data=True):
-            db.add_edge(
-                str(src),
-                str(tgt),
-                relation=attrs.get("relation", attrs.get("label", "related_to")),
-                weight=attrs.get("weight", 1.0),
-            )
-            edge_count += 1
+        with db.batch() as b:
+            node_count = 0
+            for node, attrs in g.nodes(data=True):
+                b.add_node(str(node), node_type=attrs.get("type", "entity"))
+                node_count += 1
+
+            edge_count = 0
+            for src, tgt, attrs in g.edges(data=True):
+                b.add_edge(
+                    str(src),
+                    str(tgt),
+                    relation=attrs.get("relation", attrs.get("label", "related_to")),
+                    weight=attrs.get("weight", 1.0),
+                )
+                edge_count += 1
 
         print(f"[OK] Migrated {node_count} nodes, {edge_count} edges")
         return db
@@ -69,14 +69,14 @@ async def maybe_spawn_agent(
 
     # ------------------------------------------------------------------
     # Build memory snapshot: query memory engine for the task description.
-    # CRITICAL: memory_engine.query() returns a dict with
+    # CRITICAL: memory_engine.aquery() returns a dict with
     #   {"results": [...], "tier": ..., "entities": ..., "graph_context": ...}
     # NOT a list.  We must unwrap via .get("results", []).
     # ------------------------------------------------------------------
     memory_snap: list[dict] = []
     if deps.memory_engine is not None:
         try:
-            mem_results = deps.memory_engine.query(task_desc, limit=5)
+            mem_results = await deps.memory_engine.aquery(task_desc, limit=5)
             memory_snap = mem_results.get("results", []) if isinstance(mem_results, dict) else []
         except Exception:  # noqa: BLE001
             # Memory query failure is not fatal — agent still spawns without
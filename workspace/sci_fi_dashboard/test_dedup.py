@@ -0,0 +1,71 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sci_fi_dashboard.gateway import dedup as dedup_module
+from sci_fi_dashboard.gateway.dedup import MessageDeduplicator
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Manual time.monotonic() for the dedup module; advance with clock.now += s."""
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(dedup_module, "time", SimpleNamespace(monotonic=lambda: fake.now))
+    return fake
+
+
+def test_hard_cap_evicts_oldest_early(clock):
+    d = MessageDeduplicator(window_seconds=300, max_entries=10)
+    for i in range(25):
+        assert d.is_duplicate(f"id{i}") is False
+
+    stats = d.get_stats()
+    assert stats["entries"] == 10
+    assert stats["evicted_early"] == 15
+    assert stats["expired"] == 0
+    assert d.is_duplicate("id24") is True  # still in the exact layer
+    assert d.is_duplicate("id0") is False  # evicted, no Bloom layer to catch it
+
+
+def test_bloom_layer_catches_evicted_ids(clock):
+    """A retry of an id the exact layer evicted under pressure is still a duplicate."""
+    d = MessageDeduplicator(window_seconds=300, max_entries=10, bloom_capacity=1000)
+    for i in range(25):
+        d.is_duplicate(f"id{i}")
+    assert "id0" not in d.seen
+
+    assert d.is_duplicate("id0") is True
+    stats = d.get_stats()
+    assert stats["evicted_early"] == 15
+    assert stats["bloom"]["duplicates_caught"] == 1
+
+
+def test_ids_expire_after_window_and_bloom_rotation(clock):
+    """Exact entries expire after one window; Bloom generations remember for up to two."""
+    d = MessageDeduplicator(window_seconds=60, max_entries=100, bloom_capacity=1000)
+    assert d.is_duplicate("a") is False
+
+    clock.now += 61
+    d.is_duplicate("x")  # expires "a" from the exact layer, rotates the Bloom filters
+    assert "a" not in d.seen
+    assert d.get_stats()["expired"] == 1
+    assert d.is_duplicate("a") is True  # previous Bloom generation still holds it
+
+    clock.now += 61
+    d.is_duplicate("y")  # second rotation drops the generation that held "a"
+    assert d.is_duplicate("a") is False
+
+
+def test_full_bloom_generation_rotates_early(clock):
+    d = MessageDeduplicator(window_seconds=300, max_entries=100, bloom_capacity=5)
+    for i in range(6):
+        d.is_duplicate(f"id{i}")
+    assert d.get_stats()["bloom"]["ids_current"] == 1  # id5 went into a fresh generation
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
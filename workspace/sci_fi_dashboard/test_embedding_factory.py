@@ -0,0 +1,41 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import synapse_config
+
+from sci_fi_dashboard.embedding import factory
+
+
+def _use_synapse_json(monkeypatch, embedding: dict) -> None:
+    loaded = SimpleNamespace(embedding=embedding)
+    monkeypatch.setattr(synapse_config.SynapseConfig, "load", classmethod(lambda cls: loaded))
+
+
+def test_batching_reads_synapse_json_without_explicit_config(monkeypatch):
+    """get_provider() passes no config, so embedding.batching comes from synapse.json."""
+    _use_synapse_json(monkeypatch, {"batching": {"enabled": False}})
+    provider = object()
+    assert factory._wrap_batching(provider, None) is provider
+
+
+def test_explicit_config_overrides_synapse_json(monkeypatch):
+    _use_synapse_json(monkeypatch, {"batching": {"enabled": True}})
+    provider = object()
+    config = {"embedding": {"batching": {"enabled": False}}}
+    assert factory._wrap_batching(provider, config) is provider
+
+
+def test_cache_reads_synapse_json_without_explicit_config(monkeypatch):
+    """The re-embed CLI calls wrap_cache() with no config; embedding.cache still applies."""
+    _use_synapse_json(monkeypatch, {"cache": {"enabled": False}})
+    provider = object()
+    assert factory.wrap_cache(provider) is provider
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__, "-v"])
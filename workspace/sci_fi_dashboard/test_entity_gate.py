@@ -0,0 +1,81 @@
+import json
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+pytest.importorskip("flashtext")
+
+from sci_fi_dashboard.smart_entity import EntityGate  # noqa: E402
+from sci_fi_dashboard.sqlite_graph import SQLiteGraph  # noqa: E402
+
+
+def _write_aliases(path: str, aliases: dict, mtime: float) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(aliases, f)
+    os.utime(path, (mtime, mtime))
+
+
+def test_names_merged_by_compaction_stop_matching():
+    """A node merged away by compaction leaves the live and the persisted trie."""
+    with tempfile.TemporaryDirectory() as tmp:
+        graph = SQLiteGraph(os.path.join(tmp, "graph.db"))
+        graph.add_node("Dr. Alice")
+        graph.add_node("Alice")
+        aliases = os.path.join(tmp, "entities.json")
+        gate = EntityGate(graph_store=graph, entities_file=aliases)
+        assert "Dr. Alice" in gate.extract_entities("met Dr. Alice")
+
+        # What GraphCompactor does after folding "Dr. Alice" into "Alice"
+        graph._conn().execute("DELETE FROM nodes WHERE name = 'Dr. Alice'")
+        graph._conn().commit()
+        graph._notify({"Alice"}, removed={"Dr. Alice"})
+
+        assert "Dr. Alice" not in gate.extract_entities("met Dr. Alice")
+        restarted = EntityGate(graph_store=graph, entities_file=aliases)
+        assert "Dr. Alice" not in restarted.extract_entities("met Dr. Alice")
+        assert restarted.extract_entities("met Alice") == ["Alice"]
+
+
+def test_aliases_removed_from_entities_json_stop_matching():
+    """Aliases deleted from entities.json go away live and across a restart."""
+    with tempfile.TemporaryDirectory() as tmp:
+        graph = SQLiteGraph(os.path.join(tmp, "graph.db"))
+        aliases = os.path.join(tmp, "entities.json")
+        _write_aliases(aliases, {"Elden Ring": ["SOTE"], "Synapse": ["syn"]}, mtime=1000)
+        gate = EntityGate(graph_store=graph, entities_file=aliases)
+        assert gate.extract_entities("is SOTE good") == ["Elden Ring"]
+
+        _write_aliases(aliases, {"Synapse": ["syn"]}, mtime=2000)
+        gate._aliases_checked = float("-inf")  # skip the stat throttle
+        assert gate.extract_entities("is SOTE good") == []
+        assert gate.extract_entities("ask syn") == ["Synapse"]
+
+        _write_aliases(aliases, {}, mtime=3000)  # edited while the gate is down
+        restarted = EntityGate(graph_store=graph, entities_file=aliases)
+        assert restarted.extract_entities("ask syn") == []
+
+
+def test_aliases_added_to_entities_json_apply_without_rebuild():
+    """conv_kg_extractor only appends; new groups are merged in place, not rebuilt."""
+    with tempfile.TemporaryDirectory() as tmp:
+        graph = SQLiteGraph(os.path.join(tmp, "graph.db"))
+        graph.add_node("Kolkata")
+        aliases = os.path.join(tmp, "entities.json")
+        _write_aliases(aliases, {"Synapse": ["syn"]}, mtime=1000)
+        gate = EntityGate(graph_store=graph, entities_file=aliases)
+
+        _write_aliases(aliases, {"Synapse": ["syn", "synapse-oss"], "sikkim": 1}, mtime=2000)
+        gate._aliases_checked = float("-inf")
+
+        assert gate.extract_entities("went to sikkim") == ["sikkim"]
+        assert gate.extract_entities("ask synapse-oss") == ["Synapse"]
+        assert gate.extract_entities("back in Kolkata") == ["Kolkata"]
+        assert gate.get_stats()["rebuilds"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
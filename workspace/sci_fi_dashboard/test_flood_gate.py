@@ -0,0 +1,94 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sci_fi_dashboard.gateway.flood import FloodGate
+
+
+async def _collecting_gate(**kwargs) -> tuple[FloodGate, list]:
+    flushed = []
+
+    async def on_flush(chat_id, message, metadata):
+        flushed.append((chat_id, message))
+
+    gate = FloodGate(**kwargs)
+    gate.set_callback(on_flush)
+    return gate, flushed
+
+
+def test_window_flush_after_quiet_period():
+    """Messages in quick succession go out as one batch once the chat goes quiet."""
+
+    async def run():
+        gate, flushed = await _collecting_gate(batch_window_seconds=0.05, max_hold_seconds=1.0)
+        await gate.incoming("c1", "a", {})
+        await gate.incoming("c1", "b", {})
+        await asyncio.sleep(0.02)
+        early = list(flushed)
+        await asyncio.sleep(0.1)
+        await gate.stop()
+        return early, flushed, gate.get_stats()
+
+    early, flushed, stats = asyncio.run(run())
+    assert early == []
+    assert flushed == [("c1", "a\n\nb")]
+    assert stats["flush_reasons"] == {"window": 1, "max_hold": 0, "max_batch": 0}
+    assert stats["avg_batch_size"] == 2.0
+
+
+def test_nonstop_sender_flushes_at_max_hold():
+    """A sender who never pauses for a full window is still flushed every max_hold."""
+
+    async def run():
+        gate, flushed = await _collecting_gate(batch_window_seconds=0.05, max_hold_seconds=0.15)
+        for i in range(12):
+            await gate.incoming("c1", f"m{i}", {})
+            await asyncio.sleep(0.03)
+        await asyncio.sleep(0.1)
+        await gate.stop()
+        return flushed, gate.get_stats()
+
+    flushed, stats = asyncio.run(run())
+    assert stats["flush_reasons"]["max_hold"] >= 2
+    assert [m for _c, msg in flushed for m in msg.split("\n\n")] == [f"m{i}" for i in range(12)]
+
+
+def test_max_batch_flushes_immediately():
+    async def run():
+        gate, flushed = await _collecting_gate(batch_window_seconds=10.0, max_batch=3)
+        for i in range(3):
+            await gate.incoming("c1", f"m{i}", {})
+        flushed_now = list(flushed)
+        await gate.stop()
+        return flushed_now, gate.get_stats()
+
+    flushed, stats = asyncio.run(run())
+    assert flushed == [("c1", "m0\n\nm1\n\nm2")]
+    assert stats["flush_reasons"]["max_batch"] == 1
+    assert stats["buffered_chats"] == 0
+
+
+def test_latency_histogram_counts_every_flush():
+    """Each flush lands in exactly one latency bucket; window flushes land near the window."""
+
+    async def run():
+        gate, _flushed = await _collecting_gate(batch_window_seconds=0.05, max_hold_seconds=1.0)
+        for chat in ("c1", "c2", "c3"):
+            await gate.incoming(chat, "hi", {})
+        await asyncio.sleep(0.15)
+        await gate.stop()
+        return gate.get_stats()
+
+    stats = asyncio.run(run())
+    hist = stats["flush_latency_ms"]
+    assert sum(hist.values()) == stats["flushes"] == 3
+    assert hist["le_250ms"] == 3
+    assert 40 <= stats["avg_flush_latency_ms"] < 250
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__, "-v"])
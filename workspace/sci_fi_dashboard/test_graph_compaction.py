@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sci_fi_dashboard.graph_compaction import GraphCompactor
+from sci_fi_dashboard.sqlite_graph import SQLiteGraph
+
+_NO_MERGE = {"merge_duplicates": False}
+
+
+def _legacy_db(path: str, edge_age_days: float) -> None:
+    """An edges table from before decay tracking (no updated_at / decayed_at)."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE nodes (
+            name TEXT PRIMARY KEY, type TEXT, properties TEXT, created_at REAL, updated_at REAL
+        );
+        CREATE TABLE edges (
+            source TEXT, target TEXT, relation TEXT, weight REAL DEFAULT 1.0,
+            evidence TEXT DEFAULT '', created_at REAL, PRIMARY KEY (source, target, relation)
+        );
+    """)
+    conn.executemany("INSERT INTO nodes VALUES (?, 'entity', '{}', 0, 0)", [("a",), ("b",)])
+    conn.execute(
+        "INSERT INTO edges VALUES ('a', 'b', 'knows', 1.0, '', ?)",
+        (time.time() - edge_age_days * 86400,),
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_first_decay_keeps_edges_of_migrated_db():
+    """Edges of a pre-decay database start decaying at migration, not at created_at."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "graph.db")
+        _legacy_db(path, edge_age_days=400)
+        graph = SQLiteGraph(path)
+
+        report = GraphCompactor(graph, config=_NO_MERGE).run()
+
+        assert report["pruned_edges"] == 0
+        weight = graph._conn().execute("SELECT weight FROM edges").fetchone()[0]
+        assert weight > 0.99
+
+
+def test_vacuum_releases_every_free_page():
+    """An incremental-vacuum database ends a pass with an empty freelist."""
+    with tempfile.TemporaryDirectory() as tmp:
+        graph = SQLiteGraph(os.path.join(tmp, "graph.db"))
+        compactor = GraphCompactor(graph, config=_NO_MERGE)
+        compactor.run()  # converts the file to auto_vacuum=INCREMENTAL
+        for i in range(300):
+            graph.add_edge(f"n{i}", f"m{i}", "knows", evidence="x" * 500)
+        graph._conn().execute("DELETE FROM edges")
+        graph._conn().commit()
+
+        report = compactor.run()
+
+        assert report["freelist_pages"] > 1
+        assert graph._conn().execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__, "-v"])
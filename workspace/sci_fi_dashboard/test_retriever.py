@@ -0,0 +1,69 @@
+import contextlib
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+pytest.importorskip("sqlite_vec")
+
+from sci_fi_dashboard import retriever  # noqa: E402
+
+
+@pytest.fixture
+def fts_calls(monkeypatch):
+    """Stub the embedding and sub-queries; record every FTS lookup."""
+    calls = []
+
+    @contextlib.contextmanager
+    def reader():
+        conn = sqlite3.connect(":memory:")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def fts(user_message, limit, session_type):
+        calls.append(user_message)
+        return [{"source": "fts", "content": "from fts", "distance": 0.0}]
+
+    monkeypatch.setattr(retriever, "get_provider", lambda: None)
+    monkeypatch.setattr(retriever.DatabaseManager, "reader", staticmethod(reader))
+    monkeypatch.setattr(retriever, "_relationship_memories", lambda cursor: [])
+    monkeypatch.setattr(retriever, "_fts_documents", fts)
+    return calls
+
+
+def _vector_results(monkeypatch, documents: list[dict]) -> None:
+    monkeypatch.setattr(retriever, "get_embedding", lambda text, ctx=None: [0.1, 0.2])
+    monkeypatch.setattr(retriever, "_vector_facts", lambda cursor, blob, limit: [])
+    monkeypatch.setattr(retriever, "_vector_documents", lambda cursor, blob, limit, st: documents)
+
+
+def test_vector_hits_skip_fts(monkeypatch, fts_calls):
+    """With vector hits the FTS fallback never runs (no second reader, no wasted query)."""
+    _vector_results(monkeypatch, [{"source": "vec", "content": "hit", "distance": 0.1}])
+    result = retriever.query_memories("what about the trip")
+    assert fts_calls == []
+    assert "fts" not in result["timings_ms"]
+    assert result["documents"][0]["content"] == "hit"
+
+
+def test_empty_vector_search_falls_back_to_fts(monkeypatch, fts_calls):
+    _vector_results(monkeypatch, [])
+    result = retriever.query_memories("what about the trip")
+    assert fts_calls == ["what about the trip"]
+    assert result["method"] == "fts_fallback"
+
+
+def test_no_embedding_uses_fts(monkeypatch, fts_calls):
+    monkeypatch.setattr(retriever, "get_embedding", lambda text, ctx=None: None)
+    result = retriever.query_memories("what about the trip")
+    assert result["documents"][0]["content"] == "from fts"
+    assert result["method"] == "fts_fallback"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,111 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sci_fi_dashboard.gateway.queue import MessageTask, TaskQueue
+from sci_fi_dashboard.gateway.session_actor import SessionActorQueue
+from sci_fi_dashboard.gateway.worker import MessageWorker
+
+
+def test_ready_sessions_run_by_priority():
+    """With one slot busy, the waiting session with the lowest priority value goes next."""
+
+    async def run():
+        actors = SessionActorQueue(max_active=1)
+        order = []
+        gate = asyncio.Event()
+
+        async def blocker():
+            await gate.wait()
+            order.append("busy")
+
+        def op(name):
+            async def _op():
+                order.append(name)
+
+            return _op
+
+        futs = [actors.submit("busy", blocker)]
+        futs += [actors.submit(f"g{i}", op(f"g{i}"), priority=100.0 + i) for i in range(3)]
+        futs.append(actors.submit("dm", op("dm"), priority=1.0))
+        gate.set()
+        await asyncio.gather(*futs)
+        return order
+
+    assert asyncio.run(run()) == ["busy", "dm", "g0", "g1", "g2"]
+
+
+def test_dm_overtakes_group_burst_already_dispatched():
+    """A DM arriving behind buffered group messages should not wait for all of them."""
+
+    async def run():
+        order = []
+
+        async def process(msg, chat_id):
+            order.append(chat_id)
+            await asyncio.sleep(0.01)
+            return ""
+
+        queue = TaskQueue(config={})
+        worker = MessageWorker(queue, process, num_workers=1)
+        await worker.start()
+        for i in range(6):
+            await queue.enqueue(
+                MessageTask(task_id=f"g{i}", chat_id=f"g{i}", user_message="hi", is_group=True)
+            )
+        await asyncio.sleep(0)  # let the dispatcher hand the burst to the actors
+        await queue.enqueue(MessageTask(task_id="dm", chat_id="dm", user_message="hi"))
+        while len(order) < 7:
+            await asyncio.sleep(0.01)
+        await worker.stop()
+        return order
+
+    order = asyncio.run(run())
+    assert order.index("dm") <= 1
+
+
+def test_superseded_messages_still_reach_the_pipeline():
+    """Queued messages of one chat all run the pipeline; only the newest is answered."""
+
+    async def run():
+        processed, sent = [], []
+
+        async def process(msg, chat_id):
+            processed.append(msg)
+            await asyncio.sleep(0.01)
+            return f"re: {msg}"
+
+        class _Channel:
+            async def send(self, chat_id, text):
+                sent.append(text)
+                return True
+
+            async def send_typing(self, chat_id):
+                pass
+
+        class _Registry:
+            def get(self, channel_id):
+                return _Channel()
+
+        queue = TaskQueue(config={})
+        worker = MessageWorker(queue, process, num_workers=1, channel_registry=_Registry())
+        for i in range(3):
+            await queue.enqueue(MessageTask(task_id=f"m{i}", chat_id="c", user_message=f"m{i}"))
+        await worker.start()
+        while queue.pending_count or worker.actors.get_total_pending_count():
+            await asyncio.sleep(0.01)
+        await worker.stop()
+        return processed, sent, queue.get_stats()
+
+    processed, sent, stats = asyncio.run(run())
+    assert processed == ["m0", "m1", "m2"]  # the pipeline records every inbound message
+    assert sent == ["re: m2"]
+    assert stats["superseded"] == 2
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sci_fi_dashboard.gateway.queue import MessageTask, TaskQueue, TaskStatus
+
+
+def _task(task_id: str, is_group: bool = False) -> MessageTask:
+    return MessageTask(task_id=task_id, chat_id=task_id, user_message="hi", is_group=is_group)
+
+
+def test_lowest_priority_sheds_incoming_group_message():
+    """A full queue of DMs should reject an incoming group message, not evict a DM."""
+
+    async def run():
+        q = TaskQueue(config={"max_size": 3, "shed_policy": "lowest_priority"})
+        dms = [_task(f"dm{i}") for i in range(3)]
+        for t in dms:
+            assert await q.enqueue(t)
+        group = _task("g0", is_group=True)
+        accepted = await q.enqueue(group)
+        return q, dms, group, accepted
+
+    q, dms, group, accepted = asyncio.run(run())
+    assert accepted is False
+    assert group.status is TaskStatus.SHED
+    assert all(t.status is TaskStatus.QUEUED for t in dms)
+    assert q.pending_count == 3
+
+
+def test_lowest_priority_evicts_queued_group_for_dm():
+    """An incoming DM should evict the lowest-priority queued group message."""
+
+    async def run():
+        q = TaskQueue(config={"max_size": 2, "shed_policy": "lowest_priority"})
+        g0, g1 = _task("g0", is_group=True), _task("g1", is_group=True)
+        await q.enqueue(g0)
+        await q.enqueue(g1)
+        dm = _task("dm")
+        accepted = await q.enqueue(dm)
+        first = await q.dequeue()
+        return g0, g1, accepted, first
+
+    g0, g1, accepted, first = asyncio.run(run())
+    assert accepted is True
+    assert g1.status is TaskStatus.SHED
+    assert g0.status is TaskStatus.QUEUED
+    assert first.task_id == "dm"
+
+
+def test_oldest_policy_sheds_incoming_when_it_is_oldest():
+    """Under "oldest", a late-delivered task older than everything queued is the one shed."""
+    from datetime import datetime, timedelta
+
+    async def run():
+        q = TaskQueue(config={"max_size": 1, "shed_policy": "oldest"})
+        fresh = _task("fresh")
+        await q.enqueue(fresh)
+        stale = _task("stale")
+        stale.timestamp = datetime.now() - timedelta(minutes=5)
+        return fresh, stale, await q.enqueue(stale)
+
+    fresh, stale, accepted = asyncio.run(run())
+    assert accepted is False
+    assert stale.status is TaskStatus.SHED
+    assert fresh.status is TaskStatus.QUEUED
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__, "-v"])
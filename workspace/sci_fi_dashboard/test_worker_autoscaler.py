@@ -0,0 +1,92 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sci_fi_dashboard.gateway.autoscaler import WorkerAutoscaler
+from sci_fi_dashboard.gateway.queue import MessageTask, TaskQueue
+from sci_fi_dashboard.gateway.worker import MessageWorker
+
+_CONFIG = {
+    "min_workers": 1,
+    "max_workers": 4,
+    "scale_up_backlog": 2,
+    "scale_up_wait_ms": 50,
+    "wait_window_s": 5.0,
+    "scale_down_utilization": 0.3,
+    "cooldown_s": 0.05,
+}
+
+
+class _Channel:
+    async def send(self, chat_id, text):
+        return True
+
+    async def send_typing(self, chat_id):
+        pass
+
+    async def mark_read(self, chat_id, message_id):
+        pass
+
+
+class _Registry:
+    def get(self, channel_id):
+        return _Channel()
+
+
+def test_scales_up_under_backlog_and_down_after_cooldown():
+    """The pool grows while chats wait for a slot and shrinks back once idle."""
+
+    async def run():
+        async def process(msg, chat_id):
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        queue = TaskQueue(config={})
+        worker = MessageWorker(queue, process, num_workers=1, channel_registry=_Registry())
+        scaler = WorkerAutoscaler(worker, config=_CONFIG)
+        await worker.start()
+        for i in range(20):
+            await queue.enqueue(MessageTask(task_id=f"t{i}", chat_id=f"c{i}", user_message="hi"))
+
+        sizes = []
+        while queue.pending_count or worker.actors.get_total_pending_count():
+            await asyncio.sleep(0.02)
+            sizes.append(scaler.step())
+        peak = max(sizes)
+
+        for _ in range(20):
+            await asyncio.sleep(0.06)
+            scaler.step()
+        final = worker.num_workers
+        await worker.stop()
+        return peak, final, scaler.get_stats(), queue.get_stats()
+
+    peak, final, stats, queue_stats = asyncio.run(run())
+    assert peak == _CONFIG["max_workers"]
+    assert final == _CONFIG["min_workers"]
+    assert stats["scale_ups"] >= 3 and stats["scale_downs"] >= 3
+    assert queue_stats["completed"] == 20
+
+
+def test_does_not_scale_up_when_llm_saturated():
+    """More slots would only queue at the provider once max_llm_in_flight is reached."""
+
+    async def run():
+        queue = TaskQueue(config={})
+        worker = MessageWorker(queue, lambda msg, chat_id: None, num_workers=1)
+        scaler = WorkerAutoscaler(
+            worker, llm_in_flight=lambda: 16, config={**_CONFIG, "max_llm_in_flight": 16}
+        )
+        for i in range(10):
+            await queue.enqueue(MessageTask(task_id=f"t{i}", chat_id=f"c{i}", user_message="hi"))
+        return scaler.step()
+
+    assert asyncio.run(run()) == 1
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__, "-v"])
@@ -35,6 +35,7 @@ class ToolContext:
     workspace_dir: str
     config: dict
     channel_id: str | None = None
+    embedding_context: Any = None  # per-message MessageEmbeddingContext, if any
 
 
 @dataclass
@@ -207,12 +208,13 @@ def _web_search_factory(_ctx: ToolContext) -> SynapseTool:
 def _query_memory_factory(memory_engine: Any) -> ToolFactory:
     """Return a factory that captures a MemoryEngine reference."""
 
-    def _factory(_ctx: ToolContext) -> SynapseTool:
+    def _factory(ctx: ToolContext) -> SynapseTool:
         async def _execute(arguments: dict) -> ToolResult:
             try:
-                result = memory_engine.query(
+                result = await memory_engine.aquery(
                     text=arguments["query"],
                     limit=arguments.get("limit", 5),
+                    embedding_context=ctx.embedding_context,
                 )
                 return json_result(result)
             except Exception as e:
@@ -321,7 +323,7 @@ def register_builtin_tools(
     registry : ToolRegistry
         The registry to populate.
     memory_engine : MemoryEngine
-        A live MemoryEngine instance whose ``.query()`` method will be called.
+        A live MemoryEngine instance whose ``.aquery()`` method will be called.
     project_root : str
         Workspace root path (unused currently, reserved for future factories).
     """
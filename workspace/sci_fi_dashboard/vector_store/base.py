@@ -12,9 +12,12 @@ class VectorStore(ABC):
     """Minimal interface required by MemoryEngine."""
 
     @abstractmethod
-    def upsert_facts(self, facts: list[dict]) -> None:
+    def upsert_facts(self, facts: list[dict], *, defer_index: bool = False) -> None:
         """Insert or update a batch of facts.
 
+        Bulk loaders pass ``defer_index=True`` on every chunk and call
+        :meth:`ensure_index` once at the end instead of after each chunk.
+
         Each fact dict has the shape:
             {
                 "id": int,
@@ -31,6 +34,9 @@ class VectorStore(ABC):
             }
         """
 
+    def ensure_index(self) -> None:  # noqa: B027 — optional hook, no-op by default
+        """Bring ANN / scalar / FTS indexes up to date with the stored rows."""
+
     @abstractmethod
     def search(
         self,
@@ -48,6 +54,22 @@ class VectorStore(ABC):
         query_filter is a SQL-like WHERE clause string (LanceDB syntax).
         """
 
+    def hybrid_search(
+        self,
+        query_vector: list[float],
+        query_text: str,
+        limit: int = 10,
+        query_filter: str | None = None,
+        score_threshold: float = 0.0,
+    ) -> list[dict]:
+        """Full-text + ANN search fused into one ranking (same result format as search()).
+
+        Results are ordered by fused rank; ``score`` keeps its search()
+        meaning.  Backends may add ``rrf_score`` and ``match`` ("vector",
+        "text" or "both").  The default implementation is plain ANN search.
+        """
+        return self.search(query_vector, limit, query_filter, score_threshold)
+
     @abstractmethod
     def close(self) -> None:
         """Release any resources held by the store."""
@@ -0,0 +1,247 @@
+"""
+index_manager.py — Staleness-driven index maintenance for LanceDBVectorStore.
+
+Rebuilding IVF_PQ + FTS after every upsert retrains the whole index for a
+single new row.  LanceIndexManager instead counts rows written since the last
+full build and picks the cheapest action that keeps search fresh:
+
+- No index yet and the table has reached ``threshold`` rows → full build.
+- Unindexed rows exceed ``rebuild_ratio`` of the indexed rows → full rebuild
+  (IVF centroids / PQ codebooks retrained on the current distribution).
+- Otherwise every ``optimize_every`` rows → ``table.optimize()``, which
+  compacts fragments and folds new rows into the existing indexes
+  incrementally.
+
+All maintenance runs on a single background thread, so writers never wait
+for it; requests that arrive while a job is running coalesce into at most one
+follow-up job.  Configure via::
+
+    {"vector_store": {"lancedb": {"index": {
+        "threshold": 256, "rebuild_ratio": 0.2, "optimize_every": 64}}}}
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_THRESHOLD = 256  # rows required before building IVF_PQ (brute force wins below)
+DEFAULT_REBUILD_RATIO = 0.2
+DEFAULT_OPTIMIZE_EVERY = 64
+_RETRY_BACKOFF_S = 60.0
+
+
+class LanceIndexManager:
+    """Tracks index staleness for one LanceDB table and schedules maintenance."""
+
+    def __init__(
+        self,
+        table,
+        threshold: int = DEFAULT_INDEX_THRESHOLD,
+        rebuild_ratio: float = DEFAULT_REBUILD_RATIO,
+        optimize_every: int = DEFAULT_OPTIMIZE_EVERY,
+    ) -> None:
+        self.table = table
+        self._threshold = max(1, int(threshold))
+        self._rebuild_ratio = max(0.0, float(rebuild_ratio))
+        self._optimize_every = max(1, int(optimize_every))
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lancedb-index")
+        self._running: Future | None = None
+        self._queued: str | None = None  # "build" | "optimize" waiting behind _running
+
+        self._indexed_rows = 0  # rows covered by the last full build
+        self._unindexed_rows = 0  # rows written since (updates count too)
+        self._since_optimize = 0
+        self._has_index = False
+
+        self._builds = 0
+        self._optimizes = 0
+        self._last_build_at: float | None = None
+        self._last_build_s = 0.0
+        self._last_optimize_at: float | None = None
+        self._last_error: str | None = None
+        self._retry_after = 0.0  # monotonic; back off after a failed job
+
+        self._load_existing_state()
+
+    def _load_existing_state(self) -> None:
+        """Seed counters from an index that survived a restart."""
+        try:
+            indices = self.table.list_indices()
+            vector_index = next((i for i in indices if "vector" in _index_columns(i)), None)
+            if vector_index is None:
+                self._unindexed_rows = self.table.count_rows()
+                return
+        except Exception:
+            return
+        self._has_index = True
+        try:
+            stats = self.table.index_stats(_index_name(vector_index))
+            self._indexed_rows = int(getattr(stats, "num_indexed_rows", 0) or 0)
+            self._unindexed_rows = int(getattr(stats, "num_unindexed_rows", 0) or 0)
+        except Exception:
+            self._indexed_rows = self.table.count_rows()
+
+    # -- Scheduling --
+
+    def record_write(self, n_rows: int, *, schedule: bool = True) -> None:
+        """Account for *n_rows* upserted rows and schedule maintenance if due."""
+        with self._lock:
+            self._unindexed_rows += n_rows
+            self._since_optimize += n_rows
+        if schedule:
+            self.maybe_maintain()
+
+    def _due(self) -> str | None:
+        if time.monotonic() < self._retry_after:
+            return None
+        if not self._has_index:
+            if self._indexed_rows + self._unindexed_rows >= self._threshold:
+                return "build"
+            return None
+        if self._unindexed_rows > self._rebuild_ratio * max(self._indexed_rows, 1):
+            return "build"
+        if self._since_optimize >= self._optimize_every:
+            return "optimize"
+        return None
+
+    def maybe_maintain(self, wait: bool = False) -> None:
+        """Run whatever maintenance is due in the background (or inline if *wait*)."""
+        with self._lock:
+            running = self._running is not None and not self._running.done()
+            if not running:
+                self._queued = None
+            action = self._due()
+            if action is None:
+                future = self._running if running else None
+            elif running:
+                # Coalesce: a full build supersedes a queued optimize
+                if self._queued != "build":
+                    self._queued = action
+                future = self._running
+            else:
+                future = self._running = self._executor.submit(self._run, action)
+            follow_up = running
+        if wait and future is not None:
+            future.result()
+            if follow_up:
+                # We waited on someone else's job -- make sure ours ran too
+                self.maybe_maintain(wait=True)
+
+    def _run(self, action: str) -> None:
+        while action is not None:
+            if action == "build":
+                self._full_build()
+            else:
+                self._optimize()
+            with self._lock:
+                action, self._queued = self._queued, None
+                if action is not None and self._due() is None:
+                    action = None
+
+    # -- Jobs (executor thread only) --
+
+    def _full_build(self) -> None:
+        start = time.perf_counter()
+        with self._lock:
+            pending_at_start = self._unindexed_rows
+        try:
+            num_rows = self.table.count_rows()
+            if num_rows < self._threshold:
+                return
+            num_partitions = max(1, num_rows // 4096)
+            self.table.create_index(
+                metric="cosine",
+                num_partitions=num_partitions,
+                replace=True,
+            )
+            self.table.create_scalar_index("hemisphere_tag", replace=True)
+            self.table.create_fts_index("text", replace=True)
+        except Exception as e:
+            self._last_error = str(e)
+            self._retry_after = time.monotonic() + _RETRY_BACKOFF_S
+            logger.warning("[WARN] LanceDB index creation failed (non-fatal): %s", e)
+            return
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._has_index = True
+            self._indexed_rows = num_rows
+            # Rows written while the build ran are not covered by it
+            self._unindexed_rows = max(0, self._unindexed_rows - pending_at_start)
+            self._since_optimize = self._unindexed_rows
+            self._builds += 1
+            self._last_build_at = time.time()
+            self._last_build_s = elapsed
+            self._last_error = None
+        logger.info(
+            "[LanceDB] Rebuilt indexes over %d rows in %.2fs (%d partitions)",
+            num_rows,
+            elapsed,
+            num_partitions,
+        )
+
+    def _optimize(self) -> None:
+        with self._lock:
+            pending_at_start = self._since_optimize
+        try:
+            self.table.optimize()
+        except Exception as e:
+            self._last_error = str(e)
+            self._retry_after = time.monotonic() + _RETRY_BACKOFF_S
+            logger.warning("[WARN] LanceDB optimize failed (non-fatal): %s", e)
+            return
+        with self._lock:
+            self._since_optimize = max(0, self._since_optimize - pending_at_start)
+            self._optimizes += 1
+            self._last_optimize_at = time.time()
+
+    # -- Metrics --
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            staleness = self._unindexed_rows / max(self._indexed_rows, 1)
+            return {
+                "has_index": self._has_index,
+                "indexed_rows": self._indexed_rows,
+                "unindexed_rows": self._unindexed_rows,
+                "staleness_ratio": round(staleness, 3),
+                "rebuild_ratio": self._rebuild_ratio,
+                "rows_since_optimize": self._since_optimize,
+                "builds": self._builds,
+                "optimizes": self._optimizes,
+                "last_build_s": round(self._last_build_s, 3),
+                "seconds_since_build": (
+                    round(time.time() - self._last_build_at, 1) if self._last_build_at else None
+                ),
+                "seconds_since_optimize": (
+                    round(time.time() - self._last_optimize_at, 1)
+                    if self._last_optimize_at
+                    else None
+                ),
+                "maintenance_running": self._running is not None and not self._running.done(),
+                "last_error": self._last_error,
+            }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+def _index_columns(index) -> list[str]:
+    cols = getattr(index, "columns", None)
+    if cols is None and isinstance(index, dict):
+        cols = index.get("columns", [])
+    return list(cols or [])
+
+
+def _index_name(index) -> str:
+    name = getattr(index, "name", None)
+    if name is None and isinstance(index, dict):
+        name = index.get("name", "")
+    return name or "vector_idx"
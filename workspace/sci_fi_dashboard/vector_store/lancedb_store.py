@@ -7,23 +7,37 @@ Zero Docker dependency — data lives at ~/.synapse/workspace/db/lancedb/.
 Design notes:
 - External embeddings: receives pre-computed float[768] vectors from MemoryEngine.
 - Idempotent upsert via merge_insert on "id" column.
-- IVF_PQ index deferred until >= 256 rows (brute-force is faster below that).
+- IVF_PQ index deferred until >= 256 rows (brute-force is faster below that),
+  then maintained incrementally by LanceIndexManager (see index_manager.py).
 - Score conversion: LanceDB returns cosine distance (0=identical),
   converted to similarity score (1=identical).
 - prefilter=True on hemisphere filter cuts search space ~50% before ANN.
+- hybrid_search() adds a full-text query on the FTS index over ``text`` and
+  fuses both rankings with reciprocal-rank fusion (RRF): each hit scores
+  ``sum(weight / (rrf_k + rank))`` over the lists it appears in.  Configure
+  via synapse.json → ``vector_store.lancedb.hybrid``.
 """
 
 import logging
+import re
+import threading
 from pathlib import Path
 
+import numpy as np
 import pyarrow as pa
 
 from sci_fi_dashboard.vector_store.base import VectorStore
+from sci_fi_dashboard.vector_store.index_manager import LanceIndexManager
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_TABLE = "memories"
-_INDEX_THRESHOLD = 256  # rows required before building IVF_PQ index
+_DEFAULT_HYBRID = {
+    "enabled": True,
+    "rrf_k": 60,  # damping: larger k flattens the gap between adjacent ranks
+    "vector_weight": 1.0,
+    "text_weight": 1.0,
+}
 
 
 def _default_db_path() -> Path:
@@ -36,6 +50,26 @@ def _default_db_path() -> Path:
         return Path.home() / ".synapse" / "workspace" / "db" / "lancedb"
 
 
+def _default_index_config() -> dict:
+    """Return synapse.json → vector_store.lancedb.index ({} if unset)."""
+    try:
+        from synapse_config import SynapseConfig
+
+        return SynapseConfig.load().vector_store.get("lancedb", {}).get("index", {}) or {}
+    except Exception:
+        return {}
+
+
+def _default_hybrid_config() -> dict:
+    """Return synapse.json → vector_store.lancedb.hybrid ({} if unset)."""
+    try:
+        from synapse_config import SynapseConfig
+
+        return SynapseConfig.load().vector_store.get("lancedb", {}).get("hybrid", {}) or {}
+    except Exception:
+        return {}
+
+
 def _build_schema(embedding_dimensions: int) -> pa.Schema:
     return pa.schema(
         [
@@ -60,6 +94,8 @@ class LanceDBVectorStore(VectorStore):
         db_path: str | Path | None = None,
         table_name: str = _DEFAULT_TABLE,
         embedding_dimensions: int = 768,
+        index_config: dict | None = None,
+        hybrid_config: dict | None = None,
     ) -> None:
         import lancedb
 
@@ -72,6 +108,15 @@ class LanceDBVectorStore(VectorStore):
 
         self._db = lancedb.connect(str(resolved_path))
         self.table = self._open_or_create_table()
+        cfg = _default_index_config() if index_config is None else index_config
+        self.index_manager = LanceIndexManager(
+            self.table,
+            **{k: cfg[k] for k in ("threshold", "rebuild_ratio", "optimize_every") if k in cfg},
+        )
+        hybrid = _default_hybrid_config() if hybrid_config is None else hybrid_config
+        self.hybrid_config = {**_DEFAULT_HYBRID, **hybrid}
+        self._hybrid_stats = {"queries": 0, "text_hits": 0, "fused_hits": 0, "fallbacks": 0}
+        self._hybrid_lock = threading.Lock()
         logger.info("[OK] LanceDBVectorStore connected at %s (table=%s)", resolved_path, table_name)
 
     def _open_or_create_table(self):
@@ -81,29 +126,21 @@ class LanceDBVectorStore(VectorStore):
             return self._db.open_table(self._table_name)
         return self._db.create_table(self._table_name, schema=self._schema)
 
-    def _ensure_index(self) -> None:
-        """Build IVF_PQ + scalar + FTS indexes once enough rows exist.
+    def ensure_index(self, wait: bool = False) -> None:
+        """Run any due index maintenance (full build or incremental optimize).
 
-        Called lazily after upserts. Safe to call repeatedly — LanceDB skips
-        if index already up-to-date.
+        Scheduled on the index manager's background thread; pass ``wait=True``
+        to block until it finishes (migration scripts).  Safe to call repeatedly.
         """
-        try:
-            num_rows = self.table.count_rows()
-            if num_rows < _INDEX_THRESHOLD:
-                return
-
-            num_partitions = max(1, num_rows // 4096)
-            self.table.create_index(
-                metric="cosine",
-                num_partitions=num_partitions,
-                replace=True,
-            )
-            self.table.create_scalar_index("hemisphere_tag")
-            self.table.create_fts_index("text", replace=True)
-        except Exception as e:
-            logger.warning("[WARN] LanceDB index creation failed (non-fatal): %s", e)
+        self.index_manager.maybe_maintain(wait=wait)
+
+    def get_index_stats(self) -> dict:
+        """Index staleness / maintenance counters (see LanceIndexManager) + hybrid search."""
+        with self._hybrid_lock:
+            hybrid = {"enabled": bool(self.hybrid_config["enabled"]), **self._hybrid_stats}
+        return {**self.index_manager.get_stats(), "hybrid": hybrid}
 
-    def upsert_facts(self, facts: list[dict]) -> None:
+    def upsert_facts(self, facts: list[dict], *, defer_index: bool = False) -> None:
         """Idempotent batch upsert. Same id overwrites, never duplicates."""
         if not facts:
             return
@@ -131,7 +168,7 @@ class LanceDBVectorStore(VectorStore):
             .when_not_matched_insert_all()
             .execute(rows)
         )
-        self._ensure_index()
+        self.index_manager.record_write(len(rows), schedule=not defer_index)
 
     def search(
         self,
@@ -160,22 +197,106 @@ class LanceDBVectorStore(VectorStore):
             score = 1.0 - float(r.get("_distance", 1.0))
             if score < score_threshold:
                 continue
-            output.append(
-                {
-                    "id": r["id"],
-                    "score": score,
-                    "metadata": {
-                        "text": r.get("text", ""),
-                        "hemisphere_tag": r.get("hemisphere_tag", "safe"),
-                        "unix_timestamp": r.get("unix_timestamp", 0),
-                        "importance": r.get("importance", 5),
-                        "source_id": r.get("source_id", 0),
-                        "entity": r.get("entity", ""),
-                        "category": r.get("category", ""),
-                    },
-                }
-            )
+            output.append(_to_result(r, score))
         return output
 
+    def _text_search(self, query_text: str, limit: int, query_filter: str | None) -> list[dict]:
+        """BM25 query against the FTS index on ``text`` (raises if it doesn't exist yet)."""
+        # Plain terms only -- query-syntax characters would raise in the FTS parser
+        terms = re.sub(r"[^\w\s]", " ", query_text).split()
+        if not terms:
+            return []
+        searcher = self.table.search(" ".join(terms), query_type="fts").limit(limit)
+        if query_filter:
+            searcher = searcher.where(query_filter, prefilter=True)
+        return searcher.to_list()
+
+    def hybrid_search(
+        self,
+        query_vector: list[float],
+        query_text: str,
+        limit: int = 10,
+        query_filter: str | None = None,
+        score_threshold: float = 0.0,
+    ) -> list[dict]:
+        """ANN + full-text search fused with reciprocal-rank fusion.
+
+        Both queries keep the hemisphere prefilter.  Results are ordered by
+        ``rrf_score``; ``score`` stays the cosine similarity (computed from the
+        stored vector for text-only hits) so MemoryEngine's scoring and
+        thresholds are unchanged.  ``match`` tells which retrievers found the
+        row.  Falls back to plain search() when disabled, when the text has no
+        terms, or before the FTS index exists (it is built with the ANN index
+        once the table reaches ``index.threshold`` rows).
+        """
+        cfg = self.hybrid_config
+        if not cfg["enabled"] or not (query_text or "").strip():
+            return self.search(query_vector, limit, query_filter, score_threshold)
+
+        vector_hits = self.search(query_vector, limit, query_filter, score_threshold)
+        try:
+            text_rows = self._text_search(query_text, limit, query_filter)
+        except Exception as e:
+            logger.debug("LanceDB full-text search unavailable: %s", e)
+            with self._hybrid_lock:
+                self._hybrid_stats["fallbacks"] += 1
+            return vector_hits
+
+        k = float(cfg["rrf_k"])
+        vector_weight = float(cfg["vector_weight"])
+        text_weight = float(cfg["text_weight"])
+
+        fused: dict[int, dict] = {}
+        for rank, hit in enumerate(vector_hits, start=1):
+            hit["rrf_score"] = vector_weight / (k + rank)
+            hit["match"] = "vector"
+            fused[hit["id"]] = hit
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query)) or 1.0
+        both = 0
+        for rank, row in enumerate(text_rows, start=1):
+            hit = fused.get(row["id"])
+            if hit is None:
+                vector = np.asarray(row.get("vector") or (), dtype=np.float32)
+                score = (
+                    float(vector @ query) / ((float(np.linalg.norm(vector)) or 1.0) * query_norm)
+                    if vector.shape == query.shape
+                    else 0.0
+                )
+                if score < score_threshold:
+                    continue
+                hit = fused[row["id"]] = _to_result(row, score)
+                hit["rrf_score"] = 0.0
+                hit["match"] = "text"
+            else:
+                hit["match"] = "both"
+                both += 1
+            hit["rrf_score"] += text_weight / (k + rank)
+
+        with self._hybrid_lock:
+            self._hybrid_stats["queries"] += 1
+            self._hybrid_stats["text_hits"] += len(text_rows)
+            self._hybrid_stats["fused_hits"] += both
+        return sorted(fused.values(), key=lambda h: h["rrf_score"], reverse=True)[:limit]
+
     def close(self) -> None:
-        """No-op — LanceDB is embedded and manages its own lifecycle."""
+        """Stop the index maintenance thread. LanceDB itself needs no teardown."""
+        self.index_manager.close()
+
+
+def _to_result(row: dict, score: float) -> dict:
+    """LanceDB row -> MemoryEngine result dict."""
+    return {
+        "id": row["id"],
+        "score": score,
+        "metadata": {
+            "text": row.get("text", ""),
+            "hemisphere_tag": row.get("hemisphere_tag", "safe"),
+            "unix_timestamp": row.get("unix_timestamp", 0),
+            "importance": row.get("importance", 5),
+            "source_id": row.get("source_id", 0),
+            "entity": row.get("entity", ""),
+            "category": row.get("category", ""),
+        },
+    }
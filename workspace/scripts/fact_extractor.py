@@ -23,7 +23,7 @@ if _sys_path not in sys.path:
 
 from sci_fi_dashboard.conv_kg_extractor import (  # noqa: E402
     ConvKGExtractor,
-    _get_last_kg_timestamp,
+    _get_kg_watermark,
     fetch_messages_since,
     run_batch_extraction,
 )
@@ -62,11 +62,13 @@ async def _run_extraction(
 
         if dry_run:
             # Dry-run: extract only, print results, skip writes
-            last_ts = _get_last_kg_timestamp(sbs_data_dir)
+            last_ts, last_msg_id = _get_kg_watermark(sbs_data_dir)
             db_path = os.path.join(sbs_data_dir, "indices", "messages.db")
 
             try:
-                msgs = await fetch_messages_since(db_path, last_ts, limit=limit)
+                msgs = await fetch_messages_since(
+                    db_path, last_ts, limit=limit, since_msg_id=last_msg_id
+                )
             except Exception as e:
                 print(f"[{persona_id}] Could not read messages: {e}")
                 continue
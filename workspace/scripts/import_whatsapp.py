@@ -115,28 +115,24 @@ def chunk_messages(messages: list[dict], chunk_size: int = CHUNK_SIZE) -> list[s
 
 
 def ingest_chunks(chunks: list[str], hemisphere: str, dry_run: bool) -> int:
-    """Insert chunks into Synapse documents table."""
+    """Embed and store chunks via MemoryEngine.add_memories (one bulk write)."""
     if dry_run:
         print(f"  [dry] Would insert {len(chunks)} chunks (hemisphere={hemisphere})")
         return 0
 
-    from sci_fi_dashboard.db import DatabaseManager
-
-    conn = DatabaseManager.get_connection()
-    inserted = 0
-    for chunk in chunks:
-        try:
-            conn.execute(
-                "INSERT INTO documents (filename, content, hemisphere_tag, processed) "
-                "VALUES (?,?,?,0)",
-                ("whatsapp_import", chunk, hemisphere),
-            )
-            inserted += 1
-        except Exception as e:
-            print(f"  [warn] Insert failed: {e}")
-    conn.commit()
-    conn.close()
-    return inserted
+    from sci_fi_dashboard.memory_engine import MemoryEngine
+
+    engine = MemoryEngine()
+    result = engine.add_memories(chunks, category="whatsapp_import", hemisphere=hemisphere)
+    if "error" in result:
+        print(f"  [warn] Import failed: {result['error']}")
+        return 0
+    if result["embedded"] < result["stored"]:
+        print(
+            f"  [warn] {result['stored'] - result['embedded']} chunks stored without embeddings"
+            " (processed=0)"
+        )
+    return result["stored"]
 
 
 def main():
@@ -204,9 +200,8 @@ def main():
     else:
         inserted = ingest_chunks(chunks, args.hemisphere, dry_run=False)
         print(f"\n[OK] Inserted {inserted} chunks into memory")
-        print("\nNext steps:")
-        print("  1. Re-embed into LanceDB: python scripts/re_embed_lancedb.py")
-        print("  2. Test retrieval: curl -X POST http://localhost:8000/chat/the_creator ...")
+        print("\nNext step:")
+        print("  Test retrieval: curl -X POST http://localhost:8000/chat/the_creator ...")
 
 
 if __name__ == "__main__":
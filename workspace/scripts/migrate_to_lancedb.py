@@ -10,7 +10,7 @@ What it does:
 2. Reads vec_items (document embeddings) joined to documents.
 3. Reads atomic_facts_vec (fact embeddings) joined to atomic_facts.
 4. Batch-upserts everything to LanceDB (1000 rows/batch).
-5. Triggers _ensure_index() after migration.
+5. Triggers ensure_index() once after migration.
 6. Verifies row counts SQLite vs LanceDB.
 
 Safe to re-run: merge_insert on "id" is idempotent.
@@ -103,14 +103,14 @@ def migrate_documents(conn, store: LanceDBVectorStore, dry_run: bool) -> int:
 
         if len(facts) >= BATCH_SIZE:
             if not dry_run:
-                store.upsert_facts(facts)
+                store.upsert_facts(facts, defer_index=True)
             migrated += len(facts)
             print(f"    ... upserted {migrated} rows")
             facts = []
 
     if facts:
         if not dry_run:
-            store.upsert_facts(facts)
+            store.upsert_facts(facts, defer_index=True)
         migrated += len(facts)
 
     print(f"  [documents] Migrated {migrated} rows {'(dry-run)' if dry_run else ''}")
@@ -186,14 +186,14 @@ def migrate_atomic_facts(conn, store: LanceDBVectorStore, dry_run: bool) -> int:
 
         if len(facts) >= BATCH_SIZE:
             if not dry_run:
-                store.upsert_facts(facts)
+                store.upsert_facts(facts, defer_index=True)
             migrated += len(facts)
             print(f"    ... upserted {migrated} rows")
             facts = []
 
     if facts:
         if not dry_run:
-            store.upsert_facts(facts)
+            store.upsert_facts(facts, defer_index=True)
         migrated += len(facts)
 
     print(f"  [atomic_facts] Migrated {migrated} rows {'(dry-run)' if dry_run else ''}")
@@ -252,7 +252,7 @@ def main() -> None:
 
     if not args.dry_run:
         print("\n[INDEX] Building LanceDB indexes...")
-        store._ensure_index()
+        store.ensure_index(wait=True)
 
     verify(conn, store)
     conn.close()
@@ -350,11 +350,7 @@ def seed_graph(graph, dry_run: bool = False) -> tuple[int, int]:
         print(f"[DRY RUN] Would seed {len(DUMMY_NODES)} nodes, {len(DUMMY_EDGES)} edges")
         return len(DUMMY_NODES), len(DUMMY_EDGES)
 
-    for name, node_type, props in DUMMY_NODES:
-        graph.add_node(name, node_type=node_type, **props)
-
-    for source, target, relation, weight, evidence in DUMMY_EDGES:
-        graph.add_edge(source, target, relation=relation, weight=weight, evidence=evidence)
+    graph.bulk_upsert(nodes=DUMMY_NODES, edges=DUMMY_EDGES)
 
     return len(DUMMY_NODES), len(DUMMY_EDGES)
 
@@ -393,13 +389,16 @@ def wipe_seed_data(graph) -> None:
     """Remove Alex Chen node and all connected edges from graph (for --force re-seed)."""
     conn = graph._conn()
     conn.execute("DELETE FROM edges WHERE source = 'Alex Chen' OR target = 'Alex Chen'")
+    conn.execute("DELETE FROM edge_evidence WHERE source = 'Alex Chen' OR target = 'Alex Chen'")
     conn.execute("DELETE FROM nodes WHERE name = 'Alex Chen'")
     # Also wipe other seeded nodes not connected back
     seeded_names = [n for n, _, _ in DUMMY_NODES]
     placeholders = ",".join("?" * len(seeded_names))
     conn.execute(f"DELETE FROM edges WHERE source IN ({placeholders})", seeded_names)
+    conn.execute(f"DELETE FROM edge_evidence WHERE source IN ({placeholders})", seeded_names)
     conn.execute(f"DELETE FROM nodes WHERE name IN ({placeholders})", seeded_names)
     conn.commit()
+    graph.invalidate_cache()
     print("[OK] Wiped previous Alex Chen seed data from graph")
 
 
@@ -68,12 +68,28 @@ class KGExtractionConfig:
         kg_role:                  LLM role used for KG extraction calls.
                                   Defaults to ``"kg"``; falls back to ``"casual"``
                                   at runtime if not present in model_mappings.
+        chunk_concurrency:        Max chunk LLM calls in flight per extraction.
+        provider_rpm:             Requests-per-minute budget per provider prefix
+                                  (e.g. ``{"gemini": 15}``), shared by every
+                                  extraction in the process.  Unlisted = unlimited.
+        llm_concurrency:          Max KG LLM calls in flight process-wide,
+                                  across all personas and chunks.
+        persona_concurrency:      Personas extracted in parallel per cycle.
+        page_size:                Messages per extraction batch (one watermark step).
+        max_pages_per_run:        Pages drained per persona per cycle before
+                                  yielding to the next cycle.
     """
 
     enabled: bool = True
     min_messages: int = 15
     extract_interval_seconds: int = 1200
     kg_role: str = "kg"
+    chunk_concurrency: int = 4
+    provider_rpm: dict = field(default_factory=dict)
+    llm_concurrency: int = 4
+    persona_concurrency: int = 2
+    page_size: int = 200
+    max_pages_per_run: int = 10
 
 
 @dataclass(frozen=True)
@@ -103,6 +119,7 @@ class SynapseConfig:
     validated_schema: Any = field(default=None, repr=False)
     embedding: dict = field(default_factory=dict)
     vector_store: dict = field(default_factory=dict)
+    memory: dict = field(default_factory=dict)
     kg_extraction: KGExtractionConfig = field(default_factory=KGExtractionConfig)
     image_gen: dict = field(default_factory=dict)
     tts: dict = field(default_factory=dict)
@@ -136,6 +153,7 @@ class SynapseConfig:
         sbs_raw: dict[str, Any] = {}
         embedding: dict[str, Any] = {}
         vector_store: dict[str, Any] = {}
+        memory: dict[str, Any] = {}
         kg_extraction_raw: dict[str, Any] = {}
         image_gen: dict[str, Any] = {}
         tts_raw: dict[str, Any] = {}
@@ -160,6 +178,7 @@ class SynapseConfig:
             sbs_raw = raw.get("sbs", {})
             embedding = raw.get("embedding", {})
             vector_store = raw.get("vector_store", {})
+            memory = raw.get("memory", {})
             kg_extraction_raw = raw.get("kg_extraction", {})
             image_gen = raw.get("image_gen", {})
             tts_raw = raw.get("tts", {})
@@ -193,6 +212,7 @@ class SynapseConfig:
             validated_schema=validated,
             embedding=embedding,
             vector_store=vector_store,
+            memory=memory,
             kg_extraction=kg_config,
             image_gen=image_gen,
             tts=tts_raw,